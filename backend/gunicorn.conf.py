@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration of the production image.
+
+By default, sync workers serve todo.wsgi, one request per worker at a time, or
+BACKEND_THREADS requests per worker with threaded workers. With BACKEND_ASGI=1,
+uvicorn workers serve todo.asgi instead. Each worker then runs an event loop, and
+the asynchronous task views (see TASKS_ASYNC_VIEWS) handle many slow clients
+concurrently, without a thread per request.
+
+The write buffer (BACKEND_TASKS_WRITE_BUFFER=1) batches the creates served at the
+same time by one worker, so it needs threaded or uvicorn workers and is disabled
+with sync workers.
+
+    BACKEND_ASGI=1 BACKEND_WORKERS=4 gunicorn --config gunicorn.conf.py
+    BACKEND_THREADS=8 BACKEND_TASKS_WRITE_BUFFER=1 gunicorn --config gunicorn.conf.py
+"""
+
+import os
+
+ASGI = os.getenv("BACKEND_ASGI") == "1"
+
+wsgi_app = "todo.asgi:application" if ASGI else "todo.wsgi:application"
+threads = int(os.getenv("BACKEND_THREADS", "1"))
+worker_class = "uvicorn_worker.UvicornWorker" if ASGI else "gthread" if threads > 1 else "sync"
+workers = int(os.getenv("BACKEND_WORKERS", "1"))
+bind = os.getenv("BACKEND_BIND", "0.0.0.0:8000")
+keepalive = int(os.getenv("BACKEND_KEEPALIVE", "5"))
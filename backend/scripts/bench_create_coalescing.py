@@ -0,0 +1,78 @@
+"""
+Compare concurrent task creation through TaskService one transaction per create,
+and through its opt-in write buffer, which commits the creates of concurrent
+requests together.
+
+On SQLite the threads share one file-backed database (--sqlite-file is implied),
+where every transaction commit waits for its own fsync.
+"""
+
+import time
+import threading
+from typing import Any, Dict, List
+
+from bench_utils import parse_args, setup_django, test_database, task_rows
+
+
+def run_workers(service: Any, rows: List[Dict[str, Any]], threads: int) -> Dict[str, float]:
+    """
+    Create the rows from threads workers, returning the elapsed time and the failures.
+    """
+    from django.db import connection
+    from tasks.models import Task
+
+    failures: List[int] = []
+    lock = threading.Lock()
+
+    def worker(chunk: List[Dict[str, Any]]) -> None:
+        failed = 0
+        for row in chunk:
+            try:
+                service.create(Task(), dict(row))
+            except Exception:
+                failed += 1
+        connection.close()
+        with lock:
+            failures.append(failed)
+
+    workers = [threading.Thread(target=worker, args=(rows[n::threads],)) for n in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return {"elapsed": elapsed * 1000, "failed": sum(failures), "rate": (len(rows) - sum(failures)) / elapsed}
+
+
+def main() -> None:
+    args = parse_args(__doc__, rows=4000)
+    if not args.postgres:
+        args.sqlite_file = True
+    setup_django(args)
+
+    from django.db import connection
+    from tasks.coalescing import WriteBuffer
+    from tasks.models import Task
+    from tasks.services import TaskService
+
+    services = {
+        "one transaction per create": TaskService(),
+        "write buffer, 2 ms window": TaskService(write_buffer=WriteBuffer(window_ms=2, max_batch=args.threads)),
+        "write buffer, 10 ms window": TaskService(write_buffer=WriteBuffer(window_ms=10, max_batch=args.threads)),
+    }
+
+    with test_database():
+        rows = task_rows(args.rows)
+        print(f"{connection.vendor}, {args.rows} creates per service, {args.threads} threads\n")
+        for name, service in services.items():
+            Task.objects.all().delete()
+            connection.close()
+            result = run_workers(service, rows, args.threads)
+            print(f"--- {name}: {result['elapsed']:.0f} ms, {result['rate']:.0f} creates/s, {result['failed']} failed")
+            if service.get_stats():
+                print("   ", service.get_stats()["write_buffer"])
+
+
+if __name__ == "__main__":
+    main()
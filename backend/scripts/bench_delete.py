@@ -0,0 +1,80 @@
+"""
+Compare the throughput of the previous delete path (a get followed by an instance
+delete in one transaction) with the single-statement Task.custom_delete, with
+several threads deleting concurrently.
+
+On SQLite the threads share one file-backed database (--sqlite-file is implied):
+the previous path holds a read lock while it looks the task up and must then
+upgrade it to a write lock, which makes concurrent writers fail with "database is
+locked" instead of queueing behind each other.
+"""
+
+import time
+import threading
+from typing import Any, Callable, Dict, List
+
+from bench_utils import parse_args, setup_django, test_database, populate
+
+
+def run_workers(ids: List[Any], threads: int, delete: Callable[[Any], None]) -> Dict[str, float]:
+    """
+    Delete the ids from threads workers, returning the elapsed time and the failures.
+    """
+    from django.db import connection
+
+    failures: List[int] = []
+    lock = threading.Lock()
+
+    def worker(chunk: List[Any]) -> None:
+        failed = 0
+        for id in chunk:
+            try:
+                delete(id)
+            except Exception:
+                failed += 1
+        connection.close()
+        with lock:
+            failures.append(failed)
+
+    workers = [threading.Thread(target=worker, args=(ids[n::threads],)) for n in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return {"elapsed": elapsed * 1000, "failed": sum(failures), "rate": (len(ids) - sum(failures)) / elapsed}
+
+
+def main() -> None:
+    args = parse_args(__doc__, rows=4000)
+    if not args.postgres:
+        args.sqlite_file = True
+    setup_django(args)
+
+    from django.db import connection, transaction
+    from tasks.models import Task
+
+    def get_then_delete(id: Any) -> None:
+        with transaction.atomic():
+            task = Task.objects.get(pk=id)
+            task.delete()
+
+    paths = {
+        "get + instance delete": get_then_delete,
+        "single DELETE (custom_delete)": Task().custom_delete,
+    }
+
+    with test_database():
+        print(f"{connection.vendor}, {args.rows} deletes per path, {args.threads} threads\n")
+        for name, delete in paths.items():
+            Task.objects.all().delete()
+            populate(args.rows)
+            ids = list(Task.objects.values_list("task_id", flat=True))
+            connection.close()
+            result = run_workers(ids, args.threads, delete)
+            print(f"--- {name}: {result['elapsed']:.0f} ms, {result['rate']:.0f} deletes/s, {result['failed']} failed")
+
+
+if __name__ == "__main__":
+    main()
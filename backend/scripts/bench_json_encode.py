@@ -0,0 +1,45 @@
+"""
+Compare the time taken to encode the task list response with the standard library
+encoder and with orjson, for the buffered and the streamed (?stream=1) responses.
+
+    python scripts/bench_json_encode.py --rows 10000
+    python scripts/bench_json_encode.py --rows 100000
+"""
+
+from bench_utils import parse_args, setup_django, test_database, populate, timeit
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    setup_django(args)
+
+    from django.conf import settings
+    from django.test import override_settings
+    from tasks.models import Task
+    from tasks.renderers import JSONRenderer
+    from tasks.responses import orjson
+    from tasks.views import GetTasksView
+
+    encoders = ["stdlib"] + (["auto"] if orjson is not None else [])
+    if orjson is None:
+        print("orjson is not installed; only the standard library encoder is measured\n")
+
+    with test_database():
+        populate(args.rows)
+        tasks = Task().custom_get_all()
+        view = GetTasksView()
+        renderer = JSONRenderer()
+        chunk_size = settings.TASKS_STREAM_CHUNK_SIZE
+        print(f"{args.rows} tasks\n")
+        for encoder in encoders:
+            with override_settings(TASKS_JSON_ENCODER=encoder):
+                size = len(renderer.render({"success": True, "data": tasks}))
+                buffered = timeit(lambda: renderer.render({"success": True, "data": tasks}))
+                streamed = timeit(lambda: b"".join(view.stream_json(iter(tasks), chunk_size)))
+            name = "orjson" if encoder == "auto" else "stdlib"
+            print(f"--- {name}: buffered {buffered:.1f} ms, streamed {streamed:.1f} ms, "
+                  f"{size / 1024 / 1024:.1f} MiB, {args.rows / buffered * 1000:.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Measure the time of a page of /tasks/?limit= at increasing depths, following the
+cursors from the first page, and print the plan of the deepest page queries. With
+the cursor seeking the list index, deep pages should cost what the first one does.
+
+    python scripts/bench_keyset_depth.py --rows 200000
+"""
+
+from bench_utils import parse_args, setup_django, test_database, populate, timeit
+
+
+def main() -> None:
+    args = parse_args(__doc__, rows=200000)
+    setup_django(args)
+
+    from django.db import connection
+    from tasks.models import Task
+
+    model = Task()
+    limit = 50
+    depths = [1, 10, 100, 1000, 3000]
+
+    with test_database():
+        populate(args.rows)
+        print(f"{connection.vendor}, {args.rows} tasks, {limit} per page\n")
+        cursors = {1: None}
+        cursor, depth = None, 1
+        while depth < max(depths):
+            cursor = model.custom_get_page(limit, cursor)["next"]
+            if cursor is None:
+                break
+            depth += 1
+            cursors[depth] = cursor
+        reached = [depth for depth in depths if depth in cursors]
+        for depth in reached:
+            elapsed = timeit(lambda: model.custom_get_page(limit, cursors[depth]))
+            print(f"--- page {depth}: {elapsed:.2f} ms")
+        for depth in depths[len(reached):]:
+            print(f"--- page {depth}: not reached, the list has {max(cursors)} pages")
+        _, _, querysets = model.page_query(limit, cursors[reached[-1]], None, None)
+        for queryset in querysets:
+            print(queryset[:limit + 1].explain())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Compare the query plans and timings of the task list queries with and without
+the indexes matching Task.Meta.ordering.
+"""
+
+from bench_utils import parse_args, setup_django, test_database, populate, timeit
+
+
+def main() -> None:
+    args = parse_args(__doc__)
+    setup_django(args)
+
+    from django.db import connection
+    from tasks.models import Task
+
+    queries = {
+        "list (Meta.ordering)": lambda: Task.objects.all()[:50],
+        "keyset page": lambda: Task.objects.order_by(*Task.KEYSET_ORDERING)[:50],
+        "status filter": lambda: Task.objects.filter(status="DOING").order_by(*Task.KEYSET_ORDERING)[:50],
+        "priority filter": lambda: Task.objects.filter(priority="HIGH").order_by(*Task.KEYSET_ORDERING)[:50],
+    }
+
+    with test_database():
+        populate(args.rows)
+        print(f"{connection.vendor}, {args.rows} tasks\n")
+        for indexed in (False, True):
+            with connection.schema_editor() as editor:
+                for index in Task._meta.indexes:
+                    if indexed:
+                        editor.add_index(Task, index)
+                    else:
+                        editor.remove_index(Task, index)
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute(f"ANALYZE {Task._meta.db_table}")
+            print("=" * 30, "with indexes" if indexed else "without indexes", "=" * 30)
+            for name, query in queries.items():
+                elapsed = timeit(lambda: list(query().values_list("task_id")))
+                print(f"--- {name}: {elapsed:.2f} ms")
+                print(query().explain())
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compare the memory held and the time taken by a list of tasks read as one
+dictionary per row (values()) and as a tuple-backed TaskBatch, from the query to
+the encoded JSON response.
+
+    python scripts/bench_task_records.py --rows 100000
+"""
+
+import gc
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+from bench_utils import parse_args, setup_django, test_database, populate, timeit
+
+
+def measure(func: Callable[[], Any]) -> Tuple[Any, int, int]:
+    """
+    Run func under tracemalloc and return its result, the memory still held by the
+    result and the peak memory allocated during the call, in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, held, peak
+
+
+def main() -> None:
+    args = parse_args(__doc__, rows=100000)
+    setup_django(args)
+
+    from tasks.models import Task
+    from tasks.renderers import JSONRenderer
+    from tasks.responses import use_orjson
+
+    model = Task()
+    renderer = JSONRenderer()
+    readers = {
+        "dicts (values())": lambda: list(model.filtered().values(*Task.SUMMARY_FIELDS)),
+        "TaskBatch": lambda: model.custom_get_all(),
+    }
+
+    with test_database():
+        populate(args.rows)
+        print(f"{args.rows} tasks, {'orjson' if use_orjson() else 'stdlib'} encoder\n")
+        for name, read in readers.items():
+            tasks, held, read_peak = measure(read)
+            _, _, encode_peak = measure(lambda: renderer.render({"success": True, "data": tasks}))
+            read_ms = timeit(read, repeat=3)
+            encode_ms = timeit(lambda: renderer.render({"success": True, "data": tasks}), repeat=3)
+            print(f"--- {name}: held {held / 2**20:.1f} MiB (peak {read_peak / 2**20:.1f} MiB), "
+                  f"read {read_ms:.0f} ms, encode {encode_ms:.0f} ms (peak {encode_peak / 2**20:.1f} MiB), "
+                  f"{args.rows / (read_ms + encode_ms) * 1000:.0f} rows/s")
+            del tasks
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Shared helpers for the backend benchmark scripts.
+
+The scripts run against a throwaway test database created from the migrations,
+so they never touch the data of the configured database. Run them from the
+backend directory, e.g.:
+
+    python scripts/bench_list_plan.py --rows 100000
+    python scripts/bench_list_plan.py --rows 100000 --postgres
+"""
+
+import os
+import sys
+import time
+import argparse
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "todo.settings")
+os.environ.setdefault("BACKEND_SECRET_KEY", "benchmark-only-secret-key")
+
+
+def parse_args(description: str, rows: int = 10000) -> argparse.Namespace:
+    """
+    Parse the command line options shared by every benchmark.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--rows", type=int, default=rows, help="number of tasks to insert")
+    parser.add_argument("--postgres", action="store_true",
+                        help="run against PostgreSQL configured through the BACKEND_DB_* variables")
+    parser.add_argument("--sqlite-file", action="store_true",
+                        help="use a file-backed SQLite test database instead of an in-memory one")
+    parser.add_argument("--threads", type=int, default=8, help="number of concurrent workers, where relevant")
+    return parser.parse_args()
+
+
+def setup_django(args: argparse.Namespace) -> None:
+    """
+    Point the default database at the requested engine and initialise Django.
+    """
+    import django
+    from django.conf import settings
+
+    if args.postgres:
+        settings.DATABASES["default"] = {
+            "ENGINE": "django.db.backends.postgresql",
+            "HOST": os.getenv("BACKEND_DB_HOST", "localhost"),
+            "PORT": os.getenv("BACKEND_DB_PORT", "5432"),
+            "NAME": os.getenv("BACKEND_DB_NAME", "backend-db"),
+            "USER": os.getenv("BACKEND_DB_USER", "backend-db-usr"),
+            "PASSWORD": os.getenv("BACKEND_DB_PASS", ""),
+        }
+    elif args.sqlite_file:
+        settings.DATABASES["default"]["TEST"] = {"NAME": os.path.join(BACKEND_DIR, "bench.sqlite3")}
+    django.setup()
+
+
+@contextmanager
+def test_database() -> Iterator[None]:
+    """
+    Create a migrated test database for the duration of the block.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def task_rows(count: int, start: int = 0) -> List[Dict[str, Any]]:
+    """
+    Build count task payloads with a realistic spread of start times, priorities and statuses.
+    """
+    now = datetime.now(timezone.utc)
+    priorities = ["HIGH", "MEDIUM", "LOW"]
+    statuses = ["TODO", "DOING", "DONE"]
+    return [
+        {
+            "title": f"Benchmark task {n}",
+            "description": "Benchmark description " * 10,
+            "start_time": now - timedelta(minutes=n % 50000) if n % 10 else None,
+            "end_time": now + timedelta(hours=n % 48),
+            "priority": priorities[n % 3],
+            "status": statuses[(n // 3) % 3],
+        }
+        for n in range(start, start + count)
+    ]
+
+
+def populate(count: int, batch_size: int = 5000) -> None:
+    """
+    Insert count tasks into the test database.
+    """
+    from tasks.models import Task
+
+    for start in range(0, count, batch_size):
+        Task.objects.bulk_create(
+            [Task(**row) for row in task_rows(min(batch_size, count - start), start)],
+            batch_size=batch_size
+        )
+
+
+def timeit(func: Callable[[], Any], repeat: int = 5) -> float:
+    """
+    Return the best wall-clock time of func over repeat runs, in milliseconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_save, post_delete
 
 
 class TasksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "tasks"
+
+    def ready(self):
+        from .versioning import bump_collection_version
+        from .models import Task
+        post_save.connect(bump_collection_version, sender=Task, dispatch_uid="tasks_version_on_save")
+        post_delete.connect(bump_collection_version, sender=Task, dispatch_uid="tasks_version_on_delete")
@@ -0,0 +1,438 @@
+import hashlib, threading
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Mapping, Sequence, Tuple
+from django.conf import settings
+from .versioning import collection_version
+from .interfaces import (
+    IModelCustomGetAll,
+    IModelCustomIterAll,
+    IModelCustomGetPage,
+    IModelCustomGetByParams,
+    IModelCustomGetById,
+    IModelCustomGetItemVersion,
+    IModelCustomCreate,
+    IModelCustomBulkCreate,
+    IModelCustomBulkUpsert,
+    IModelCustomUpdate,
+    IModelCustomPartialUpdate,
+    IModelCustomDelete,
+    IModelCustomBatch,
+    IModelCustomTransition,
+    IModelCustomGetMeta,
+    IAsyncModelCustomGetAll,
+    IAsyncModelCustomIterAll,
+    IAsyncModelCustomGetPage,
+    IAsyncModelCustomGetById,
+    IAsyncModelCustomGetItemVersion,
+    IAsyncModelCustomCreate,
+    IAsyncModelCustomUpdate,
+    IAsyncModelCustomPartialUpdate,
+    IAsyncModelCustomDelete,
+    IServiceGetAll,
+    IServiceIterAll,
+    IServiceGetPage,
+    IServiceGetByParams,
+    IServiceGetById,
+    IServiceGetItemVersion,
+    IServiceCreate,
+    IServiceBulkCreate,
+    IServiceBulkUpsert,
+    IServiceUpdate,
+    IServicePartialUpdate,
+    IServiceDelete,
+    IServiceBatch,
+    IServiceTransition,
+    IServiceGetMeta,
+    IServiceGetStats,
+    IServiceGetVersion,
+    IAsyncServiceGetAll,
+    IAsyncServiceIterAll,
+    IAsyncServiceGetPage,
+    IAsyncServiceGetByParams,
+    IAsyncServiceGetById,
+    IAsyncServiceGetItemVersion,
+    IAsyncServiceCreate,
+    IAsyncServiceUpdate,
+    IAsyncServicePartialUpdate,
+    IAsyncServiceDelete,
+    IAsyncServiceGetVersion
+)
+
+
+class CachedTaskService(
+    IServiceGetAll,
+    IServiceIterAll,
+    IServiceGetPage,
+    IServiceGetByParams,
+    IServiceGetById,
+    IServiceGetItemVersion,
+    IServiceCreate,
+    IServiceBulkCreate,
+    IServiceBulkUpsert,
+    IServiceUpdate,
+    IServicePartialUpdate,
+    IServiceDelete,
+    IServiceBatch,
+    IServiceTransition,
+    IServiceGetMeta,
+    IServiceGetStats,
+    IServiceGetVersion,
+    IAsyncServiceGetAll,
+    IAsyncServiceIterAll,
+    IAsyncServiceGetPage,
+    IAsyncServiceGetByParams,
+    IAsyncServiceGetById,
+    IAsyncServiceGetItemVersion,
+    IAsyncServiceCreate,
+    IAsyncServiceUpdate,
+    IAsyncServicePartialUpdate,
+    IAsyncServiceDelete,
+    IAsyncServiceGetVersion
+):
+    """
+    Caching decorator around a task service. Reads are served from Django's cache
+    under the current collection version; writes go to the wrapped service, which
+    bumps the version.
+
+    Implements:
+        - IServiceGetAll
+        - IServiceIterAll
+        - IServiceGetPage
+        - IServiceGetByParams
+        - IServiceGetById
+        - IServiceGetItemVersion
+        - IServiceCreate
+        - IServiceBulkCreate
+        - IServiceBulkUpsert
+        - IServiceUpdate
+        - IServicePartialUpdate
+        - IServiceDelete
+        - IServiceBatch
+        - IServiceTransition
+        - IServiceGetMeta
+        - IServiceGetStats
+        - IServiceGetVersion
+        - IAsyncServiceGetAll
+        - IAsyncServiceIterAll
+        - IAsyncServiceGetPage
+        - IAsyncServiceGetByParams
+        - IAsyncServiceGetById
+        - IAsyncServiceGetItemVersion
+        - IAsyncServiceCreate
+        - IAsyncServiceUpdate
+        - IAsyncServicePartialUpdate
+        - IAsyncServiceDelete
+        - IAsyncServiceGetVersion
+    """
+
+    def __init__(self, service: Any) -> None:
+        self.service = service
+        self.version = collection_version
+        self.hits: int = 0
+        self.misses: int = 0
+        self.lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the CachedTaskService instance.
+        """
+        return f"<CachedTaskService service={self.service!r}>"
+
+    def cached(self, name: str, args: Tuple[Any, ...], read: Callable[[], Any]) -> Any:
+        """
+        Returns the cached result of a read for the current collection version,
+        performing and caching the read on a miss.
+        """
+        token, _ = self.version.get()
+        digest: str = hashlib.sha256(repr(args).encode()).hexdigest()
+        key: str = f"tasks:{token}:{name}:{digest}"
+        result: Any = self.version.cache.get(key)
+        with self.lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if result is None:
+            result = read()
+            self.version.cache.set(key, result, timeout=settings.TASKS_CACHE_TIMEOUT)
+        return result
+
+    async def acached(self, name: str, args: Tuple[Any, ...], read: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns the cached result of an asynchronous read like cached, with the
+        asynchronous cache API. Reads share their cache entries with cached.
+        """
+        token, _ = await self.version.aget()
+        digest: str = hashlib.sha256(repr(args).encode()).hexdigest()
+        key: str = f"tasks:{token}:{name}:{digest}"
+        result: Any = await self.version.cache.aget(key)
+        with self.lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if result is None:
+            result = await read()
+            await self.version.cache.aset(key, result, timeout=settings.TASKS_CACHE_TIMEOUT)
+        return result
+
+    def get_all(
+        self,
+        model: IModelCustomGetAll,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> Sequence[Mapping[str, Any]]:
+        """
+        Retrieve all tasks matching the filters, from the cache when possible.
+        """
+        return self.cached("get_all", (filters, fields), lambda: self.service.get_all(model, filters, fields))
+
+    def iter_all(
+        self,
+        model: IModelCustomIterAll,
+        chunk_size: int,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all tasks matching the filters; streams are never cached.
+        """
+        return self.service.iter_all(model, chunk_size, filters, fields)
+
+    def get_page(
+        self,
+        model: IModelCustomGetPage,
+        limit: int,
+        cursor: str | None = None,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve a page of tasks matching the filters, from the cache when possible.
+        """
+        return self.cached(
+            "get_page",
+            (limit, cursor, filters, fields),
+            lambda: self.service.get_page(model, limit, cursor, filters, fields)
+        )
+
+    def get_by_params(
+        self,
+        model: IModelCustomGetByParams,
+        param: str,
+        limit: int | None = None,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the best matching tasks, from the cache when possible.
+        """
+        return self.cached(
+            "get_by_params",
+            (param, limit, filters, fields),
+            lambda: self.service.get_by_params(model, param, limit, filters, fields)
+        )
+
+    def get_by_id(self, model: IModelCustomGetById, id: str) -> Dict[str, Any]:
+        """
+        Retrieve a single task by its ID, from the cache when possible.
+        """
+        return self.cached("get_by_id", (str(id),), lambda: self.service.get_by_id(model, id))
+
+    def get_item_version(self, model: IModelCustomGetItemVersion, id: str) -> int:
+        """
+        Retrieve the version of a single task by its ID; it is a primary key lookup
+        of one column, so it is not cached.
+        """
+        return self.service.get_item_version(model, id)
+
+    def create(self, model: IModelCustomCreate, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new task; the wrapped service invalidates the cached reads.
+        """
+        task = self.service.create(model, data)
+        return task
+
+    def bulk_create(self, model: IModelCustomBulkCreate, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create many tasks; the wrapped service invalidates the cached reads.
+        """
+        return self.service.bulk_create(model, items)
+
+    def bulk_upsert(self, model: IModelCustomBulkUpsert, items: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Create or update many tasks by external reference; the wrapped service invalidates the cached reads.
+        """
+        return self.service.bulk_upsert(model, items)
+
+    def update(self, model: IModelCustomUpdate, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
+        """
+        Update a task; the wrapped service invalidates the cached reads.
+        """
+        task = self.service.update(model, data, version)
+        return task
+
+    def partial_update(
+        self,
+        model: IModelCustomPartialUpdate,
+        id: str,
+        data: Dict[str, Any],
+        version: int | None = None
+    ) -> Dict[str, Any]:
+        """
+        Change some fields of a task; the wrapped service invalidates the cached reads.
+        """
+        return self.service.partial_update(model, id, data, version)
+
+    def delete(self, model: IModelCustomDelete, id: str) -> bool:
+        """
+        Delete a task; the wrapped service invalidates the cached reads.
+        """
+        deleted = self.service.delete(model, id)
+        return deleted
+
+    def batch(self, model: IModelCustomBatch, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Apply update and delete operations; the wrapped service invalidates the cached reads.
+        """
+        return self.service.batch(model, operations)
+
+    def transition(self, model: IModelCustomTransition, filters: Dict[str, Any], status: str) -> int:
+        """
+        Move the tasks matching the filters to the status; the wrapped service invalidates the cached reads.
+        """
+        return self.service.transition(model, filters, status)
+
+    def get_meta(self, model: IModelCustomGetMeta) -> Dict[str, Any]:
+        """
+        Retrieve the metadata shared by all tasks; it is static, so it is not cached.
+        """
+        return self.service.get_meta(model)
+
+    def get_version(self) -> Tuple[str, datetime]:
+        """
+        Retrieve the current collection version and the time of the last write.
+        """
+        return self.service.get_version()
+
+    async def aget_all(
+        self,
+        model: IAsyncModelCustomGetAll,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> Sequence[Mapping[str, Any]]:
+        """
+        Retrieve all tasks matching the filters asynchronously, from the cache when possible.
+        """
+        return await self.acached("get_all", (filters, fields), lambda: self.service.aget_all(model, filters, fields))
+
+    def aiter_all(
+        self,
+        model: IAsyncModelCustomIterAll,
+        chunk_size: int,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate asynchronously over all tasks matching the filters; streams are never cached.
+        """
+        return self.service.aiter_all(model, chunk_size, filters, fields)
+
+    async def aget_page(
+        self,
+        model: IAsyncModelCustomGetPage,
+        limit: int,
+        cursor: str | None = None,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve a page of tasks matching the filters asynchronously, from the cache when possible.
+        """
+        return await self.acached(
+            "get_page",
+            (limit, cursor, filters, fields),
+            lambda: self.service.aget_page(model, limit, cursor, filters, fields)
+        )
+
+    async def aget_by_params(
+        self,
+        model: IModelCustomGetByParams,
+        param: str,
+        limit: int | None = None,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the best matching tasks asynchronously, from the cache when possible.
+        """
+        return await self.acached(
+            "get_by_params",
+            (param, limit, filters, fields),
+            lambda: self.service.aget_by_params(model, param, limit, filters, fields)
+        )
+
+    async def aget_by_id(self, model: IAsyncModelCustomGetById, id: str) -> Dict[str, Any]:
+        """
+        Retrieve a single task by its ID asynchronously, from the cache when possible.
+        """
+        return await self.acached("get_by_id", (str(id),), lambda: self.service.aget_by_id(model, id))
+
+    async def aget_item_version(self, model: IAsyncModelCustomGetItemVersion, id: str) -> int:
+        """
+        Retrieve the version of a single task by its ID asynchronously, uncached like get_item_version.
+        """
+        return await self.service.aget_item_version(model, id)
+
+    async def acreate(self, model: IAsyncModelCustomCreate, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new task asynchronously; the wrapped service invalidates the cached reads.
+        """
+        return await self.service.acreate(model, data)
+
+    async def aupdate(self, model: IAsyncModelCustomUpdate, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
+        """
+        Update a task asynchronously; the wrapped service invalidates the cached reads.
+        """
+        return await self.service.aupdate(model, data, version)
+
+    async def apartial_update(
+        self,
+        model: IAsyncModelCustomPartialUpdate,
+        id: str,
+        data: Dict[str, Any],
+        version: int | None = None
+    ) -> Dict[str, Any]:
+        """
+        Change some fields of a task asynchronously; the wrapped service invalidates the cached reads.
+        """
+        return await self.service.apartial_update(model, id, data, version)
+
+    async def adelete(self, model: IAsyncModelCustomDelete, id: str) -> bool:
+        """
+        Delete a task asynchronously; the wrapped service invalidates the cached reads.
+        """
+        return await self.service.adelete(model, id)
+
+    async def aget_version(self) -> Tuple[str, datetime]:
+        """
+        Retrieve the current collection version and the time of the last write asynchronously.
+        """
+        return await self.service.aget_version()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve the cache hit and miss counters of this process, along with the
+        statistics of the wrapped service.
+        """
+        with self.lock:
+            hits, misses = self.hits, self.misses
+        lookups: int = hits + misses
+        return {
+            **self.service.get_stats(),
+            "cache": {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / lookups, 4) if lookups else None
+            }
+        }
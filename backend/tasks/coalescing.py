@@ -0,0 +1,111 @@
+import threading, time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Tuple
+from django.conf import settings
+from .exceptions import InvalidItems
+from .interfaces import IModelCustomBulkCreate
+
+
+class WriteBuffer:
+    """
+    Group commit for task creation. Creates submitted by concurrent requests within a
+    short window are inserted together by one bulk_create transaction, and every
+    request then gets its own task back (or its own error). The first request to find
+    the buffer empty leads the batch: it waits for the window to elapse, or for the
+    batch to fill up, and commits it on behalf of the others, which give up after
+    timeout seconds should the leader never complete them. Batches only form when
+    the process serves requests concurrently, from threads or an event loop.
+    """
+
+    def __init__(self, window_ms: float | None = None, max_batch: int | None = None, timeout: float | None = None) -> None:
+        self.window: float = (settings.TASKS_WRITE_BUFFER_WINDOW_MS if window_ms is None else window_ms) / 1000
+        self.max_batch: int = settings.TASKS_WRITE_BUFFER_MAX_BATCH if max_batch is None else max_batch
+        self.timeout: float = settings.TASKS_WRITE_BUFFER_TIMEOUT if timeout is None else timeout
+        self.condition = threading.Condition()
+        self.pending: List[Tuple[Dict[str, Any], Future, float]] = []
+        self.batches: int = 0
+        self.items: int = 0
+        self.wait_time: float = 0.0
+        self.max_wait_time: float = 0.0
+        self.flush_time: float = 0.0
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the WriteBuffer instance.
+        """
+        return f"<WriteBuffer window_ms={self.window * 1000:g} max_batch={self.max_batch}>"
+
+    def submit(self, model: IModelCustomBulkCreate, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Adds a task to the current batch and returns it once the batch is committed,
+        raising the error of its own item if it could not be created, or an error if
+        the batch is not committed within the timeout.
+        """
+        future: Future = Future()
+        with self.condition:
+            self.pending.append((data, future, time.monotonic()))
+            leader: bool = len(self.pending) == 1
+            if len(self.pending) >= self.max_batch:
+                self.condition.notify_all()
+        if leader:
+            deadline: float = time.monotonic() + self.window
+            with self.condition:
+                while len(self.pending) < self.max_batch and time.monotonic() < deadline:
+                    self.condition.wait(deadline - time.monotonic())
+                batch, self.pending = self.pending, []
+            self.flush(model, batch)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise Exception(f"Error creating Task: batch not committed within {self.timeout:g} s")
+
+    def flush(self, model: IModelCustomBulkCreate, batch: List[Tuple[Dict[str, Any], Future, float]]) -> None:
+        """
+        Commits the batch with bulk_create and completes the request of every item.
+        Invalid items fail their own request only; the rest of the batch is retried.
+        """
+        started: float = time.monotonic()
+        while batch:
+            try:
+                tasks = model.custom_bulk_create([data for data, _, _ in batch], len(batch))
+            except InvalidItems as err:
+                for index, errors in err.errors.items():
+                    batch[index][1].set_exception(Exception(f"Error creating Task: {errors}"))
+                batch = [entry for index, entry in enumerate(batch) if index not in err.errors]
+                continue
+            except Exception as err:
+                for _, future, _ in batch:
+                    future.set_exception(err)
+                break
+            for (_, future, _), task in zip(batch, tasks):
+                future.set_result(task)
+            break
+        finished: float = time.monotonic()
+        with self.condition:
+            self.batches += 1
+            self.flush_time += finished - started
+            for _, future, enqueued in batch:
+                self.items += 1
+                self.wait_time += finished - enqueued
+                self.max_wait_time = max(self.max_wait_time, finished - enqueued)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns the batching window, the mean batch size, the latency added to each
+        create and the commit throughput, to tune the window against.
+        """
+        with self.condition:
+            batches, items, wait_time, max_wait_time, flush_time = (
+                self.batches, self.items, self.wait_time, self.max_wait_time, self.flush_time
+            )
+        return {
+            "window_ms": self.window * 1000,
+            "max_batch": self.max_batch,
+            "batches": batches,
+            "items": items,
+            "mean_batch_size": round(items / batches, 2) if batches else None,
+            "mean_latency_ms": round(wait_time / items * 1000, 3) if items else None,
+            "max_latency_ms": round(max_wait_time * 1000, 3),
+            "mean_flush_ms": round(flush_time / batches * 1000, 3) if batches else None,
+            "items_per_second": round(items / flush_time, 1) if flush_time else None
+        }
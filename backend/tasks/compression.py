@@ -0,0 +1,277 @@
+import hashlib, zlib
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Tuple
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.module_loading import import_string
+from .interfaces import ICompressor
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; BrotliCompressor is unavailable without it
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; ZstdCompressor is unavailable without it
+    zstandard = None
+
+
+class GzipCompressor(ICompressor):
+    """
+    Compressor for the gzip content coding, always available through zlib.
+
+    Implements:
+        - ICompressor
+    """
+    encoding: str = "gzip"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the GzipCompressor instance.
+        """
+        return "<GzipCompressor>"
+
+    def is_available(self) -> bool:
+        """
+        gzip is always available.
+        """
+        return True
+
+    def compressobj(self) -> Any:
+        """
+        Returns a zlib compressor writing the gzip format.
+        """
+        return zlib.compressobj(settings.TASKS_COMPRESSION_LEVELS["gzip"], zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compresses data in the gzip format.
+        """
+        compressor = self.compressobj()
+        return compressor.compress(data) + compressor.flush()
+
+    def open_stream(self) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+        """
+        Starts a gzip stream, flushed after each chunk.
+        """
+        compressor = self.compressobj()
+        return lambda chunk: compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+
+class BrotliCompressor(ICompressor):
+    """
+    Compressor for the br content coding, available when brotli is installed.
+
+    Implements:
+        - ICompressor
+    """
+    encoding: str = "br"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the BrotliCompressor instance.
+        """
+        return "<BrotliCompressor>"
+
+    def is_available(self) -> bool:
+        """
+        br is available when the brotli package is installed.
+        """
+        return brotli is not None
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compresses data with brotli.
+        """
+        return brotli.compress(data, quality=settings.TASKS_COMPRESSION_LEVELS["br"])
+
+    def open_stream(self) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+        """
+        Starts a brotli stream, flushed after each chunk.
+        """
+        compressor = brotli.Compressor(quality=settings.TASKS_COMPRESSION_LEVELS["br"])
+        return lambda chunk: compressor.process(chunk) + compressor.flush(), compressor.finish
+
+
+class ZstdCompressor(ICompressor):
+    """
+    Compressor for the zstd content coding, available when zstandard is installed.
+
+    Implements:
+        - ICompressor
+    """
+    encoding: str = "zstd"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the ZstdCompressor instance.
+        """
+        return "<ZstdCompressor>"
+
+    def is_available(self) -> bool:
+        """
+        zstd is available when the zstandard package is installed.
+        """
+        return zstandard is not None
+
+    def compressor(self) -> Any:
+        """
+        Returns a zstandard compressor at the configured level.
+        """
+        return zstandard.ZstdCompressor(level=settings.TASKS_COMPRESSION_LEVELS["zstd"])
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compresses data with zstd.
+        """
+        return self.compressor().compress(data)
+
+    def open_stream(self) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+        """
+        Starts a zstd stream, flushing a block after each chunk.
+        """
+        compressor = self.compressor().compressobj()
+        return lambda chunk: compressor.compress(chunk) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK), compressor.flush
+
+
+@lru_cache
+def get_compressors() -> Tuple[ICompressor, ...]:
+    """
+    Returns the available compressors configured in TASKS_COMPRESSORS, in order of
+    preference among the codings a client accepts equally.
+    """
+    compressors: List[ICompressor] = [import_string(path)() for path in settings.TASKS_COMPRESSORS]
+    return tuple(compressor for compressor in compressors if compressor.is_available())
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """
+    Parses an Accept-Encoding header into the quality of every coding it names.
+    """
+    qualities: Dict[str, float] = {}
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality: float = 1.0
+        name, _, value = params.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        qualities[coding] = quality
+    return qualities
+
+
+def select_compressor(request: HttpRequest) -> ICompressor | None:
+    """
+    Returns the compressor of the coding the request's Accept-Encoding header
+    prefers, or None when it accepts none of them.
+    """
+    qualities: Dict[str, float] = parse_accept_encoding(request.headers.get("Accept-Encoding") or "")
+    selected: ICompressor | None = None
+    selected_quality: float = 0.0
+    for compressor in get_compressors():
+        quality: float = qualities.get(compressor.encoding, qualities.get("*", 0.0))
+        if quality > selected_quality:
+            selected, selected_quality = compressor, quality
+    return selected
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compresses response bodies with the best coding the client accepts among gzip,
+    and br and zstd when their libraries are installed. Bodies smaller than
+    TASKS_COMPRESSION_MIN_SIZE are sent as they are, and streamed bodies are only
+    compressed when TASKS_COMPRESSION_STREAMING is on, one flushed block per chunk.
+    A body sent with a strong ETag only changes with its ETag, so its compressed
+    copy is kept in the tasks cache under the path, content type, ETag and coding,
+    and a hot list is compressed once per version. Only the API
+    media types of TASKS_COMPRESSION_MEDIA_TYPES are compressed: HTML pages such as
+    the admin reflect input next to a CSRF token and would be open to BREACH.
+    """
+
+    def cache_key(self, request: HttpRequest, response: HttpResponse, encoding: str) -> str | None:
+        """
+        Returns the cache key of the compressed body of the response, or None when
+        the body must not be cached. The ETag only identifies a representation of
+        one resource, so the key also holds the request path and the content type.
+        """
+        etag: str | None = response.get("ETag")
+        if not settings.TASKS_COMPRESSION_CACHE or response.status_code != 200 or not etag or not etag.startswith('"'):
+            return None
+        resource: str = f"{request.get_full_path()}:{response.get('Content-Type', '')}:{etag}"
+        return f"tasks:compressed:{encoding}:{hashlib.sha256(resource.encode()).hexdigest()}"
+
+    def compress(self, request: HttpRequest, response: HttpResponse, compressor: ICompressor) -> bytes:
+        """
+        Returns the compressed body of the response, from the cache when possible.
+        """
+        key: str | None = self.cache_key(request, response, compressor.encoding)
+        cache = caches[settings.TASKS_CACHE_ALIAS]
+        compressed: bytes | None = cache.get(key) if key else None
+        if compressed is None:
+            compressed = compressor.compress(response.content)
+            if key:
+                cache.set(key, compressed, timeout=settings.TASKS_CACHE_TIMEOUT)
+        return compressed
+
+    def compress_chunks(self, chunks: Iterator[bytes], compressor: ICompressor) -> Iterator[bytes]:
+        """
+        Compresses the chunks of a streamed body as they are produced.
+        """
+        compress_chunk, finish = compressor.open_stream()
+        for chunk in chunks:
+            if chunk:
+                yield compress_chunk(chunk)
+        yield finish()
+
+    async def compress_chunks_async(self, chunks: AsyncIterator[bytes], compressor: ICompressor) -> AsyncIterator[bytes]:
+        """
+        Compresses the chunks of an asynchronous streamed body as they are produced.
+        """
+        compress_chunk, finish = compressor.open_stream()
+        async for chunk in chunks:
+            if chunk:
+                yield compress_chunk(chunk)
+        yield finish()
+
+    def process_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        """
+        Compresses the response body when the client accepts a supported coding.
+        """
+        if not response.streaming and len(response.content) < settings.TASKS_COMPRESSION_MIN_SIZE:
+            return response
+        if response.streaming and not settings.TASKS_COMPRESSION_STREAMING:
+            return response
+        if response.has_header("Content-Encoding") or "no-transform" in response.get("Cache-Control", ""):
+            return response
+        if response.get("Content-Type", "").partition(";")[0].strip() not in settings.TASKS_COMPRESSION_MEDIA_TYPES:
+            return response
+        patch_vary_headers(response, ("Accept-Encoding",))
+        compressor: ICompressor | None = select_compressor(request)
+        if compressor is None:
+            return response
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = self.compress_chunks_async(response.streaming_content, compressor)
+            else:
+                response.streaming_content = self.compress_chunks(response.streaming_content, compressor)
+            del response.headers["Content-Length"]
+        else:
+            compressed: bytes = self.compress(request, response, compressor)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+        etag: str | None = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = compressor.encoding
+        return response
@@ -1,3 +1,6 @@
+from typing import Dict, List
+
+
 class NotFound(Exception):
     """
     Custom exception to handle DoesNotExist exceptions.
@@ -12,3 +15,68 @@ class NotFound(Exception):
 
     def __repr__(self):
         return "<class=NotFound>"
+
+
+class InvalidCursor(Exception):
+    """
+    Custom exception to handle pagination cursors that cannot be decoded.
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return f"InvalidCursor: {self.message}"
+
+    def __repr__(self):
+        return "<class=InvalidCursor>"
+
+
+class Conflict(Exception):
+    """
+    Custom exception to handle writes made against an outdated version of an item.
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return f"Conflict: {self.message}"
+
+    def __repr__(self):
+        return "<class=Conflict>"
+
+
+class InvalidItems(Exception):
+    """
+    Custom exception to handle bulk payloads in which some items fail validation.
+    """
+
+    def __init__(self, message: str, errors: Dict[int, Dict[str, List[str]]]):
+        super().__init__(message)
+        self.message = message
+        self.errors = errors
+
+    def __str__(self):
+        return f"InvalidItems: {self.message}"
+
+    def __repr__(self):
+        return "<class=InvalidItems>"
+
+
+class InvalidQuery(Exception):
+    """
+    Custom exception to handle query parameters that cannot be parsed, carrying the error returned to the client.
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return f"InvalidQuery: {self.message}"
+
+    def __repr__(self):
+        return "<class=InvalidQuery>"
@@ -0,0 +1,101 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from .models import IdempotencyKey
+
+
+class IdempotencyStore:
+    """
+    Store of the responses to requests sent with an Idempotency-Key header. A request
+    first claims its key with an INSERT, which the primary key makes atomic: a retry
+    then finds the stored response and replays it, a concurrent retry finds the claim
+    still in progress, and a different request reusing the key is refused. A claim
+    left in progress longer than TASKS_IDEMPOTENCY_LOCK_TIMEOUT, e.g. by a killed
+    worker, is taken over by the next retry.
+    """
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the IdempotencyStore instance.
+        """
+        return "<IdempotencyStore>"
+
+    def digest(self, value: bytes) -> str:
+        """
+        Returns the hexadecimal SHA-256 digest of value.
+        """
+        return hashlib.sha256(value).hexdigest()
+
+    def fingerprint(self, request: HttpRequest) -> str:
+        """
+        Returns the digest identifying the request a key was first used with.
+        """
+        return self.digest(b"\n".join([request.method.encode(), request.get_full_path().encode(), request.body]))
+
+    def expiry(self) -> datetime:
+        """
+        Returns the creation time before which stored keys have expired.
+        """
+        return datetime.now(timezone.utc) - timedelta(seconds=settings.TASKS_IDEMPOTENCY_TTL)
+
+    def lock_expiry(self) -> datetime:
+        """
+        Returns the creation time before which claims still in progress are abandoned.
+        """
+        return datetime.now(timezone.utc) - timedelta(seconds=settings.TASKS_IDEMPOTENCY_LOCK_TIMEOUT)
+
+    def claim(self, key: str, request: HttpRequest) -> HttpResponse | None:
+        """
+        Claims the key for the request. Returns None when the request must be processed,
+        or the response to send instead: the stored response of a previous identical
+        request, 409 while that request is still in progress, or 422 when the key was
+        used for a different request.
+        """
+        digest: str = self.digest(key.encode())
+        fingerprint: str = self.fingerprint(request)
+        now = datetime.now(timezone.utc)
+        try:
+            with transaction.atomic():
+                IdempotencyKey.objects.filter(
+                    Q(created_at__lt=self.expiry()) | Q(status__isnull=True, created_at__lt=self.lock_expiry()), key=digest
+                ).delete()
+                IdempotencyKey.objects.create(key=digest, request_hash=fingerprint, created_at=now)
+            return None
+        except IntegrityError:
+            stored = IdempotencyKey.objects.filter(key=digest).first()
+        if stored is None:
+            return JsonResponse({"success": False, "error": "Request with this Idempotency-Key is in progress"}, status=409)
+        if stored.request_hash != fingerprint:
+            return JsonResponse({"success": False, "error": "Idempotency-Key was used for a different request"}, status=422)
+        if stored.status is None:
+            return JsonResponse({"success": False, "error": "Request with this Idempotency-Key is in progress"}, status=409)
+        response = HttpResponse(bytes(stored.response), status=stored.status, content_type=stored.content_type)
+        response["Idempotent-Replayed"] = "true"
+        return response
+
+    def complete(self, key: str, response: HttpResponse) -> None:
+        """
+        Stores the response to the request that claimed the key, unless another request
+        completed it first after taking over the claim. Server errors are not stored:
+        the key is released so that a retry processes the request again.
+        """
+        digest: str = self.digest(key.encode())
+        if response.status_code >= 500:
+            IdempotencyKey.objects.filter(key=digest, status__isnull=True).delete()
+            return
+        IdempotencyKey.objects.filter(key=digest, status__isnull=True).update(
+            status=response.status_code, response=response.content, content_type=response["Content-Type"]
+        )
+
+    def purge(self) -> int:
+        """
+        Deletes the expired keys, returning how many were deleted.
+        """
+        deleted, _ = IdempotencyKey.objects.filter(created_at__lt=self.expiry()).delete()
+        return deleted
+
+
+IDEMPOTENCY_STORE = IdempotencyStore()
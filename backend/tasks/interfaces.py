@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Protocol, List, Dict, Any
+from typing import Protocol, List, Dict, Any, AsyncIterator, Callable, Iterator, Mapping, Sequence, Tuple
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 
 
@@ -14,22 +14,85 @@ class IModelCustomGetAll(Protocol):
     """
     Protocol for models that support retrieving all items.
     """
-    def custom_get_all(self: Any) -> List[Dict[str, Any]]:
+    def custom_get_all(self: Any, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> Sequence[Mapping[str, Any]]:
         """
         Retrieves all items.
 
+        Parameters
+        ----------
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
+
         Returns
         -------
-        List[Dict[str, Any]]
+        Sequence[Mapping[str, Any]]
+            All items as read-only mappings, e.g. the TaskRecord rows of a TaskBatch.
+        """
+        ...
+
+class IModelCustomIterAll(Protocol):
+    """
+    Protocol for models that support lazily iterating over all items.
+    """
+    def custom_iter_all(self: Any, chunk_size: int, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over all items, fetching them from the database in chunks.
+
+        Parameters
+        ----------
+        chunk_size : int
+            The number of rows fetched from the database at a time.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
+
+        Returns
+        -------
+        Iterator[Dict[str, Any]]
             All items as dictionaries.
         """
         ...
 
+class IModelCustomGetPage(Protocol):
+    """
+    Protocol for models that support retrieving items one page at a time.
+    """
+    def custom_get_page(self: Any, limit: int, cursor: str | None = None, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> Dict[str, Any]:
+        """
+        Retrieves a page of items, starting after the given cursor.
+
+        Parameters
+        ----------
+        limit : int
+            The maximum number of items in the page.
+        cursor : str | None
+            The opaque cursor returned with the previous page, or None for the first page.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The page as a dictionary with the "items" sequence of read-only mappings
+            (e.g. a TaskBatch) and the "next" cursor (None when there are no more items).
+
+        Raises
+        ------
+        InvalidCursor
+            If the cursor cannot be decoded.
+        """
+        ...
+
 class IModelCustomGetByParams(Protocol):
     """
     Protocol for models that support retrieving items by given parameters.
     """
-    def custom_get_by_params(self: Any, params: str) -> List[Dict[str, Any]]:
+    def custom_get_by_params(self: Any, params: str, limit: int | None = None, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> List[Dict[str, Any]]:
         """
         Retrieves items, filtered by keyword arguments.
 
@@ -37,6 +100,12 @@ class IModelCustomGetByParams(Protocol):
         ----------
         params : str
             The filter parameters.
+        limit : int | None
+            The maximum number of items to return, or None for the default search limit.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
 
         Returns
         -------
@@ -70,6 +139,31 @@ class IModelCustomGetById(Protocol):
         """
         ...
 
+class IModelCustomGetItemVersion(Protocol):
+    """
+    Protocol for models that support reading the version of a single item by its ID.
+    """
+    def custom_get_item_version(self: Any, id: str) -> int:
+        """
+        Retrieves the version of a single item, without reading the item itself.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier of the item.
+
+        Returns
+        -------
+        int
+            The version of the item.
+
+        Raises
+        ------
+        NotFound
+            If the item is not found.
+        """
+        ...
+
 class IModelCustomCreate(Protocol):
     """
     Protocol for models that support creating a new item.
@@ -95,11 +189,66 @@ class IModelCustomCreate(Protocol):
         """
         ...
 
+class IModelCustomBulkCreate(Protocol):
+    """
+    Protocol for models that support creating many items at once.
+    """
+    def custom_bulk_create(self: Any, items: List[Dict[str, Any]], batch_size: int) -> List[Dict[str, Any]]:
+        """
+        Validates all the items, then creates them in batches within one transaction.
+
+        Parameters
+        ----------
+        items : List[Dict[str, Any]]
+            The data for the new items.
+        batch_size : int
+            The number of items inserted per statement.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The created items as dictionaries, in the order of the given data.
+
+        Raises
+        ------
+        InvalidItems
+            If any item fails validation; no item is created.
+        """
+        ...
+
+class IModelCustomBulkUpsert(Protocol):
+    """
+    Protocol for models that support creating or updating many items by external reference.
+    """
+    def custom_bulk_upsert(self: Any, items: List[Dict[str, Any]], batch_size: int) -> Dict[str, int]:
+        """
+        Validates all the items, then creates or updates them by external reference,
+        in batches within one transaction.
+
+        Parameters
+        ----------
+        items : List[Dict[str, Any]]
+            The data of the items, each with a distinct "external_ref".
+        batch_size : int
+            The number of items written per statement.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of items "created" and "updated".
+
+        Raises
+        ------
+        InvalidItems
+            If any item fails validation; no item is written.
+        """
+        ...
+
 class IModelCustomUpdate(Protocol):
     """
     Protocol for models that support updating an existing item.
     """
-    def custom_update(self: Any, data: Dict[str, Any]) -> Dict[str, Any]:
+    def custom_update(self: Any, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
         """
         Updates the item with the given data.
 
@@ -107,6 +256,9 @@ class IModelCustomUpdate(Protocol):
         ----------
         data : Dict[str, Any]
             The updated data for the item.
+        version : int | None
+            The version of the item the update was made against, or None to update
+            whatever its current version.
 
         Returns
         -------
@@ -120,6 +272,40 @@ class IModelCustomUpdate(Protocol):
         """
         ...
 
+class IModelCustomPartialUpdate(Protocol):
+    """
+    Protocol for models that support changing some fields of an existing item.
+    """
+    def custom_partial_update(self: Any, id: str, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
+        """
+        Writes only the given fields of the item, in a single statement.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier of the item.
+        data : Dict[str, Any]
+            The fields to change and their new values.
+        version : int | None
+            The version of the item the change was made against, or None to change
+            whatever its current version.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The identifier and the changed fields of the item as a dictionary.
+
+        Raises
+        ------
+        NotFound
+            If the item is not found.
+        Conflict
+            If the item is no longer at the given version.
+        ValidationError
+            If any field is unknown, read-only or invalid.
+        """
+        ...
+
 class IModelCustomDelete(Protocol):
     """
     Protocol for models that support deleting an item.
@@ -142,248 +328,1183 @@ class IModelCustomDelete(Protocol):
         ------
         NotFound
             If the item is not found.
+        Conflict
+            If the item is no longer at the given version.
         """
         ...
 
-###########################################################
-###   Service Interfaces   ################################
-###########################################################
-class IServiceGetAll(ABC):
+class IModelCustomBatch(Protocol):
     """
-    Interface for service to get all items from a model.
+    Protocol for models that support applying many update and delete operations at once.
     """
-    @abstractmethod
-    def get_all(self: Any, model: IModelCustomGetAll) -> List[Dict[str, Any]]:
+    def custom_batch(self: Any, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Retrieve all items from the model.
+        Applies the update and delete operations within one transaction.
 
         Parameters
         ----------
-        model : IModelCustomGetAll
-            The model instance.
+        operations : List[Dict[str, Any]]
+            The operations, each with an "op" ("update" or "delete"), the "task_id"
+            of its item and, for updates, the "data" to change.
 
         Returns
         -------
         List[Dict[str, Any]]
-            All items as dictionaries.
+            The status of each operation, in the order of the given operations.
+
+        Raises
+        ------
+        InvalidItems
+            If any operation fails validation; no operation is applied.
         """
         ...
 
-class IServiceGetByParams(ABC):
+class IModelCustomTransition(Protocol):
     """
-    Interface for service to get items by given params.
+    Protocol for models that support moving every item matching filters to a status.
     """
-    @abstractmethod
-    def get_by_params(self: Any, model: IModelCustomGetByParams, param: str) -> List[Dict[str, Any]]:
+    def custom_transition(
+        self: Any,
+        filters: Dict[str, Any],
+        status: str,
+        end_time: datetime | None = None
+    ) -> int:
         """
-        Retrieve items by given params from the model.
+        Sets the status (and end time, if given) of the matching items not already in
+        that status, in a single statement.
 
         Parameters
         ----------
-        model : IModelCustomGetByParams
-            The model instance.
-        param : str
-            The filter parameters.
+        filters : Dict[str, Any]
+            Structured filters selecting the items, as for custom_get_all.
+        status : str
+            The status to move the items to.
+        end_time : datetime | None
+            The end time to set on the moved items, if any.
 
         Returns
         -------
-        List[Dict[str, Any]]
-            Filtered items as dictionaries.
+        int
+            The number of items moved.
+
+        Raises
+        ------
+        ValidationError
+            If the status is invalid.
         """
         ...
 
-class IServiceGetById(ABC):
+class IModelCustomGetMeta(Protocol):
     """
-    Interface for service to get an item by its id.
+    Protocol for models that expose metadata shared by all items, such as choices.
     """
-    @abstractmethod
-    def get_by_id(self: Any, model: IModelCustomGetById, id: str) -> Dict[str, Any]:
+    def custom_get_meta(self: Any) -> Dict[str, Any]:
         """
-        Retrieve an item by its id from the model.
-
-        Parameters
-        ----------
-        model : IModelCustomGetById
-            The model instance.
-        id : str
-            The unique identifier of the item.
+        Retrieves the metadata shared by all items.
 
         Returns
         -------
         Dict[str, Any]
-            The item as a dictionary.
+            The metadata as a dictionary, including a "version" that changes with its content.
         """
         ...
 
-class IServiceCreate(ABC):
+# --- Asynchronous counterparts, awaited by the views served under ASGI ---
+
+class IAsyncModelCustomGetAll(Protocol):
     """
-    Interface for service to create a new item.
+    Protocol for models that support retrieving all items asynchronously.
     """
-    @abstractmethod
-    def create(self: Any, model: IModelCustomCreate, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def acustom_get_all(self: Any, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> Sequence[Mapping[str, Any]]:
         """
-        Create a new item in the model.
+        Retrieves all items without blocking the event loop.
 
         Parameters
         ----------
-        model : IModelCustomCreate
-            The model instance.
-        data : Dict[str, Any]
-            The data for the new item.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
 
         Returns
         -------
-        Dict[str, Any]
-            The created item as a dictionary.
+        Sequence[Mapping[str, Any]]
+            All items as read-only mappings, e.g. the TaskRecord rows of a TaskBatch.
         """
         ...
 
-class IServiceUpdate(ABC):
+class IAsyncModelCustomIterAll(Protocol):
     """
-    Interface for service to update an item.
+    Protocol for models that support asynchronously iterating over all items.
     """
-    @abstractmethod
-    def update(self: Any, model: IModelCustomUpdate, data: Dict[str, Any]) -> Dict[str, Any]:
+    def acustom_iter_all(self: Any, chunk_size: int, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> AsyncIterator[Dict[str, Any]]:
         """
-        Update an item in the model.
+        Iterates asynchronously over all items, fetching them from the database in chunks.
 
         Parameters
         ----------
-        model : IModelCustomUpdate
-            The model instance.
-        data : Dict[str, Any]
-            The updated data for the item.
+        chunk_size : int
+            The number of rows fetched from the database at a time.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
 
         Returns
         -------
-        Dict[str, Any]
-            The updated item as a dictionary.
+        AsyncIterator[Dict[str, Any]]
+            All items as dictionaries.
         """
         ...
 
-class IServiceDelete(ABC):
+class IAsyncModelCustomGetPage(Protocol):
     """
-    Interface for service to delete an item.
+    Protocol for models that support retrieving items one page at a time asynchronously.
     """
-    @abstractmethod
-    def delete(self: Any, model: IModelCustomDelete, id: str) -> bool:
+    async def acustom_get_page(self: Any, limit: int, cursor: str | None = None, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> Dict[str, Any]:
         """
-        Delete an item from the model by id.
+        Retrieves a page of items, starting after the given cursor, without blocking the event loop.
 
         Parameters
         ----------
-        model : IModelCustomDelete
-            The model instance.
-        id : str
-            The unique identifier of the item to delete.
+        limit : int
+            The maximum number of items in the page.
+        cursor : str | None
+            The opaque cursor returned with the previous page, or None for the first page.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
 
         Returns
         -------
-        bool
-            True if successful, False otherwise.
+        Dict[str, Any]
+            The page as a dictionary with the "items" sequence of read-only mappings
+            (e.g. a TaskBatch) and the "next" cursor (None when there are no more items).
+
+        Raises
+        ------
+        InvalidCursor
+            If the cursor cannot be decoded.
         """
         ...
 
-###########################################################
-###   View Interfaces   ###################################
-###########################################################
-class IViewGetList(ABC):
+class IAsyncModelCustomGetById(Protocol):
     """
-    Interface for view to get items either by search parameters of all items.
+    Protocol for models that support retrieving a single item by its ID asynchronously.
     """
-    @abstractmethod
-    def get(self: Any, request: HttpRequest, service: IServiceGetByParams | IServiceGetAll) -> HttpResponse:
+    async def acustom_get_by_id(self: Any, id: str) -> Dict[str, Any]:
         """
-        Get a list of items using the provided service.
+        Retrieves a single item by its id without blocking the event loop.
 
         Parameters
         ----------
-        request : HttpRequest
-            The HTTP request object.
-        service : IServiceGetByParams | IServiceGetAll
-            The service instance.
+        id : str
+            The unique identifier of the item.
 
         Returns
         -------
-        HttpResponse
-            JSON response with the items and HTTP 200 on success,
-            or JSON error message with appropriate HTTP status (e.g., 404, 500).
+        Dict[str, Any]
+            The item as a dictionary.
+
+        Raises
+        ------
+        NotFound
+            If the item is not found.
         """
         ...
 
-class IViewGetById(ABC):
+class IAsyncModelCustomGetItemVersion(Protocol):
     """
-    Interface for view to get an item by its id using a service.
+    Protocol for models that support reading the version of a single item by its ID asynchronously.
     """
-    @abstractmethod
-    def get(self: Any, request: HttpRequest, id: str, service: IServiceGetById) -> HttpResponse:
+    async def acustom_get_item_version(self: Any, id: str) -> int:
         """
-        Get an item by its id using the provided service.
+        Retrieves the version of a single item without blocking the event loop.
 
         Parameters
         ----------
-        request : HttpRequest
-            The HTTP request object.
         id : str
             The unique identifier of the item.
-        service : IServiceGetById
-            The service instance.
 
         Returns
         -------
-        HttpResponse
-            JSON response with the item and HTTP 200 on success,
-            or JSON error message with appropriate HTTP status (e.g., 404, 500).
+        int
+            The version of the item.
+
+        Raises
+        ------
+        NotFound
+            If the item is not found.
         """
         ...
 
-class IViewCreate(ABC):
+class IAsyncModelCustomCreate(Protocol):
     """
-    Interface for view to create a new item using a service.
+    Protocol for models that support creating a new item asynchronously.
     """
-    @abstractmethod
-    def post(self: Any, request: HttpRequest, service: IServiceCreate) -> HttpResponse:
+    async def acustom_create(self: Any, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Create a new item using the provided service.
+        Creates a new item with the given data without blocking the event loop.
 
         Parameters
         ----------
-        request : HttpRequest
-            The HTTP request object.
-        service : IServiceCreate
-            The service instance.
+        data : Dict[str, Any]
+            The data for the new item.
 
         Returns
         -------
-        HttpResponse
-            JSON response with the created item and HTTP 201 on success,
-            or JSON error message with appropriate HTTP status (e.g., 404, 500).
+        Dict[str, Any]
+            The created item as a dictionary.
+
+        Raises
+        ------
+        Exception
+            If creation fails.
         """
         ...
 
-class IViewUpdate(ABC):
+class IAsyncModelCustomUpdate(Protocol):
     """
-    Interface for view to update an item using a service.
+    Protocol for models that support updating an existing item asynchronously.
     """
-    @abstractmethod
-    def put(self: Any, request: HttpRequest, id: str, service: IServiceUpdate) -> HttpResponse:
+    async def acustom_update(self: Any, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
         """
-        Update an item using the provided service.
+        Updates the item with the given data without blocking the event loop.
 
         Parameters
         ----------
-        request : HttpRequest
-            The HTTP request object.
-        id : str
-            The unique identifier of the item.
-        service : IServiceUpdate
-            The service instance.
+        data : Dict[str, Any]
+            The updated data for the item.
+        version : int | None
+            The version of the item the update was made against, or None to update
+            whatever its current version.
 
         Returns
         -------
-        HttpResponse
-            JSON response with the updated item and HTTP 200 on success,
-            or JSON error message with appropriate HTTP status (e.g., 404, 500).
+        Dict[str, Any]
+            The updated item as a dictionary.
+
+        Raises
+        ------
+        NotFound
+            If the item is not found.
+        Conflict
+            If the item is no longer at the given version.
+        """
+        ...
+
+class IAsyncModelCustomPartialUpdate(Protocol):
+    """
+    Protocol for models that support changing some fields of an existing item asynchronously.
+    """
+    async def acustom_partial_update(self: Any, id: str, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
+        """
+        Writes only the given fields of the item, in a single statement, without blocking the event loop.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier of the item.
+        data : Dict[str, Any]
+            The fields to change and their new values.
+        version : int | None
+            The version of the item the change was made against, or None to change
+            whatever its current version.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The identifier and the changed fields of the item as a dictionary.
+
+        Raises
+        ------
+        NotFound
+            If the item is not found.
+        Conflict
+            If the item is no longer at the given version.
+        ValidationError
+            If any field is unknown, read-only or invalid.
+        """
+        ...
+
+class IAsyncModelCustomDelete(Protocol):
+    """
+    Protocol for models that support deleting an item asynchronously.
+    """
+    async def acustom_delete(self: Any, id: str) -> bool:
+        """
+        Deletes the item without blocking the event loop.
+
+        Parameters
+        ----------
+        id : str
+            The unique identifier of the item to delete.
+
+        Returns
+        -------
+        bool
+            True if successful, False otherwise.
+
+        Raises
+        ------
+        NotFound
+            If the item is not found.
+        """
+        ...
+
+###########################################################
+###   Service Interfaces   ################################
+###########################################################
+class IServiceGetAll(ABC):
+    """
+    Interface for service to get all items from a model.
+    """
+    @abstractmethod
+    def get_all(self: Any, model: IModelCustomGetAll, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> Sequence[Mapping[str, Any]]:
+        """
+        Retrieve all items from the model.
+
+        Parameters
+        ----------
+        model : IModelCustomGetAll
+            The model instance.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
+
+        Returns
+        -------
+        Sequence[Mapping[str, Any]]
+            All items as read-only mappings, e.g. the TaskRecord rows of a TaskBatch.
+        """
+        ...
+
+class IServiceIterAll(ABC):
+    """
+    Interface for service to lazily iterate over all items from a model.
+    """
+    @abstractmethod
+    def iter_all(self: Any, model: IModelCustomIterAll, chunk_size: int, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all items from the model.
+
+        Parameters
+        ----------
+        model : IModelCustomIterAll
+            The model instance.
+        chunk_size : int
+            The number of rows fetched from the database at a time.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
+
+        Returns
+        -------
+        Iterator[Dict[str, Any]]
+            All items as dictionaries.
+        """
+        ...
+
+class IServiceGetPage(ABC):
+    """
+    Interface for service to get a page of items from a model.
+    """
+    @abstractmethod
+    def get_page(self: Any, model: IModelCustomGetPage, limit: int, cursor: str | None = None, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> Dict[str, Any]:
+        """
+        Retrieve a page of items from the model.
+
+        Parameters
+        ----------
+        model : IModelCustomGetPage
+            The model instance.
+        limit : int
+            The maximum number of items in the page.
+        cursor : str | None
+            The opaque cursor returned with the previous page, or None for the first page.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The page as a dictionary with the "items" sequence of read-only mappings
+            (e.g. a TaskBatch) and the "next" cursor.
+        """
+        ...
+
+class IServiceGetByParams(ABC):
+    """
+    Interface for service to get items by given params.
+    """
+    @abstractmethod
+    def get_by_params(self: Any, model: IModelCustomGetByParams, param: str, limit: int | None = None, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> List[Dict[str, Any]]:
+        """
+        Retrieve items by given params from the model.
+
+        Parameters
+        ----------
+        model : IModelCustomGetByParams
+            The model instance.
+        param : str
+            The filter parameters.
+        limit : int | None
+            The maximum number of items to return, or None for the default search limit.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Filtered items as dictionaries.
+        """
+        ...
+
+class IServiceGetById(ABC):
+    """
+    Interface for service to get an item by its id.
+    """
+    @abstractmethod
+    def get_by_id(self: Any, model: IModelCustomGetById, id: str) -> Dict[str, Any]:
+        """
+        Retrieve an item by its id from the model.
+
+        Parameters
+        ----------
+        model : IModelCustomGetById
+            The model instance.
+        id : str
+            The unique identifier of the item.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The item as a dictionary.
+        """
+        ...
+
+class IServiceGetItemVersion(ABC):
+    """
+    Interface for service to get the version of an item by its id, used as HTTP validator.
+    """
+    @abstractmethod
+    def get_item_version(self: Any, model: IModelCustomGetItemVersion, id: str) -> int:
+        """
+        Retrieve the version of an item by its id from the model.
+
+        Parameters
+        ----------
+        model : IModelCustomGetItemVersion
+            The model instance.
+        id : str
+            The unique identifier of the item.
+
+        Returns
+        -------
+        int
+            The version of the item.
+        """
+        ...
+
+class IServiceCreate(ABC):
+    """
+    Interface for service to create a new item.
+    """
+    @abstractmethod
+    def create(self: Any, model: IModelCustomCreate, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new item in the model.
+
+        Parameters
+        ----------
+        model : IModelCustomCreate
+            The model instance.
+        data : Dict[str, Any]
+            The data for the new item.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The created item as a dictionary.
+        """
+        ...
+
+class IServiceBulkCreate(ABC):
+    """
+    Interface for service to create many items at once.
+    """
+    @abstractmethod
+    def bulk_create(self: Any, model: IModelCustomBulkCreate, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create many items in the model, all or none of them.
+
+        Parameters
+        ----------
+        model : IModelCustomBulkCreate
+            The model instance.
+        items : List[Dict[str, Any]]
+            The data for the new items.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The created items as dictionaries, in the order of the given data.
+        """
+        ...
+
+class IServiceBulkUpsert(ABC):
+    """
+    Interface for service to create or update many items by external reference.
+    """
+    @abstractmethod
+    def bulk_upsert(self: Any, model: IModelCustomBulkUpsert, items: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Create or update many items in the model by external reference, all or none of them.
+
+        Parameters
+        ----------
+        model : IModelCustomBulkUpsert
+            The model instance.
+        items : List[Dict[str, Any]]
+            The data of the items, each with a distinct "external_ref".
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of items "created" and "updated".
+        """
+        ...
+
+class IServiceUpdate(ABC):
+    """
+    Interface for service to update an item.
+    """
+    @abstractmethod
+    def update(self: Any, model: IModelCustomUpdate, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
+        """
+        Update an item in the model.
+
+        Parameters
+        ----------
+        model : IModelCustomUpdate
+            The model instance.
+        data : Dict[str, Any]
+            The updated data for the item.
+        version : int | None
+            The version of the item the update was made against, if any.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The updated item as a dictionary.
+        """
+        ...
+
+class IServicePartialUpdate(ABC):
+    """
+    Interface for service to change some fields of an item.
+    """
+    @abstractmethod
+    def partial_update(self: Any, model: IModelCustomPartialUpdate, id: str, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
+        """
+        Change some fields of an item in the model.
+
+        Parameters
+        ----------
+        model : IModelCustomPartialUpdate
+            The model instance.
+        id : str
+            The unique identifier of the item.
+        data : Dict[str, Any]
+            The fields to change and their new values.
+        version : int | None
+            The version of the item the change was made against, if any.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The identifier and the changed fields of the item as a dictionary.
+        """
+        ...
+
+class IServiceDelete(ABC):
+    """
+    Interface for service to delete an item.
+    """
+    @abstractmethod
+    def delete(self: Any, model: IModelCustomDelete, id: str) -> bool:
+        """
+        Delete an item from the model by id.
+
+        Parameters
+        ----------
+        model : IModelCustomDelete
+            The model instance.
+        id : str
+            The unique identifier of the item to delete.
+
+        Returns
+        -------
+        bool
+            True if successful, False otherwise.
+        """
+        ...
+
+class IServiceBatch(ABC):
+    """
+    Interface for service to apply many update and delete operations at once.
+    """
+    @abstractmethod
+    def batch(self: Any, model: IModelCustomBatch, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Apply the update and delete operations in the model within one transaction.
+
+        Parameters
+        ----------
+        model : IModelCustomBatch
+            The model instance.
+        operations : List[Dict[str, Any]]
+            The update and delete operations.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The status of each operation, in the order of the given operations.
+        """
+        ...
+
+class IServiceTransition(ABC):
+    """
+    Interface for service to move every item matching filters to a status.
+    """
+    @abstractmethod
+    def transition(self: Any, model: IModelCustomTransition, filters: Dict[str, Any], status: str) -> int:
+        """
+        Move the matching items of the model to the status.
+
+        Parameters
+        ----------
+        model : IModelCustomTransition
+            The model instance.
+        filters : Dict[str, Any]
+            Structured filters selecting the items.
+        status : str
+            The status to move the items to.
+
+        Returns
+        -------
+        int
+            The number of items moved.
+        """
+        ...
+
+class IServiceGetMeta(ABC):
+    """
+    Interface for service to get the metadata shared by all items of a model.
+    """
+    @abstractmethod
+    def get_meta(self: Any, model: IModelCustomGetMeta) -> Dict[str, Any]:
+        """
+        Retrieve the metadata shared by all items of the model.
+
+        Parameters
+        ----------
+        model : IModelCustomGetMeta
+            The model instance.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The metadata as a dictionary, including its "version".
+        """
+        ...
+
+class IServiceGetStats(ABC):
+    """
+    Interface for service to report its runtime statistics.
+    """
+    @abstractmethod
+    def get_stats(self: Any) -> Dict[str, Any]:
+        """
+        Retrieve the runtime statistics of the service, such as cache counters.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The statistics as a dictionary, empty when the service keeps none.
+        """
+        ...
+
+class IServiceGetVersion(ABC):
+    """
+    Interface for service to report the version of its collection, used as HTTP validator.
+    """
+    @abstractmethod
+    def get_version(self: Any) -> Tuple[str, datetime]:
+        """
+        Retrieve the current version of the collection, which changes on every write.
+
+        Returns
+        -------
+        Tuple[str, datetime]
+            The opaque version token and the time of the last write, in UTC.
+        """
+        ...
+
+# --- Asynchronous counterparts, awaited by the views served under ASGI ---
+
+class IAsyncServiceGetAll(ABC):
+    """
+    Interface for service to get all items from a model asynchronously.
+    """
+    @abstractmethod
+    async def aget_all(self: Any, model: IAsyncModelCustomGetAll, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> Sequence[Mapping[str, Any]]:
+        """
+        Retrieve all items from the model without blocking the event loop.
+
+        Parameters
+        ----------
+        model : IAsyncModelCustomGetAll
+            The model instance.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
+
+        Returns
+        -------
+        Sequence[Mapping[str, Any]]
+            All items as read-only mappings, e.g. the TaskRecord rows of a TaskBatch.
+        """
+        ...
+
+class IAsyncServiceIterAll(ABC):
+    """
+    Interface for service to asynchronously iterate over all items from a model.
+    """
+    @abstractmethod
+    def aiter_all(self: Any, model: IAsyncModelCustomIterAll, chunk_size: int, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate asynchronously over all items from the model.
+
+        Parameters
+        ----------
+        model : IAsyncModelCustomIterAll
+            The model instance.
+        chunk_size : int
+            The number of rows fetched from the database at a time.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
+
+        Returns
+        -------
+        AsyncIterator[Dict[str, Any]]
+            All items as dictionaries.
+        """
+        ...
+
+class IAsyncServiceGetPage(ABC):
+    """
+    Interface for service to get a page of items from a model asynchronously.
+    """
+    @abstractmethod
+    async def aget_page(self: Any, model: IAsyncModelCustomGetPage, limit: int, cursor: str | None = None, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> Dict[str, Any]:
+        """
+        Retrieve a page of items from the model without blocking the event loop.
+
+        Parameters
+        ----------
+        model : IAsyncModelCustomGetPage
+            The model instance.
+        limit : int
+            The maximum number of items in the page.
+        cursor : str | None
+            The opaque cursor returned with the previous page, or None for the first page.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The page as a dictionary with the "items" sequence of read-only mappings
+            (e.g. a TaskBatch) and the "next" cursor.
+        """
+        ...
+
+class IAsyncServiceGetByParams(ABC):
+    """
+    Interface for service to get items by given params asynchronously.
+    """
+    @abstractmethod
+    async def aget_by_params(self: Any, model: IModelCustomGetByParams, param: str, limit: int | None = None, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> List[Dict[str, Any]]:
+        """
+        Retrieve items by given params from the model without blocking the event loop.
+
+        Parameters
+        ----------
+        model : IModelCustomGetByParams
+            The model instance.
+        param : str
+            The filter parameters.
+        limit : int | None
+            The maximum number of items to return, or None for the default search limit.
+        filters : Dict[str, Any] | None
+            Structured filters (status, priority, start_after, start_before, end_before), or None.
+        fields : List[str] | None
+            The fields to include in each item, or None for the summary fields.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Filtered items as dictionaries.
+        """
+        ...
+
+class IAsyncServiceGetById(ABC):
+    """
+    Interface for service to get an item by its id asynchronously.
+    """
+    @abstractmethod
+    async def aget_by_id(self: Any, model: IAsyncModelCustomGetById, id: str) -> Dict[str, Any]:
+        """
+        Retrieve an item by its id from the model without blocking the event loop.
+
+        Parameters
+        ----------
+        model : IAsyncModelCustomGetById
+            The model instance.
+        id : str
+            The unique identifier of the item.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The item as a dictionary.
+        """
+        ...
+
+class IAsyncServiceGetItemVersion(ABC):
+    """
+    Interface for service to get the version of an item by its id asynchronously.
+    """
+    @abstractmethod
+    async def aget_item_version(self: Any, model: IAsyncModelCustomGetItemVersion, id: str) -> int:
+        """
+        Retrieve the version of an item by its id from the model without blocking the event loop.
+
+        Parameters
+        ----------
+        model : IAsyncModelCustomGetItemVersion
+            The model instance.
+        id : str
+            The unique identifier of the item.
+
+        Returns
+        -------
+        int
+            The version of the item.
+        """
+        ...
+
+class IAsyncServiceCreate(ABC):
+    """
+    Interface for service to create a new item asynchronously.
+    """
+    @abstractmethod
+    async def acreate(self: Any, model: IAsyncModelCustomCreate, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new item in the model without blocking the event loop.
+
+        Parameters
+        ----------
+        model : IAsyncModelCustomCreate
+            The model instance.
+        data : Dict[str, Any]
+            The data for the new item.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The created item as a dictionary.
+        """
+        ...
+
+class IAsyncServiceUpdate(ABC):
+    """
+    Interface for service to update an item asynchronously.
+    """
+    @abstractmethod
+    async def aupdate(self: Any, model: IAsyncModelCustomUpdate, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
+        """
+        Update an item in the model without blocking the event loop.
+
+        Parameters
+        ----------
+        model : IAsyncModelCustomUpdate
+            The model instance.
+        data : Dict[str, Any]
+            The updated data for the item.
+        version : int | None
+            The version of the item the update was made against, if any.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The updated item as a dictionary.
+        """
+        ...
+
+class IAsyncServicePartialUpdate(ABC):
+    """
+    Interface for service to change some fields of an item asynchronously.
+    """
+    @abstractmethod
+    async def apartial_update(self: Any, model: IAsyncModelCustomPartialUpdate, id: str, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
+        """
+        Change some fields of an item in the model without blocking the event loop.
+
+        Parameters
+        ----------
+        model : IAsyncModelCustomPartialUpdate
+            The model instance.
+        id : str
+            The unique identifier of the item.
+        data : Dict[str, Any]
+            The fields to change and their new values.
+        version : int | None
+            The version of the item the change was made against, if any.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The identifier and the changed fields of the item as a dictionary.
+        """
+        ...
+
+class IAsyncServiceDelete(ABC):
+    """
+    Interface for service to delete an item asynchronously.
+    """
+    @abstractmethod
+    async def adelete(self: Any, model: IAsyncModelCustomDelete, id: str) -> bool:
+        """
+        Delete an item from the model by id without blocking the event loop.
+
+        Parameters
+        ----------
+        model : IAsyncModelCustomDelete
+            The model instance.
+        id : str
+            The unique identifier of the item to delete.
+
+        Returns
+        -------
+        bool
+            True if successful, False otherwise.
+        """
+        ...
+
+class IAsyncServiceGetVersion(ABC):
+    """
+    Interface for service to report the version of its collection asynchronously, used as HTTP validator.
+    """
+    @abstractmethod
+    async def aget_version(self: Any) -> Tuple[str, datetime]:
+        """
+        Retrieve the current version of the collection without blocking the event loop.
+
+        Returns
+        -------
+        Tuple[str, datetime]
+            The opaque version token and the time of the last write, in UTC.
+        """
+        ...
+
+###########################################################
+###   View Interfaces   ###################################
+###########################################################
+class IViewGetList(ABC):
+    """
+    Interface for view to get items either by search parameters of all items.
+    """
+    @abstractmethod
+    def get(self: Any, request: HttpRequest, service: IServiceGetByParams | IServiceGetAll | IServiceGetPage | IServiceIterAll) -> HttpResponse:
+        """
+        Get a list of items using the provided service.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        service : IServiceGetByParams | IServiceGetAll | IServiceGetPage | IServiceIterAll
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the items and HTTP 200 on success,
+            or JSON error message with appropriate HTTP status (e.g., 404, 500).
+        """
+        ...
+
+class IViewGetById(ABC):
+    """
+    Interface for view to get an item by its id using a service.
+    """
+    @abstractmethod
+    def get(self: Any, request: HttpRequest, id: str, service: IServiceGetById) -> HttpResponse:
+        """
+        Get an item by its id using the provided service.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        id : str
+            The unique identifier of the item.
+        service : IServiceGetById
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the item and HTTP 200 on success,
+            or JSON error message with appropriate HTTP status (e.g., 404, 500).
+        """
+        ...
+
+class IViewCreate(ABC):
+    """
+    Interface for view to create a new item using a service.
+    """
+    @abstractmethod
+    def post(self: Any, request: HttpRequest, service: IServiceCreate) -> HttpResponse:
+        """
+        Create a new item using the provided service.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        service : IServiceCreate
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the created item and HTTP 201 on success,
+            or JSON error message with appropriate HTTP status (e.g., 404, 500).
+        """
+        ...
+
+class IViewBulkCreate(ABC):
+    """
+    Interface for view to create many items in one request using a service.
+    """
+    @abstractmethod
+    def post(self: Any, request: HttpRequest, service: IServiceBulkCreate) -> HttpResponse:
+        """
+        Create the array of items in the request body using the provided service.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        service : IServiceBulkCreate
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the per-item results and HTTP 201 on success,
+            or JSON error message with the per-item errors and HTTP 400.
+        """
+        ...
+
+class IViewBulkUpsert(ABC):
+    """
+    Interface for view to create or update many items by external reference in one request using a service.
+    """
+    @abstractmethod
+    def post(self: Any, request: HttpRequest, service: IServiceBulkUpsert) -> HttpResponse:
+        """
+        Create or update the array of items in the request body using the provided service.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        service : IServiceBulkUpsert
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the number of items created and updated and HTTP 200 on
+            success, or JSON error message with the per-item errors and HTTP 400.
+        """
+        ...
+
+class IViewUpdate(ABC):
+    """
+    Interface for view to update an item using a service.
+    """
+    @abstractmethod
+    def put(self: Any, request: HttpRequest, id: str, service: IServiceUpdate) -> HttpResponse:
+        """
+        Update an item using the provided service.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        id : str
+            The unique identifier of the item.
+        service : IServiceUpdate
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the updated item and HTTP 200 on success,
+            or JSON error message with appropriate HTTP status (e.g., 404, 409, 500).
+        """
+        ...
+
+class IViewPartialUpdate(ABC):
+    """
+    Interface for view to change some fields of an item using a service.
+    """
+    @abstractmethod
+    def patch(self: Any, request: HttpRequest, id: str, service: IServicePartialUpdate) -> HttpResponse:
+        """
+        Change the fields of an item given in the request body using the provided service.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        id : str
+            The unique identifier of the item.
+        service : IServicePartialUpdate
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the changed fields and HTTP 200 on success,
+            or JSON error message with appropriate HTTP status (e.g., 400, 404, 409, 500).
         """
         ...
 
@@ -413,29 +1534,373 @@ class IViewDelete(ABC):
         """
         ...
 
+class IViewBatch(ABC):
+    """
+    Interface for view to apply many update and delete operations in one request using a service.
+    """
+    @abstractmethod
+    def post(self: Any, request: HttpRequest, service: IServiceBatch) -> HttpResponse:
+        """
+        Apply the array of operations in the request body using the provided service.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        service : IServiceBatch
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the per-operation status and HTTP 200 on success,
+            or JSON error message with the per-operation errors and HTTP 400.
+        """
+        ...
+
+class IViewTransition(ABC):
+    """
+    Interface for view to move every item matching the list filters to a status using a service.
+    """
+    @abstractmethod
+    def post(self: Any, request: HttpRequest, service: IServiceTransition) -> HttpResponse:
+        """
+        Move the items selected by the query parameters to the status in the request body.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        service : IServiceTransition
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the number of items moved and HTTP 200 on success,
+            or JSON error message with appropriate HTTP status (e.g., 400, 500).
+        """
+        ...
+
+class IViewGetMeta(ABC):
+    """
+    Interface for view to get the metadata shared by all items using a service.
+    """
+    @abstractmethod
+    def get(self: Any, request: HttpRequest, service: IServiceGetMeta) -> HttpResponse:
+        """
+        Get the metadata shared by all items using the provided service.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        service : IServiceGetMeta
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            Cacheable JSON response with the metadata and HTTP 200 on success,
+            HTTP 304 when the client copy is current, or JSON error message with
+            appropriate HTTP status (e.g., 500).
+        """
+        ...
+
+class IViewGetStats(ABC):
+    """
+    Interface for view to get the runtime statistics of a service.
+    """
+    @abstractmethod
+    def get(self: Any, request: HttpRequest, service: IServiceGetStats) -> HttpResponse:
+        """
+        Get the runtime statistics of the provided service.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        service : IServiceGetStats
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the statistics and HTTP 200 on success,
+            or JSON error message with appropriate HTTP status (e.g., 500).
+        """
+        ...
+
+# --- Asynchronous counterparts, served under ASGI ---
+
+class IAsyncViewGetList(ABC):
+    """
+    Interface for asynchronous view to get items either by search parameters of all items.
+    """
+    @abstractmethod
+    async def get(self: Any, request: HttpRequest, service: IAsyncServiceGetByParams | IAsyncServiceGetAll | IAsyncServiceGetPage | IAsyncServiceIterAll) -> HttpResponse:
+        """
+        Get a list of items using the provided service, without blocking the event loop.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        service : IAsyncServiceGetByParams | IAsyncServiceGetAll | IAsyncServiceGetPage | IAsyncServiceIterAll
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the items and HTTP 200 on success,
+            or JSON error message with appropriate HTTP status (e.g., 404, 500).
+        """
+        ...
+
+class IAsyncViewGetById(ABC):
+    """
+    Interface for asynchronous view to get an item by its id using a service.
+    """
+    @abstractmethod
+    async def get(self: Any, request: HttpRequest, id: str, service: IAsyncServiceGetById) -> HttpResponse:
+        """
+        Get an item by its id using the provided service, without blocking the event loop.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        id : str
+            The unique identifier of the item.
+        service : IAsyncServiceGetById
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the item and HTTP 200 on success,
+            or JSON error message with appropriate HTTP status (e.g., 404, 500).
+        """
+        ...
+
+class IAsyncViewCreate(ABC):
+    """
+    Interface for asynchronous view to create a new item using a service.
+    """
+    @abstractmethod
+    async def post(self: Any, request: HttpRequest, service: IAsyncServiceCreate) -> HttpResponse:
+        """
+        Create a new item using the provided service, without blocking the event loop.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        service : IAsyncServiceCreate
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the created item and HTTP 201 on success,
+            or JSON error message with appropriate HTTP status (e.g., 400, 500).
+        """
+        ...
+
+class IAsyncViewUpdate(ABC):
+    """
+    Interface for asynchronous view to update an item using a service.
+    """
+    @abstractmethod
+    async def put(self: Any, request: HttpRequest, id: str, service: IAsyncServiceUpdate) -> HttpResponse:
+        """
+        Update an item using the provided service, without blocking the event loop.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        id : str
+            The unique identifier of the item.
+        service : IAsyncServiceUpdate
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the updated item and HTTP 200 on success,
+            or JSON error message with appropriate HTTP status (e.g., 404, 409, 500).
+        """
+        ...
+
+class IAsyncViewPartialUpdate(ABC):
+    """
+    Interface for asynchronous view to change some fields of an item using a service.
+    """
+    @abstractmethod
+    async def patch(self: Any, request: HttpRequest, id: str, service: IAsyncServicePartialUpdate) -> HttpResponse:
+        """
+        Change the fields of an item given in the request body using the provided service,
+        without blocking the event loop.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        id : str
+            The unique identifier of the item.
+        service : IAsyncServicePartialUpdate
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with the changed fields and HTTP 200 on success,
+            or JSON error message with appropriate HTTP status (e.g., 400, 404, 409, 500).
+        """
+        ...
+
+class IAsyncViewDelete(ABC):
+    """
+    Interface for asynchronous view to delete an item using a service.
+    """
+    @abstractmethod
+    async def delete(self: Any, request: HttpRequest, id: str, service: IAsyncServiceDelete) -> HttpResponse:
+        """
+        Delete an item using the provided service, without blocking the event loop.
+
+        Parameters
+        ----------
+        request : HttpRequest
+            The HTTP request object.
+        id : str
+            The unique identifier of the item.
+        service : IAsyncServiceDelete
+            The service instance.
+
+        Returns
+        -------
+        HttpResponse
+            JSON response with success message and HTTP 204 on success,
+            or JSON error message with appropriate HTTP status (e.g., 404, 500).
+        """
+        ...
+
 ###########################################################
-###   Helper Interfaces   #################################
+###   Search Interfaces   #################################
 ###########################################################
-class IHelperDatetimeToIso(Protocol):
+class ISearchBackend(ABC):
+    """
+    Interface for full-text search backends used to filter items by a search string.
+    """
+    @abstractmethod
+    def search(self: Any, queryset: Any, params: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Retrieve the items of the queryset matching the search string, best matches first.
+
+        Parameters
+        ----------
+        queryset : QuerySet
+            The values() queryset to search in.
+        params : str
+            The search string.
+        limit : int
+            The maximum number of items to return.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Matching items as dictionaries, ranked by relevance.
+        """
+        ...
+
+class IRenderer(ABC):
+    """
+    Interface for renderers encoding response payloads into one media type.
+    """
+    media_type: str
+
+    @abstractmethod
+    def is_available(self: Any) -> bool:
+        """
+        Tell whether the renderer can be used, e.g. whether its encoder is installed.
+
+        Returns
+        -------
+        bool
+            True when the renderer can encode payloads.
+        """
+        ...
+
+    @abstractmethod
+    def render(self: Any, data: Any) -> bytes:
+        """
+        Encode a payload into the media type of the renderer.
+
+        Parameters
+        ----------
+        data : Any
+            The payload: dictionaries, lists, TaskBatch and TaskRecord values, UUIDs and datetimes.
+
+        Returns
+        -------
+        bytes
+            The encoded payload.
+        """
+        ...
+
+class ICompressor(ABC):
     """
-    Protocol for classes that can convert a datetime object to an ISO 8601 string.
+    Interface for the content codings a response body can be compressed with.
     """
-    def datetimetoiso(self: Any, dt: datetime) -> str:
+    encoding: str
+
+    @abstractmethod
+    def is_available(self: Any) -> bool:
+        """
+        Tell whether the compressor can be used, e.g. whether its library is installed.
+
+        Returns
+        -------
+        bool
+            True when the compressor can compress bodies.
+        """
+        ...
+
+    @abstractmethod
+    def compress(self: Any, data: bytes) -> bytes:
         """
-        Converts a datetime object to an ISO 8601 formatted string.
+        Compress a whole response body.
 
         Parameters
         ----------
-        dt : datetime
-            The datetime object to convert.
+        data : bytes
+            The body to compress.
+
+        Returns
+        -------
+        bytes
+            The compressed body.
+        """
+        ...
+
+    @abstractmethod
+    def open_stream(self: Any) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+        """
+        Start compressing a streamed response body chunk by chunk.
 
         Returns
         -------
-        str
-            The ISO 8601 formatted string.
+        Tuple[Callable[[bytes], bytes], Callable[[], bytes]]
+            A function compressing the next chunk and flushing it, so that the client
+            can decompress each chunk as soon as it arrives, and a function returning
+            the end of the compressed stream.
         """
         ...
 
+###########################################################
+###   Helper Interfaces   #################################
+###########################################################
 class IHelperIsoToDatetime(ABC):
     """
     Interface for classes that can convert an ISO string into a datetime.
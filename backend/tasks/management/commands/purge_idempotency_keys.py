@@ -0,0 +1,13 @@
+from typing import Any
+from django.core.management.base import BaseCommand
+from tasks.idempotency import IDEMPOTENCY_STORE
+
+
+class Command(BaseCommand):
+    """
+    Delete the idempotency keys older than TASKS_IDEMPOTENCY_TTL, e.g. from a daily cron job.
+    """
+    help = "Delete the expired idempotency keys."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.stdout.write(f"{IDEMPOTENCY_STORE.purge()} expired idempotency keys deleted")
@@ -0,0 +1,36 @@
+import sys, json
+from typing import Any
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from tasks.exceptions import InvalidItems
+from tasks.models import Task
+from tasks.services import TaskService
+
+
+class Command(BaseCommand):
+    """
+    Create or update tasks by external reference from a JSON array, e.g. an export
+    of an upstream tracker, in batches of TASKS_BULK_BATCH_SIZE rows per statement.
+    """
+    help = "Create or update tasks by external_ref from a JSON array file ('-' for stdin)."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", help="JSON file holding an array of tasks, each with an external_ref")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            if options["path"] == "-":
+                items = json.load(sys.stdin)
+            else:
+                with open(options["path"], encoding="utf-8") as source:
+                    items = json.load(source)
+        except (OSError, ValueError) as err:
+            raise CommandError(f"Cannot read tasks: {err}")
+        if not isinstance(items, list):
+            raise CommandError("Expected a JSON array of tasks")
+        try:
+            counts = TaskService().bulk_upsert(Task(), items)
+        except InvalidItems as err:
+            for index, errors in err.errors.items():
+                self.stderr.write(f"item {index}: {json.dumps(errors)}")
+            raise CommandError(str(err))
+        self.stdout.write(f"{counts['created']} tasks created, {counts['updated']} tasks updated")
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.6 on 2026-10-17 17:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['-start_time', 'priority', 'status', 'task_id'], name='task_list_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', '-start_time', 'priority', 'task_id'], name='task_status_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['priority', '-start_time', 'status', 'task_id'], name='task_priority_order_idx'),
+        ),
+    ]
@@ -0,0 +1,94 @@
+from django.db import migrations, OperationalError
+
+# The search structures are created with plain SQL kept here, so that this migration
+# does not change with tasks.search.
+#
+# On SQLite, titles are copied by triggers to tasks_task_search, keyed on task_id and
+# serving as the external content of the FTS5 trigram table tasks_task_fts, which also
+# stores task_id to be joined on it. Neither depends on the rowids of tasks_task, so
+# they survive SQLite rebuilding that table; only the triggers, dropped with the old
+# table, must be recreated by the migrations that rebuild it.
+
+POSTGRESQL_INSTALL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS task_title_trgm_idx ON tasks_task USING gin (UPPER(title) gin_trgm_ops)",
+]
+
+POSTGRESQL_UNINSTALL = [
+    "DROP INDEX IF EXISTS task_title_trgm_idx",
+]
+
+SQLITE_INSTALL = [
+    "CREATE TABLE tasks_task_search (id integer NOT NULL PRIMARY KEY, task_id char(32) NOT NULL UNIQUE, title varchar(50) NOT NULL)",
+    "CREATE VIRTUAL TABLE tasks_task_fts USING fts5("
+    "task_id UNINDEXED, title, content='tasks_task_search', content_rowid='id', tokenize='trigram')",
+    "INSERT INTO tasks_task_search (task_id, title) SELECT task_id, title FROM tasks_task",
+    "INSERT INTO tasks_task_fts (tasks_task_fts) VALUES ('rebuild')",
+]
+
+SQLITE_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS tasks_task_fts_insert AFTER INSERT ON tasks_task BEGIN "
+    "INSERT INTO tasks_task_search (task_id, title) VALUES (new.task_id, new.title); "
+    "INSERT INTO tasks_task_fts (rowid, task_id, title) "
+    "SELECT id, task_id, title FROM tasks_task_search WHERE task_id = new.task_id; END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_task_fts_update AFTER UPDATE OF title ON tasks_task BEGIN "
+    "INSERT INTO tasks_task_fts (tasks_task_fts, rowid, task_id, title) "
+    "SELECT 'delete', id, task_id, title FROM tasks_task_search WHERE task_id = old.task_id; "
+    "UPDATE tasks_task_search SET title = new.title WHERE task_id = old.task_id; "
+    "INSERT INTO tasks_task_fts (rowid, task_id, title) "
+    "SELECT id, task_id, title FROM tasks_task_search WHERE task_id = old.task_id; END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_task_fts_delete AFTER DELETE ON tasks_task BEGIN "
+    "INSERT INTO tasks_task_fts (tasks_task_fts, rowid, task_id, title) "
+    "SELECT 'delete', id, task_id, title FROM tasks_task_search WHERE task_id = old.task_id; "
+    "DELETE FROM tasks_task_search WHERE task_id = old.task_id; END",
+]
+
+SQLITE_UNINSTALL = [
+    "DROP TRIGGER IF EXISTS tasks_task_fts_insert",
+    "DROP TRIGGER IF EXISTS tasks_task_fts_update",
+    "DROP TRIGGER IF EXISTS tasks_task_fts_delete",
+    "DROP TABLE IF EXISTS tasks_task_fts",
+    "DROP TABLE IF EXISTS tasks_task_search",
+]
+
+
+def install_search(apps, schema_editor):
+    """
+    Creates the search structures for the current database: the pg_trgm GIN index
+    on PostgreSQL, the FTS5 table, its content table and triggers on SQLite.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        for sql in POSTGRESQL_INSTALL:
+            schema_editor.execute(sql)
+    elif vendor == "sqlite":
+        try:
+            for sql in [*SQLITE_INSTALL, *SQLITE_TRIGGERS]:
+                schema_editor.execute(sql)
+        except OperationalError:
+            # SQLite built without FTS5 or the trigram tokenizer (< 3.34): searches fall back to LIKE.
+            uninstall_search(apps, schema_editor)
+
+
+def uninstall_search(apps, schema_editor):
+    """
+    Drops the search structures created by install_search.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        for sql in POSTGRESQL_UNINSTALL:
+            schema_editor.execute(sql)
+    elif vendor == "sqlite":
+        for sql in SQLITE_UNINSTALL:
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_task_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search, uninstall_search),
+    ]
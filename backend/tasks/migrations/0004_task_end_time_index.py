@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-17 17:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_task_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['end_time'], name='task_end_time_idx'),
+        ),
+    ]
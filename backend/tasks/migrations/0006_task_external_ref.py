@@ -0,0 +1,51 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:02
+
+from django.db import migrations, models
+
+# Adding the field makes SQLite rebuild tasks_task, dropping the triggers that fill the
+# search tables of 0003_task_search; they are recreated from this copy of their SQL.
+
+SQLITE_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS tasks_task_fts_insert AFTER INSERT ON tasks_task BEGIN "
+    "INSERT INTO tasks_task_search (task_id, title) VALUES (new.task_id, new.title); "
+    "INSERT INTO tasks_task_fts (rowid, task_id, title) "
+    "SELECT id, task_id, title FROM tasks_task_search WHERE task_id = new.task_id; END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_task_fts_update AFTER UPDATE OF title ON tasks_task BEGIN "
+    "INSERT INTO tasks_task_fts (tasks_task_fts, rowid, task_id, title) "
+    "SELECT 'delete', id, task_id, title FROM tasks_task_search WHERE task_id = old.task_id; "
+    "UPDATE tasks_task_search SET title = new.title WHERE task_id = old.task_id; "
+    "INSERT INTO tasks_task_fts (rowid, task_id, title) "
+    "SELECT id, task_id, title FROM tasks_task_search WHERE task_id = old.task_id; END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_task_fts_delete AFTER DELETE ON tasks_task BEGIN "
+    "INSERT INTO tasks_task_fts (tasks_task_fts, rowid, task_id, title) "
+    "SELECT 'delete', id, task_id, title FROM tasks_task_search WHERE task_id = old.task_id; "
+    "DELETE FROM tasks_task_search WHERE task_id = old.task_id; END",
+]
+
+
+def recreate_search_triggers(apps, schema_editor):
+    """
+    Recreates the triggers filling the SQLite search tables after tasks_task was
+    rebuilt. Does nothing on other databases, or when SQLite lacks the search tables.
+    """
+    connection = schema_editor.connection
+    if connection.vendor == "sqlite" and "tasks_task_search" in connection.introspection.table_names():
+        for sql in SQLITE_TRIGGERS:
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, recreate_search_triggers),
+        migrations.AddField(
+            model_name='task',
+            name='external_ref',
+            field=models.CharField(blank=True, max_length=100, null=True, unique=True, verbose_name='External reference'),
+        ),
+        migrations.RunPython(recreate_search_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_task_external_ref'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('key', models.CharField(max_length=64, primary_key=True, serialize=False, verbose_name='Key digest')),
+                ('request_hash', models.CharField(max_length=64, verbose_name='Request digest')),
+                ('status', models.PositiveSmallIntegerField(null=True, verbose_name='Response status')),
+                ('response', models.BinaryField(null=True, verbose_name='Response body')),
+                ('created_at', models.DateTimeField(db_index=True, verbose_name='Created at')),
+            ],
+            options={
+                'verbose_name': 'Idempotency key',
+                'verbose_name_plural': 'Idempotency keys',
+            },
+        ),
+    ]
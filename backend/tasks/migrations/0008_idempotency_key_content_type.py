@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-17 18:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='idempotencykey',
+            name='content_type',
+            field=models.CharField(default='application/json', max_length=100, verbose_name='Response content type'),
+        ),
+    ]
@@ -1,9 +1,15 @@
-import uuid
-from typing import Any, List, Dict
+import uuid, json, base64, hashlib
+from typing import Any, AsyncIterator, List, Dict, Iterator, Tuple
 from datetime import datetime
-from django.db import models, transaction
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import models, transaction, connections
 from django.db.models import Q
-from .exceptions import NotFound
+from django.core.exceptions import ValidationError
+from .exceptions import NotFound, InvalidCursor, InvalidItems, Conflict
+from .search import get_search_backend
+from .records import TaskBatch
+from .serializers import RowSerializer, get_serializer
 
 
 class Task(models.Model):
@@ -12,11 +18,29 @@ class Task(models.Model):
 
     Implements:
         - IModelCustomGetAll
+        - IModelCustomIterAll
+        - IModelCustomGetPage
         - IModelCustomGetByParams
         - IModelCustomGetById
+        - IModelCustomGetItemVersion
         - IModelCustomCreate
+        - IModelCustomBulkCreate
+        - IModelCustomBulkUpsert
         - IModelCustomUpdate
+        - IModelCustomPartialUpdate
         - IModelCustomDelete
+        - IModelCustomBatch
+        - IModelCustomTransition
+        - IModelCustomGetMeta
+        - IAsyncModelCustomGetAll
+        - IAsyncModelCustomIterAll
+        - IAsyncModelCustomGetPage
+        - IAsyncModelCustomGetById
+        - IAsyncModelCustomGetItemVersion
+        - IAsyncModelCustomCreate
+        - IAsyncModelCustomUpdate
+        - IAsyncModelCustomPartialUpdate
+        - IAsyncModelCustomDelete
     """
     task_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField('task title', max_length=50)
@@ -27,6 +51,19 @@ class Task(models.Model):
     priority = models.CharField('Priority level', max_length=6, choices=PRIORITY_CHOICES, default='LOW')
     STATUS_CHOICES = { 'TODO': 'Todo', 'DOING': 'Doing', 'DONE': 'Done' }
     status = models.CharField('Task status', max_length=5, choices=STATUS_CHOICES, default='TODO')
+    version = models.PositiveIntegerField('Version', default=1, editable=False)
+    external_ref = models.CharField('External reference', max_length=100, unique=True, null=True, blank=True)
+    KEYSET_ORDERING = ['-start_time', 'priority', 'status', 'task_id']
+    SUMMARY_FIELDS = ['task_id', 'title', 'start_time', 'end_time', 'priority', 'status', 'version', 'external_ref']
+    DETAIL_FIELDS = ['task_id', 'title', 'description', 'start_time', 'end_time', 'priority', 'status', 'version', 'external_ref']
+    WRITABLE_FIELDS = ['title', 'description', 'start_time', 'end_time', 'priority', 'status']
+    FILTER_LOOKUPS = {
+        'status': 'status',
+        'priority': 'priority',
+        'start_after': 'start_time__gte',
+        'start_before': 'start_time__lt',
+        'end_before': 'end_time__lt',
+    }
 
     class Meta:
         """
@@ -35,6 +72,12 @@ class Task(models.Model):
         verbose_name = 'Task'
         verbose_name_plural = 'Tasks'
         ordering = ['-start_time', 'priority', 'status']
+        indexes = [
+            models.Index(fields=['-start_time', 'priority', 'status', 'task_id'], name='task_list_order_idx'),
+            models.Index(fields=['status', '-start_time', 'priority', 'task_id'], name='task_status_order_idx'),
+            models.Index(fields=['priority', '-start_time', 'status', 'task_id'], name='task_priority_order_idx'),
+            models.Index(fields=['end_time'], name='task_end_time_idx'),
+        ]
 
     def __str__(self) -> str:
         """
@@ -55,33 +98,229 @@ class Task(models.Model):
             "PRIORITY_CHOICES": self.PRIORITY_CHOICES,
             "priority": self.priority,
             "STATUS_CHOICES": self.STATUS_CHOICES,
-            "status": self.status
+            "status": self.status,
+            "version": self.version,
+            "external_ref": self.external_ref
         }
         return str(task_dict)
 
-    def datetimetoiso(self, dt: datetime) -> str:
+    def save(self, *args: Any, **kwargs: Any) -> None:
         """
-        Converts a datetime object to an ISO 8601 formatted string.
+        Saves the Task, incrementing the version of an existing one (e.g. when edited
+        from the admin) so that writes made against the previous version conflict.
         """
-        iso: str = dt.replace(second=0, tzinfo=None,).isoformat()
-        return iso
+        if not self._state.adding:
+            self.version += 1
+        super().save(*args, **kwargs)
 
-    def custom_get_all(self) -> List[Dict[str, Any]]:
+    def embed_choices(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Retrieves all Tasks as a list of dictionaries.
+        Adds the priority and status choices to a Task dictionary when the
+        TASKS_EMBED_CHOICES compatibility flag is on; clients otherwise read them
+        once from the meta endpoint.
         """
-        tasks: List[Dict[str, Any]] = list(self.__class__.objects.all().values())
+        if settings.TASKS_EMBED_CHOICES:
+            task["PRIORITY_CHOICES"] = self.PRIORITY_CHOICES
+            task["STATUS_CHOICES"] = self.STATUS_CHOICES
+        return task
+
+    def custom_get_meta(self) -> Dict[str, Any]:
+        """
+        Retrieves the Task metadata shared by every Task: the priority and status
+        choices, versioned by a digest of their content.
+        """
+        choices: Dict[str, Any] = {
+            "priority_choices": self.PRIORITY_CHOICES,
+            "status_choices": self.STATUS_CHOICES
+        }
+        version: str = hashlib.sha256(json.dumps(choices, sort_keys=True).encode()).hexdigest()[:16]
+        return {"version": version, **choices}
+
+    def serializer(self, fields: List[str] | None = None) -> RowSerializer:
+        """
+        Returns the serializer shared by every Task payload holding the given fields
+        (SUMMARY_FIELDS by default).
+        """
+        return get_serializer(self.__class__, tuple(fields or self.SUMMARY_FIELDS))
+
+    def filtered(self, filters: Dict[str, Any] | None = None) -> models.QuerySet:
+        """
+        Returns the Tasks matching the given structured filters, compiled into
+        equality and range predicates (see FILTER_LOOKUPS).
+        """
+        lookups: Dict[str, Any] = {self.FILTER_LOOKUPS[name]: value for name, value in (filters or {}).items()}
+        return self.__class__.objects.filter(**lookups)
+
+    def custom_get_all(self, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> TaskBatch:
+        """
+        Retrieves all Tasks matching the filters as a TaskBatch of rows holding the
+        given fields (SUMMARY_FIELDS by default).
+        """
+        serializer: RowSerializer = self.serializer(fields)
+        tasks: TaskBatch = serializer.batch(serializer.select(self.filtered(filters)))
         return tasks
 
-    def custom_get_by_params(self, params: str) -> List[Dict[str, Any]]:
+    async def acustom_get_all(self, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> TaskBatch:
+        """
+        Retrieves all Tasks matching the filters as a TaskBatch, like custom_get_all,
+        iterating over the queryset asynchronously.
+        """
+        serializer: RowSerializer = self.serializer(fields)
+        return serializer.batch([row async for row in serializer.select(self.filtered(filters))])
+
+    def custom_iter_all(self, chunk_size: int, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over all Tasks matching the filters as dictionaries holding the given
+        fields, reading rows through a server-side cursor where the database supports it.
+        """
+        serializer: RowSerializer = self.serializer(fields)
+        return serializer.iter_rows(serializer.select(self.filtered(filters)).iterator(chunk_size=chunk_size))
+
+    def acustom_iter_all(self, chunk_size: int, filters: Dict[str, Any] | None = None, fields: List[str] | None = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterates asynchronously over all Tasks matching the filters as dictionaries
+        holding the given fields, chunk_size rows fetched at a time.
+        """
+        serializer: RowSerializer = self.serializer(fields)
+        return serializer.aiter_rows(serializer.select(self.filtered(filters)).iterator(chunk_size=chunk_size), chunk_size)
+
+    def encode_cursor(self, task: Dict[str, Any]) -> str:
+        """
+        Encodes the keyset values of a Task row into an opaque cursor.
+        """
+        key: List[Any] = [
+            task['start_time'].isoformat() if task['start_time'] else None,
+            task['priority'],
+            task['status'],
+            str(task['task_id'])
+        ]
+        return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor: str) -> List[Any]:
+        """
+        Decodes an opaque cursor into the keyset values it was built from.
+        """
+        try:
+            key = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+            start_time, priority, status, task_id = key
+            return [
+                datetime.fromisoformat(start_time) if start_time is not None else None,
+                str(priority),
+                str(status),
+                uuid.UUID(task_id)
+            ]
+        except (ValueError, TypeError) as err:
+            raise InvalidCursor(err)
+
+    def keyset_after(self, key: List[Any]) -> List[Q]:
+        """
+        Builds the filters selecting the Tasks that come after the given keyset values,
+        one per segment of the ordering left to read: the rest of the segment of NULL or
+        non-NULL start times holding the cursor, then the other segment when the database
+        sorts it after. Each filter ANDs a bound on the leading keys to the tie-breaks,
+        so the database seeks the list index to the cursor instead of scanning it from
+        the top and filtering, and deep pages cost what the first one does.
+        """
+        start_time, priority, status, task_id = key
+        nulls_first: bool = connections[self.__class__.objects.db].features.nulls_order_largest  # start_time sorts descending
+        tail: Q = Q(priority__gte=priority) & (
+            Q(priority__gt=priority) |
+            Q(priority=priority, status__gt=status) |
+            Q(priority=priority, status=status, task_id__gt=task_id)
+        )
+        if start_time is None:
+            segments: List[Q] = [Q(start_time__isnull=True) & tail]
+            if nulls_first:
+                segments.append(Q(start_time__isnull=False))
+        else:
+            segments = [Q(start_time__lte=start_time) & (Q(start_time__lt=start_time) | (Q(start_time=start_time) & tail))]
+            if not nulls_first:
+                segments.append(Q(start_time__isnull=True))
+        return segments
+
+    def custom_get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieves a page of Tasks matching the filters as a TaskBatch of rows holding
+        the given fields, using keyset pagination over the default ordering with task_id
+        as the tiebreaker.
+        """
+        serializer, keyset_fields, querysets = self.page_query(limit, cursor, filters, fields)
+        rows: List[tuple] = []
+        for queryset in querysets:
+            rows.extend(queryset[:limit + 1 - len(rows)])
+            if len(rows) > limit:
+                break
+        return self.page(serializer, keyset_fields, rows, limit)
+
+    async def acustom_get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieves a page of Tasks like custom_get_page, iterating over the queryset asynchronously.
+        """
+        serializer, keyset_fields, querysets = self.page_query(limit, cursor, filters, fields)
+        rows: List[tuple] = []
+        for queryset in querysets:
+            rows.extend([row async for row in queryset[:limit + 1 - len(rows)]])
+            if len(rows) > limit:
+                break
+        return self.page(serializer, keyset_fields, rows, limit)
+
+    def page_query(
+        self,
+        limit: int,
+        cursor: str | None,
+        filters: Dict[str, Any] | None,
+        fields: List[str] | None
+    ) -> Tuple[RowSerializer, List[str], List[models.QuerySet]]:
+        """
+        Builds the queries reading a page of Tasks after the cursor: the serializer of
+        the fields, the keyset fields read along with them and the querysets of tuples
+        of each segment of the ordering (see keyset_after), to read in turn until one
+        row more than the page is found.
+        """
+        serializer: RowSerializer = self.serializer(fields)
+        keyset_fields: List[str] = [name.lstrip('-') for name in self.KEYSET_ORDERING if name.lstrip('-') not in serializer.fields]
+        queryset = serializer.select(self.filtered(filters).order_by(*self.KEYSET_ORDERING), *keyset_fields)
+        if not cursor:
+            return serializer, keyset_fields, [queryset]
+        return serializer, keyset_fields, [queryset.filter(segment) for segment in self.keyset_after(self.decode_cursor(cursor))]
+
+    def page(self, serializer: RowSerializer, keyset_fields: List[str], rows: List[tuple], limit: int) -> Dict[str, Any]:
+        """
+        Builds a page from the rows read by the queries of page_query, with the cursor
+        of its last row when there are more.
+        """
+        next_cursor: str | None = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self.encode_cursor(dict(zip([*serializer.fields, *keyset_fields], rows[-1])))
+        return {"items": serializer.batch(rows), "next": next_cursor}
+
+    def custom_get_by_params(
+        self,
+        params: str,
+        limit: int | None = None,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> List[Dict[str, Any]]:
         """
-        Retrieves items as a list of dictionaries, filtered by keyword arguments.
+        Retrieves the best matching Tasks among those matching the filters as a list
+        of dictionaries holding the given fields, using the search backend of the database.
         """
-        tasks: List[Dict[str, Any]] = list(self.__class__.objects.filter(
-            Q(title__icontains=params) |
-            Q(priority__icontains=params) |
-            Q(status__icontains=params)
-        ).values())
+        queryset = self.filtered(filters).values(*self.serializer(fields).fields)
+        backend = get_search_backend(connections[queryset.db].vendor)
+        tasks: List[Dict[str, Any]] = backend.search(queryset, params, limit or settings.TASKS_SEARCH_LIMIT)
         return tasks
 
     def custom_get_by_id(self, id: str) -> Dict[str, Any]:
@@ -89,19 +328,34 @@ class Task(models.Model):
         Retrieves a single Task by its primary key.
         """
         try:
-            retrieved_task: Task = Task.objects.get(pk=id)
-            task: Dict[str, Any] = {
-                "task_id": retrieved_task.task_id,
-                "title": retrieved_task.title,
-                "description": retrieved_task.description,
-                "start_time": retrieved_task.datetimetoiso(retrieved_task.start_time) if retrieved_task.start_time else None,
-                "end_time": retrieved_task.datetimetoiso(retrieved_task.end_time) if retrieved_task.end_time else None,
-                "PRIORITY_CHOICES": retrieved_task.PRIORITY_CHOICES,
-                "priority": retrieved_task.priority,
-                "STATUS_CHOICES": retrieved_task.STATUS_CHOICES,
-                "status": retrieved_task.status
-            }
-            return task
+            return self.embed_choices(self.serializer(self.DETAIL_FIELDS).get(id))
+        except Task.DoesNotExist as err:
+            raise NotFound(err)
+
+    async def acustom_get_by_id(self, id: str) -> Dict[str, Any]:
+        """
+        Retrieves a single Task by its primary key with the async ORM.
+        """
+        try:
+            return self.embed_choices(await self.serializer(self.DETAIL_FIELDS).aget(id))
+        except Task.DoesNotExist as err:
+            raise NotFound(err)
+
+    def custom_get_item_version(self, id: str) -> int:
+        """
+        Retrieves the version of a single Task, reading no other column.
+        """
+        try:
+            return Task.objects.values_list('version', flat=True).get(pk=id)
+        except Task.DoesNotExist as err:
+            raise NotFound(err)
+
+    async def acustom_get_item_version(self, id: str) -> int:
+        """
+        Retrieves the version of a single Task with the async ORM.
+        """
+        try:
+            return await Task.objects.values_list('version', flat=True).aget(pk=id)
         except Task.DoesNotExist as err:
             raise NotFound(err)
 
@@ -121,65 +375,359 @@ class Task(models.Model):
                     priority=data['priority'],
                     status=data['status']
                 )
-                task = {
-                    "task_id": new_task.task_id,
-                    "title": new_task.title,
-                    "description": new_task.description,
-                    "start_time": new_task.datetimetoiso(new_task.start_time) if new_task.start_time else None,
-                    "end_time": new_task.datetimetoiso(new_task.end_time) if new_task.end_time else None,
-                    "PRIORITY_CHOICES": new_task.PRIORITY_CHOICES,
-                    "priority": new_task.priority,
-                    "STATUS_CHOICES": new_task.STATUS_CHOICES,
-                    "status": new_task.status
-                }
+                task = new_task.as_dict()
         except Exception as err:
             raise Exception(f"Error creating Task: {err}")
         return task
 
-    def custom_update(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def acustom_create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Updates a Task instance with the provided data.
+        Creates a new Task instance from the provided data with the async ORM. The
+        single INSERT is atomic on its own, so it needs no transaction, which the
+        async ORM cannot open.
         """
-        updated_task: Task = Task(task_id=data['task_id'])
-        task: Dict[str, Any] = {}
+        try:
+            new_task: Task = await Task.objects.acreate(
+                title=data['title'],
+                description=data['description'],
+                start_time=data['start_time'] if data.get('start_time') else None,
+                end_time=data['end_time'] if data.get('end_time') else None,
+                priority=data['priority'],
+                status=data['status']
+            )
+        except Exception as err:
+            raise Exception(f"Error creating Task: {err}")
+        return new_task.as_dict()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Returns the Task as the dictionary returned by the single Task endpoints.
+        """
+        return self.embed_choices(self.serializer(self.DETAIL_FIELDS).instance(self))
+
+    def clean_items(self, items: List[Dict[str, Any]], fields: List[str], unique: str | None = None) -> List['Task']:
+        """
+        Builds a Task from the given fields of every item and validates it with full_clean,
+        requiring the unique field, if any, to be set and distinct across the items. Raises
+        InvalidItems listing the errors of every invalid item. Uniqueness against the
+        database is not checked per item: primary keys are fresh UUIDs, and the unique
+        field is the conflict target of the upserts.
+        """
+        new_tasks: List[Task] = []
+        seen: set = set()
+        errors: Dict[int, Dict[str, List[str]]] = {}
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors[index] = {"__all__": ["Expected an object."]}
+                continue
+            new_task = Task(**{name: item[name] for name in fields if item.get(name) is not None})
+            try:
+                new_task.full_clean(validate_unique=False, validate_constraints=False)
+            except ValidationError as err:
+                errors[index] = err.message_dict
+            if unique is not None:
+                value = getattr(new_task, unique)
+                if not value or value in seen:
+                    errors.setdefault(index, {})[unique] = ["Required and distinct across the items."]
+                seen.add(value)
+            new_tasks.append(new_task)
+        if errors:
+            raise InvalidItems(f"{len(errors)} of {len(items)} tasks are invalid", errors)
+        return new_tasks
+
+    def custom_bulk_create(self, items: List[Dict[str, Any]], batch_size: int) -> List[Dict[str, Any]]:
+        """
+        Validates every item with full_clean, then inserts them all with bulk_create,
+        batch_size rows per statement, within one transaction.
+        """
+        new_tasks: List[Task] = self.clean_items(items, self.WRITABLE_FIELDS)
         try:
             with transaction.atomic():
-                if Task.objects.get(pk=data['task_id']):
-                    updated_task.title = data['title']
-                    updated_task.description = data['description']
-                    updated_task.start_time = data['start_time'] if data.get('start_time') else None
-                    updated_task.end_time = data['end_time'] if data.get('end_time') else None
-                    updated_task.priority = data['priority']
-                    updated_task.status = data['status']
-                    updated_task._state.adding = False
-                    updated_task.save()
-                    task = {
-                        "task_id": updated_task.task_id,
-                        "title": updated_task.title,
-                        "description": updated_task.description,
-                        "start_time": updated_task.datetimetoiso(updated_task.start_time) if updated_task.start_time else None,
-                        "end_time": updated_task.datetimetoiso(updated_task.end_time) if updated_task.end_time else None,
-                        "PRIORITY_CHOICES": updated_task.PRIORITY_CHOICES,
-                        "priority": updated_task.priority,
-                        "STATUS_CHOICES": updated_task.STATUS_CHOICES,
-                        "status": updated_task.status
-                    }
-        except Task.DoesNotExist as err:
-            raise NotFound(err)
+                Task.objects.bulk_create(new_tasks, batch_size=batch_size)
+        except Exception as err:
+            raise Exception(f"Error creating Tasks: {err}")
+        return [new_task.as_dict() for new_task in new_tasks]
+
+    def custom_bulk_upsert(self, items: List[Dict[str, Any]], batch_size: int) -> Dict[str, int]:
+        """
+        Creates or updates Tasks by external_ref, within one transaction. Each batch of
+        batch_size items costs three statements: a SELECT ... FOR UPDATE locking the
+        Tasks already holding those references in primary key order, so that concurrent
+        upserts cannot deadlock, an INSERT ... ON CONFLICT (external_ref) DO UPDATE
+        writing them all, and an UPDATE incrementing the version of the rows that were
+        not inserted. A conflicting row keeps its own task_id, so the rows whose task_id
+        is not one of the fresh ones sent are exactly the updated ones, including those
+        inserted concurrently after the SELECT, and their count is the one returned.
+        """
+        new_tasks: List[Task] = self.clean_items(items, [*self.WRITABLE_FIELDS, 'external_ref'], unique='external_ref')
+        updated: int = 0
+        try:
+            with transaction.atomic():
+                for start in range(0, len(new_tasks), batch_size):
+                    batch: List[Task] = new_tasks[start:start + batch_size]
+                    refs: List[str] = [task.external_ref for task in batch]
+                    list(Task.objects.select_for_update().filter(external_ref__in=refs).order_by('task_id').values_list('pk', flat=True))
+                    Task.objects.bulk_create(
+                        batch,
+                        update_conflicts=True,
+                        unique_fields=['external_ref'],
+                        update_fields=self.WRITABLE_FIELDS
+                    )
+                    updated += Task.objects.filter(external_ref__in=refs).exclude(
+                        task_id__in=[task.task_id for task in batch]
+                    ).update(version=models.F('version') + 1)
+        except Exception as err:
+            raise Exception(f"Error upserting Tasks: {err}")
+        return {"created": len(new_tasks) - updated, "updated": updated}
+
+    def clean_changes(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validates and converts the writable fields present in data, so they can be
+        written with a single UPDATE. Raises ValidationError listing every invalid field.
+        """
+        if not isinstance(data, dict) or not data:
+            raise ValidationError("Expected a non-empty object of fields to change.")
+        changes: Dict[str, Any] = {}
+        errors: Dict[str, List[str]] = {}
+        for name, value in data.items():
+            if name not in self.WRITABLE_FIELDS:
+                errors[name] = ["Unknown or read-only field."]
+                continue
+            try:
+                changes[name] = self._meta.get_field(name).clean(value, None)
+            except ValidationError as err:
+                errors[name] = err.messages
+        if errors:
+            raise ValidationError(errors)
+        return changes
+
+    def versioned_update(self, id: str, changes: Dict[str, Any], version: int | None = None) -> None:
+        """
+        Writes the changes to a Task and increments its version in a single UPDATE,
+        matching only the given version when there is one. When no row is affected,
+        raises Conflict if the Task exists at another version and NotFound otherwise.
+        """
+        queryset: models.QuerySet = Task.objects.filter(pk=id)
+        if version is not None:
+            queryset = queryset.filter(version=version)
+        if queryset.update(**changes, version=models.F('version') + 1):
+            return
+        if version is not None and Task.objects.filter(pk=id).exists():
+            raise Conflict(f"Task {id} is no longer at version {version}")
+        raise NotFound(f"No Task matches the given query: {id}")
+
+    async def aversioned_update(self, id: str, changes: Dict[str, Any], version: int | None = None) -> None:
+        """
+        Writes the changes to a Task like versioned_update, with the async ORM.
+        """
+        queryset: models.QuerySet = Task.objects.filter(pk=id)
+        if version is not None:
+            queryset = queryset.filter(version=version)
+        if await queryset.aupdate(**changes, version=models.F('version') + 1):
+            return
+        if version is not None and await Task.objects.filter(pk=id).aexists():
+            raise Conflict(f"Task {id} is no longer at version {version}")
+        raise NotFound(f"No Task matches the given query: {id}")
+
+    def from_data(self, data: Dict[str, Any]) -> 'Task':
+        """
+        Builds the unsaved Task overwriting the one with the task_id of data. Only the
+        writable fields are taken from data; the others are read back from the row.
+        """
+        return Task(
+            task_id=data['task_id'],
+            title=data['title'],
+            description=data['description'],
+            start_time=data['start_time'] if data.get('start_time') else None,
+            end_time=data['end_time'] if data.get('end_time') else None,
+            priority=data['priority'],
+            status=data['status']
+        )
+
+    def custom_update(self, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
+        """
+        Overwrites a Task with the provided data. When version is given, the write only
+        applies to that version of the Task, raising Conflict if it changed meanwhile.
+        The Task returned is the row written, read back within the same transaction.
+        """
+        updated_task: Task = self.from_data(data)
+        changes: Dict[str, Any] = {name: getattr(updated_task, name) for name in self.WRITABLE_FIELDS}
+        with transaction.atomic():
+            self.versioned_update(updated_task.task_id, changes, version)
+            return Task.objects.get(pk=updated_task.task_id).as_dict()
+
+    async def acustom_update(self, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
+        """
+        Overwrites a Task with the provided data with the async ORM, honouring version
+        like custom_update. Without a version, the async ORM cannot hold a transaction
+        to read the new version back, so the current version is read first and written
+        against, and the write is retried if another one got in between. The fields
+        not written, such as external_ref, never change on update and are read along.
+        """
+        updated_task: Task = self.from_data(data)
+        changes: Dict[str, Any] = {name: getattr(updated_task, name) for name in self.WRITABLE_FIELDS}
+        if version is not None:
+            await self.aversioned_update(updated_task.task_id, changes, version)
+            updated_task.external_ref = await Task.objects.values_list('external_ref', flat=True).aget(pk=updated_task.task_id)
+        while version is None:
+            try:
+                current, updated_task.external_ref = await Task.objects.values_list('version', 'external_ref').aget(pk=updated_task.task_id)
+            except Task.DoesNotExist as err:
+                raise NotFound(err)
+            try:
+                await self.aversioned_update(updated_task.task_id, changes, current)
+            except Conflict:
+                continue
+            version = current
+        updated_task.version = version + 1
+        return updated_task.as_dict()
+
+    def custom_partial_update(self, id: str, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
+        """
+        Writes only the given fields of a Task with a single UPDATE, detecting a
+        missing Task from the number of affected rows instead of reading it first.
+        When version is given, the write only applies to that version of the Task,
+        raising Conflict if it changed meanwhile, and the new version is returned.
+        """
+        changes: Dict[str, Any] = self.clean_changes(data)
+        self.versioned_update(id, changes, version)
+        task: Dict[str, Any] = self.serializer(["task_id", *changes]).instance(Task(task_id=id, **changes))
+        if version is not None:
+            task["version"] = version + 1
         return task
 
+    async def acustom_partial_update(self, id: str, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
+        """
+        Writes only the given fields of a Task like custom_partial_update, with the async ORM.
+        """
+        changes: Dict[str, Any] = self.clean_changes(data)
+        await self.aversioned_update(id, changes, version)
+        task: Dict[str, Any] = self.serializer(["task_id", *changes]).instance(Task(task_id=id, **changes))
+        if version is not None:
+            task["version"] = version + 1
+        return task
+
+    def delete_rows(self, ids: List[Any]) -> int:
+        """
+        Deletes the Tasks with the given primary keys with a single DELETE run on a
+        cursor, and returns the number of deleted rows. Tasks have no relations to
+        cascade to, so the deletion collector and its reads are skipped, and so are
+        the delete signals: callers invalidate what depends on the deleted Tasks themselves.
+        """
+        if not ids:
+            return 0
+        connection = connections[Task.objects.db]
+        quote_name = connection.ops.quote_name
+        pk: models.Field = self._meta.pk
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {quote_name(self._meta.db_table)} WHERE {quote_name(pk.column)} IN ({', '.join(['%s'] * len(ids))})",
+                [pk.get_db_prep_value(id, connection) for id in ids]
+            )
+            return cursor.rowcount
+
     def custom_delete(self, id: str) -> bool:
         """
-        Deletes a Task instance by its primary key.
+        Deletes a Task by its primary key with a single DELETE, detecting a missing
+        Task from the number of affected rows instead of reading it first.
         """
-        task_to_delete: Task = Task(task_id=id)
-        deleted = False
+        if not self.delete_rows([id]):
+            raise NotFound(f"No Task matches the given query: {id}")
+        return True
+
+    async def acustom_delete(self, id: str) -> bool:
+        """
+        Deletes a Task like custom_delete. QuerySet.adelete would run the deletion
+        collector and the delete signals that custom_delete skips, so the same single
+        DELETE is run in a thread, which is all the async ORM would do either way.
+        """
+        return await sync_to_async(self.custom_delete)(id)
+
+    def custom_batch(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Applies a list of update and delete operations within one transaction. Updates
+        making the same changes are grouped into one UPDATE ... WHERE task_id IN (...),
+        and all deletes are run as one DELETE ... WHERE task_id IN (...), so a batch
+        costs a handful of statements whatever its size. Every operation is validated
+        before any is applied; operations on missing tasks are reported as 404.
+        """
+        updates: Dict[tuple, List[uuid.UUID]] = {}
+        deletes: List[uuid.UUID] = []
+        targets: List[uuid.UUID] = []
+        errors: Dict[int, Dict[str, List[str]]] = {}
+        for index, operation in enumerate(operations):
+            try:
+                if not isinstance(operation, dict):
+                    raise ValidationError("Expected an object.")
+                task_id = self._meta.pk.clean(operation.get("task_id"), None)
+                if operation.get("op") == "update":
+                    changes = self.clean_changes(operation.get("data"))
+                    updates.setdefault(tuple(sorted(changes.items())), []).append(task_id)
+                elif operation.get("op") == "delete":
+                    deletes.append(task_id)
+                else:
+                    raise ValidationError({"op": ['Expected "update" or "delete".']})
+                targets.append(task_id)
+            except ValidationError as err:
+                errors[index] = err.message_dict if hasattr(err, "error_dict") else {"__all__": err.messages}
+        if errors:
+            raise InvalidItems(f"{len(errors)} of {len(operations)} operations are invalid", errors)
         try:
             with transaction.atomic():
-                if Task.objects.get(pk=id):
-                    task_to_delete._state.adding = False
-                    task_to_delete.delete()
-                    deleted = True
-        except Task.DoesNotExist as err:
-            raise NotFound(err)
-        return deleted
+                existing = set(Task.objects.filter(pk__in=set(targets)).values_list("pk", flat=True))
+                for changes, ids in updates.items():
+                    Task.objects.filter(pk__in=[id for id in ids if id in existing]).update(
+                        **dict(changes), version=models.F('version') + 1
+                    )
+                self.delete_rows([id for id in deletes if id in existing])
+        except Exception as err:
+            raise Exception(f"Error applying Task operations: {err}")
+        return [
+            {
+                "index": index,
+                "task_id": task_id,
+                "status": (200 if operation["op"] == "update" else 204) if task_id in existing else 404
+            }
+            for index, (operation, task_id) in enumerate(zip(operations, targets))
+        ]
+
+    def custom_transition(self, filters: Dict[str, Any], status: str, end_time: datetime | None = None) -> int:
+        """
+        Moves the Tasks matching the filters, and not already in the status, to the
+        status with a single UPDATE, also setting end_time when given. Returns the
+        number of Tasks moved.
+        """
+        changes: Dict[str, Any] = self.clean_changes({"status": status})
+        if end_time is not None:
+            changes["end_time"] = end_time
+        return self.filtered(filters).exclude(status=changes["status"]).update(
+            **changes, version=models.F('version') + 1
+        )
+
+
+class IdempotencyKey(models.Model):
+    """
+    Django model storing the response of a request sent with an Idempotency-Key header,
+    so that retries of the request replay it instead of repeating the write. Keys are
+    stored as the SHA-256 of the client key to keep rows small and fixed-width; rows
+    older than TASKS_IDEMPOTENCY_TTL seconds are ignored and purged.
+    """
+    key = models.CharField('Key digest', max_length=64, primary_key=True)
+    request_hash = models.CharField('Request digest', max_length=64)
+    status = models.PositiveSmallIntegerField('Response status', null=True)
+    response = models.BinaryField('Response body', null=True)
+    content_type = models.CharField('Response content type', max_length=100, default='application/json')
+    created_at = models.DateTimeField('Created at', db_index=True)
+
+    class Meta:
+        """
+        Meta class for IdempotencyKey model.
+        """
+        verbose_name = 'Idempotency key'
+        verbose_name_plural = 'Idempotency keys'
+
+    def __str__(self) -> str:
+        """
+        Returns a string representing an IdempotencyKey object for display purposes.
+        """
+        return f"IdempotencyKey(key={self.key}, status={self.status})"
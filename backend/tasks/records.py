@@ -0,0 +1,81 @@
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class TaskRecord(Mapping):
+    """
+    Immutable, slotted view of one row of a TaskBatch, read like the dictionary it
+    replaces. It holds the row tuple and the field index shared by its batch, so it
+    costs no hash table of its own.
+    """
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: Dict[str, int], values: Tuple[Any, ...]) -> None:
+        object.__setattr__(self, "_index", index)
+        object.__setattr__(self, "_values", values)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("TaskRecord is immutable")
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the TaskRecord instance.
+        """
+        return f"<TaskRecord {dict(self)!r}>"
+
+    def __getitem__(self, name: str) -> Any:
+        return self._values[self._index[name]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (TaskRecord, (self._index, self._values))
+
+
+class TaskBatch(Sequence):
+    """
+    Tuple-backed list of Task rows as read with values_list: the field names are
+    stored once and every row is a plain tuple, instead of one dictionary per row.
+    Indexing returns TaskRecord views; the dictionaries a JSON encoder needs are
+    only built at the edge, a chunk at a time (see chunks).
+    """
+    __slots__ = ("fields", "rows", "index")
+
+    def __init__(self, fields: Tuple[str, ...], rows: List[Tuple[Any, ...]]) -> None:
+        self.fields = fields
+        self.rows = rows
+        self.index: Dict[str, int] = {name: position for position, name in enumerate(fields)}
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the TaskBatch instance.
+        """
+        return f"<TaskBatch fields={self.fields} rows={len(self.rows)}>"
+
+    def __getitem__(self, position: int | slice) -> Any:
+        if isinstance(position, slice):
+            return TaskBatch(self.fields, self.rows[position])
+        return TaskRecord(self.index, self.rows[position])
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, TaskBatch):
+            return self.fields == other.fields and self.rows == other.rows
+        return isinstance(other, Sequence) and len(self) == len(other) and all(record == item for record, item in zip(self, other))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (TaskBatch, (self.fields, self.rows))
+
+    def chunks(self, size: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the rows as lists of at most size dictionaries.
+        """
+        fields = self.fields
+        for start in range(0, len(self.rows), size):
+            yield [dict(zip(fields, row)) for row in self.rows[start:start + size]]
@@ -0,0 +1,129 @@
+from functools import lru_cache
+from typing import Any, List, Tuple
+from uuid import UUID
+from django.conf import settings
+from django.http import HttpRequest
+from django.http.request import MediaType, parse_accept_header
+from django.utils.module_loading import import_string
+from .interfaces import IRenderer
+from .records import TaskBatch, TaskRecord
+from .responses import dumps
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; MessagePackRenderer is unavailable without it
+    msgpack = None
+
+
+class JSONRenderer(IRenderer):
+    """
+    Renderer of JSON payloads, the default representation.
+
+    Implements:
+        - IRenderer
+    """
+    media_type: str = "application/json"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the JSONRenderer instance.
+        """
+        return "<JSONRenderer>"
+
+    def is_available(self) -> bool:
+        """
+        JSON is always available, through orjson or the standard library.
+        """
+        return True
+
+    def render(self, data: Any) -> bytes:
+        """
+        Encodes data as JSON.
+        """
+        return dumps(data)
+
+
+class MessagePackRenderer(IRenderer):
+    """
+    Renderer of MessagePack payloads for clients sending Accept: application/msgpack.
+    Datetimes are packed as the MessagePack timestamp extension and UUIDs as strings.
+
+    Implements:
+        - IRenderer
+    """
+    media_type: str = "application/msgpack"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the MessagePackRenderer instance.
+        """
+        return "<MessagePackRenderer>"
+
+    def is_available(self) -> bool:
+        """
+        MessagePack is available when the msgpack package is installed.
+        """
+        return msgpack is not None
+
+    def default(self, value: Any) -> Any:
+        """
+        Converts the values msgpack has no native encoding for.
+        """
+        if isinstance(value, TaskBatch):
+            return [task for chunk in value.chunks(settings.TASKS_STREAM_CHUNK_SIZE) for task in chunk]
+        if isinstance(value, TaskRecord):
+            return dict(value)
+        if isinstance(value, UUID):
+            return str(value)
+        raise TypeError(f"Cannot pack {type(value).__name__}")
+
+    def render(self, data: Any) -> bytes:
+        """
+        Encodes data as MessagePack.
+        """
+        return msgpack.packb(data, default=self.default, datetime=True)
+
+
+@lru_cache
+def get_renderers() -> Tuple[IRenderer, ...]:
+    """
+    Returns the available renderers configured in TASKS_RENDERERS, in order of
+    preference; the first one is used when the client has no preference.
+    """
+    renderers: List[IRenderer] = [import_string(path)() for path in settings.TASKS_RENDERERS]
+    return tuple(renderer for renderer in renderers if renderer.is_available())
+
+
+def quality(accepted: List[MediaType], media_type: str) -> float:
+    """
+    Returns the quality the Accept header gives media_type: that of the most specific
+    matching media range (type/subtype, then type/*, then */*), or 0 when none matches.
+    """
+    best: Tuple[int, float] = (-1, 0.0)
+    main_type, _, sub_type = media_type.partition("/")
+    for media_range in accepted:
+        if not media_range.match(media_type):
+            continue
+        specificity: int = (media_range.main_type == main_type) + (media_range.sub_type == sub_type)
+        if specificity > best[0]:
+            try:
+                best = (specificity, float(media_range.params.get("q", 1)))
+            except ValueError:
+                best = (specificity, 0.0)
+    return best[1]
+
+
+def select_renderer(request: HttpRequest) -> IRenderer:
+    """
+    Returns the renderer of the media type the request's Accept header prefers,
+    falling back to the first renderer when it accepts none of them.
+    """
+    renderers: Tuple[IRenderer, ...] = get_renderers()
+    accepted: List[MediaType] = parse_accept_header(request.headers.get("Accept") or "*/*")
+    selected: IRenderer = renderers[0]
+    selected_quality: float = 0.0
+    for renderer in renderers:
+        renderer_quality: float = quality(accepted, renderer.media_type)
+        if renderer_quality > selected_quality:
+            selected, selected_quality = renderer, renderer_quality
+    return selected
@@ -0,0 +1,59 @@
+import json
+from typing import Any
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from .records import TaskBatch, TaskRecord
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard library encoder is used without it
+    orjson = None
+
+
+def use_orjson() -> bool:
+    """
+    Returns whether payloads are encoded with orjson: it must be installed and not
+    disabled with TASKS_JSON_ENCODER = "stdlib".
+    """
+    return orjson is not None and settings.TASKS_JSON_ENCODER != "stdlib"
+
+
+class TaskJSONEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder also encoding TaskBatch and TaskRecord values as the lists and
+    objects they stand for.
+    """
+
+    def default(self, value: Any) -> Any:
+        if isinstance(value, TaskBatch):
+            return [task for chunk in value.chunks(settings.TASKS_STREAM_CHUNK_SIZE) for task in chunk]
+        if isinstance(value, TaskRecord):
+            return dict(value)
+        return super().default(value)
+
+
+def encode_default(value: Any) -> Any:
+    """
+    Converts the values orjson has no native encoding for the way TaskJSONEncoder
+    does, except for a TaskBatch: its rows are encoded TASKS_STREAM_CHUNK_SIZE at a
+    time and spliced in as one fragment, so that the dictionaries of the whole batch
+    never exist at once.
+    """
+    if isinstance(value, TaskBatch):
+        return orjson.Fragment(b"[" + b",".join(
+            orjson.dumps(chunk, default=encode_default, option=orjson.OPT_UTC_Z)[1:-1]
+            for chunk in value.chunks(settings.TASKS_STREAM_CHUNK_SIZE)
+        ) + b"]")
+    return TaskJSONEncoder().default(value)
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Encodes data as JSON bytes, with orjson when available and TaskJSONEncoder
+    otherwise. UUIDs and datetimes are encoded natively by both; orjson keeps the
+    microseconds of datetimes, which DjangoJSONEncoder truncates to milliseconds.
+    """
+    if use_orjson():
+        return orjson.dumps(data, default=encode_default, option=orjson.OPT_UTC_Z)
+    return json.dumps(data, cls=TaskJSONEncoder).encode()
+
@@ -0,0 +1,150 @@
+from functools import lru_cache
+from typing import Any, Dict, List
+from django.conf import settings
+from django.db import connections
+from django.db.models import F, Func, FloatField, Q, QuerySet, Value
+from django.utils.module_loading import import_string
+from .interfaces import ISearchBackend
+
+
+class LikeSearchBackend(ISearchBackend):
+    """
+    Search backend matching titles with LIKE '%params%', usable on any database.
+
+    Implements:
+        - ISearchBackend
+    """
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the LikeSearchBackend instance.
+        """
+        return "<LikeSearchBackend>"
+
+    def choices_matching(self, choices: Dict[str, str], params: str) -> List[str]:
+        """
+        Returns the stored choice values containing params, case-insensitively.
+        Matching the few choice values in Python turns the priority and status
+        lookups into equality predicates that the indexes can serve.
+        """
+        params = params.upper()
+        return [value for value in choices if params in value.upper()]
+
+    def choices_filter(self, queryset: QuerySet, params: str) -> Q | None:
+        """
+        Builds the filter matching params against the priority and status choices,
+        or None when no choice matches.
+        """
+        model = queryset.model
+        priorities: List[str] = self.choices_matching(model.PRIORITY_CHOICES, params)
+        statuses: List[str] = self.choices_matching(model.STATUS_CHOICES, params)
+        if not priorities and not statuses:
+            return None
+        return Q(priority__in=priorities) | Q(status__in=statuses)
+
+    def search(self, queryset: QuerySet, params: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Returns up to limit items whose title, priority or status contains params.
+        """
+        matches: Q = Q(title__icontains=params)
+        choices: Q | None = self.choices_filter(queryset, params)
+        if choices is not None:
+            matches |= choices
+        return list(queryset.filter(matches)[:limit])
+
+
+class PostgresTrigramSearchBackend(LikeSearchBackend):
+    """
+    Search backend for PostgreSQL, backed by a pg_trgm GIN index on UPPER(title),
+    created by migration 0003_task_search, and ranked by trigram word similarity.
+
+    Implements:
+        - ISearchBackend
+    """
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the PostgresTrigramSearchBackend instance.
+        """
+        return "<PostgresTrigramSearchBackend>"
+
+    def search(self, queryset: QuerySet, params: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Returns the limit items most similar to params whose title, priority or status contains it.
+        """
+        matches: Q = Q(title__icontains=params)
+        choices: Q | None = self.choices_filter(queryset, params)
+        if choices is not None:
+            matches |= choices
+        rank = Func(Value(params), F('title'), function='word_similarity', output_field=FloatField())
+        ordering: List[str] = ['-search_rank', *queryset.model._meta.ordering]
+        return list(queryset.alias(search_rank=rank).filter(matches).order_by(*ordering)[:limit])
+
+
+class SQLiteFTSSearchBackend(LikeSearchBackend):
+    """
+    Search backend for SQLite, backed by an FTS5 trigram table over task titles that
+    stores the task_id it is joined on, kept in sync by triggers on insert, update and
+    delete (see migration 0003_task_search). Results are ranked by bm25.
+
+    Implements:
+        - ISearchBackend
+    """
+    fts_table: str = "tasks_task_fts"
+
+    def __init__(self) -> None:
+        self.installed: Dict[str, bool] = {}
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the SQLiteFTSSearchBackend instance.
+        """
+        return "<SQLiteFTSSearchBackend>"
+
+    def is_installed(self, queryset: QuerySet) -> bool:
+        """
+        Checks whether the FTS5 table exists, e.g. it is missing when SQLite lacks the trigram tokenizer.
+        """
+        if queryset.db not in self.installed:
+            connection = connections[queryset.db]
+            self.installed[queryset.db] = self.fts_table in connection.introspection.table_names()
+        return self.installed[queryset.db]
+
+    def search(self, queryset: QuerySet, params: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Returns the limit best ranked items whose title contains params, followed by
+        items whose priority or status contains it.
+        """
+        if len(params) < 3 or not self.is_installed(queryset):
+            return super().search(queryset, params, limit)
+        fts: str = self.fts_table
+        phrase: str = '"' + params.replace('"', '""') + '"'
+        tasks: List[Dict[str, Any]] = list(queryset.extra(
+            tables=[fts],
+            where=[f"{fts}.task_id = tasks_task.task_id", f"{fts} MATCH %s"],
+            params=[phrase],
+            order_by=[f"{fts}.rank", *queryset.model._meta.ordering]
+        )[:limit])
+        choices: Q | None = self.choices_filter(queryset, params)
+        if choices is not None and len(tasks) < limit:
+            found = [task['task_id'] for task in tasks]
+            tasks.extend(queryset.filter(choices).exclude(task_id__in=found)[:limit - len(tasks)])
+        return tasks
+
+
+SEARCH_BACKENDS: Dict[str, type] = {
+    "postgresql": PostgresTrigramSearchBackend,
+    "sqlite": SQLiteFTSSearchBackend,
+}
+
+
+@lru_cache
+def get_search_backend(vendor: str) -> ISearchBackend:
+    """
+    Returns the search backend configured in TASKS_SEARCH_BACKEND, or the best
+    backend available for the given database vendor.
+    """
+    backend_path: str | None = getattr(settings, "TASKS_SEARCH_BACKEND", None)
+    if backend_path:
+        return import_string(backend_path)()
+    return SEARCH_BACKENDS.get(vendor, LikeSearchBackend)()
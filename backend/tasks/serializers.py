@@ -0,0 +1,132 @@
+from functools import lru_cache
+from itertools import islice
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Tuple
+from asgiref.sync import sync_to_async
+from django.db import models
+from .records import TaskBatch
+
+
+def to_utc(value: datetime | None) -> datetime | None:
+    """
+    Converts an aware datetime to UTC, as the database returns it.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc)
+
+
+INSTANCE_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    models.DateTimeField: to_utc,
+}
+
+
+class RowSerializer:
+    """
+    Converts the rows of a model into the dictionaries returned by the API, for a
+    fixed list of fields. It is built once per model and field list (see
+    get_serializer), along with the query reading those fields by primary key:
+    rows read with select() are tuples already holding output values, so each
+    costs a single dict(zip()), while the values of an instance first go through
+    the converters of their fields, so that an instance just written serializes
+    exactly as the row read back from the database.
+    """
+
+    def __init__(self, model: type, fields: Tuple[str, ...]) -> None:
+        self.model = model
+        self.fields = fields
+        concrete: List[models.Field] = [model._meta.get_field(name) for name in fields]
+        self.attnames: Tuple[str, ...] = tuple(field.attname for field in concrete)
+        self.converters: Tuple[Tuple[int, Callable[[Any], Any]], ...] = tuple(
+            (index, converter)
+            for index, field in enumerate(concrete)
+            for field_type, converter in INSTANCE_CONVERTERS.items()
+            if isinstance(field, field_type)
+        )
+        self.by_pk: models.QuerySet = model._default_manager.order_by().values_list(*fields)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the RowSerializer instance.
+        """
+        return f"<RowSerializer model={self.model.__name__} fields={self.fields}>"
+
+    def select(self, queryset: models.QuerySet, *extra: str) -> models.QuerySet:
+        """
+        Returns the queryset as tuples of the serialized fields, followed by the extra
+        fields, which row() and rows() leave out.
+        """
+        return queryset.values_list(*self.fields, *extra)
+
+    def row(self, row: Tuple[Any, ...]) -> Dict[str, Any]:
+        """
+        Converts a tuple read with select() into a dictionary.
+        """
+        return dict(zip(self.fields, row))
+
+    def get(self, pk: Any) -> Dict[str, Any]:
+        """
+        Reads the row with the given primary key into a dictionary, raising the
+        DoesNotExist exception of the model when there is none.
+        """
+        return dict(zip(self.fields, self.by_pk.get(pk=pk)))
+
+    async def aget(self, pk: Any) -> Dict[str, Any]:
+        """
+        Reads the row with the given primary key into a dictionary with the async ORM,
+        raising the DoesNotExist exception of the model when there is none.
+        """
+        return dict(zip(self.fields, await self.by_pk.aget(pk=pk)))
+
+    def rows(self, rows: Iterable[Tuple[Any, ...]]) -> List[Dict[str, Any]]:
+        """
+        Converts tuples read with select() into a list of dictionaries.
+        """
+        fields = self.fields
+        return [dict(zip(fields, row)) for row in rows]
+
+    def batch(self, rows: Iterable[Tuple[Any, ...]]) -> TaskBatch:
+        """
+        Collects tuples read with select() into a TaskBatch, keeping them as tuples.
+        """
+        return TaskBatch(self.fields, list(rows))
+
+    def iter_rows(self, rows: Iterable[Tuple[Any, ...]]) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily converts tuples read with select() into dictionaries.
+        """
+        fields = self.fields
+        for row in rows:
+            yield dict(zip(fields, row))
+
+    async def aiter_rows(self, rows: Iterator[Tuple[Any, ...]], chunk_size: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Lazily converts tuples read with select() into dictionaries from an async
+        context, fetching chunk_size rows at a time in a thread. This is what
+        QuerySet.aiterator does, except that it also runs the query of a values_list
+        queryset on the event loop, which Django refuses.
+        """
+        fields = self.fields
+        while True:
+            chunk: List[Tuple[Any, ...]] = await sync_to_async(list)(islice(rows, chunk_size))
+            for row in chunk:
+                yield dict(zip(fields, row))
+            if len(chunk) < chunk_size:
+                break
+
+    def instance(self, instance: models.Model) -> Dict[str, Any]:
+        """
+        Converts a model instance into a dictionary.
+        """
+        values: List[Any] = [getattr(instance, attname) for attname in self.attnames]
+        for index, converter in self.converters:
+            values[index] = converter(values[index])
+        return dict(zip(self.fields, values))
+
+
+@lru_cache
+def get_serializer(model: type, fields: Tuple[str, ...]) -> RowSerializer:
+    """
+    Returns the serializer of the given fields of model, building it on first use.
+    """
+    return RowSerializer(model, fields)
@@ -1,58 +1,188 @@
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Iterator, Mapping, Sequence, Tuple
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+from .versioning import CollectionVersion, collection_version
+from .coalescing import WriteBuffer
 from .interfaces import (
     IModelCustomGetAll,
+    IModelCustomIterAll,
+    IModelCustomGetPage,
     IModelCustomGetByParams,
     IModelCustomGetById,
+    IModelCustomGetItemVersion,
     IModelCustomCreate,
+    IModelCustomBulkCreate,
+    IModelCustomBulkUpsert,
     IModelCustomUpdate,
+    IModelCustomPartialUpdate,
     IModelCustomDelete,
+    IModelCustomBatch,
+    IModelCustomTransition,
+    IModelCustomGetMeta,
+    IAsyncModelCustomGetAll,
+    IAsyncModelCustomIterAll,
+    IAsyncModelCustomGetPage,
+    IAsyncModelCustomGetById,
+    IAsyncModelCustomGetItemVersion,
+    IAsyncModelCustomCreate,
+    IAsyncModelCustomUpdate,
+    IAsyncModelCustomPartialUpdate,
+    IAsyncModelCustomDelete,
     IServiceGetAll,
+    IServiceIterAll,
+    IServiceGetPage,
     IServiceGetByParams,
     IServiceGetById,
+    IServiceGetItemVersion,
     IServiceCreate,
+    IServiceBulkCreate,
+    IServiceBulkUpsert,
     IServiceUpdate,
-    IServiceDelete
+    IServicePartialUpdate,
+    IServiceDelete,
+    IServiceBatch,
+    IServiceTransition,
+    IServiceGetMeta,
+    IServiceGetStats,
+    IServiceGetVersion,
+    IAsyncServiceGetAll,
+    IAsyncServiceIterAll,
+    IAsyncServiceGetPage,
+    IAsyncServiceGetByParams,
+    IAsyncServiceGetById,
+    IAsyncServiceGetItemVersion,
+    IAsyncServiceCreate,
+    IAsyncServiceUpdate,
+    IAsyncServicePartialUpdate,
+    IAsyncServiceDelete,
+    IAsyncServiceGetVersion
 )
 
 
 class TaskService(
     IServiceGetAll,
+    IServiceIterAll,
+    IServiceGetPage,
     IServiceGetByParams,
     IServiceGetById,
+    IServiceGetItemVersion,
     IServiceCreate,
+    IServiceBulkCreate,
+    IServiceBulkUpsert,
     IServiceUpdate,
-    IServiceDelete
+    IServicePartialUpdate,
+    IServiceDelete,
+    IServiceBatch,
+    IServiceTransition,
+    IServiceGetMeta,
+    IServiceGetStats,
+    IServiceGetVersion,
+    IAsyncServiceGetAll,
+    IAsyncServiceIterAll,
+    IAsyncServiceGetPage,
+    IAsyncServiceGetByParams,
+    IAsyncServiceGetById,
+    IAsyncServiceGetItemVersion,
+    IAsyncServiceCreate,
+    IAsyncServiceUpdate,
+    IAsyncServicePartialUpdate,
+    IAsyncServiceDelete,
+    IAsyncServiceGetVersion
 ):
     """
     Service layer for Task business logic.
 
     Implements:
         - IServiceGetAll
+        - IServiceIterAll
+        - IServiceGetPage
         - IServiceGetByParams
         - IServiceGetById
+        - IServiceGetItemVersion
         - IServiceCreate
+        - IServiceBulkCreate
+        - IServiceBulkUpsert
         - IServiceUpdate
+        - IServicePartialUpdate
         - IServiceDelete
+        - IServiceBatch
+        - IServiceTransition
+        - IServiceGetMeta
+        - IServiceGetStats
+        - IServiceGetVersion
+        - IAsyncServiceGetAll
+        - IAsyncServiceIterAll
+        - IAsyncServiceGetPage
+        - IAsyncServiceGetByParams
+        - IAsyncServiceGetById
+        - IAsyncServiceGetItemVersion
+        - IAsyncServiceCreate
+        - IAsyncServiceUpdate
+        - IAsyncServicePartialUpdate
+        - IAsyncServiceDelete
+        - IAsyncServiceGetVersion
     """
 
+    def __init__(self, version: CollectionVersion | None = None, write_buffer: WriteBuffer | None = None) -> None:
+        self.version = version or collection_version
+        self.write_buffer = write_buffer
+
     def __repr__(self) -> str:
         """
         Return a string representation of the TaskService instance.
         """
         return "<TaskService>"
 
-    def get_all(self, model: IModelCustomGetAll) -> List[Dict[str, Any]]:
+    def get_all(
+        self,
+        model: IModelCustomGetAll,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> Sequence[Mapping[str, Any]]:
+        """
+        Retrieve all tasks matching the filters from the model.
+        """
+        return model.custom_get_all(filters, fields)
+
+    def iter_all(
+        self,
+        model: IModelCustomIterAll,
+        chunk_size: int,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all tasks matching the filters from the model without loading them all at once.
+        """
+        return model.custom_iter_all(chunk_size, filters, fields)
+
+    def get_page(
+        self,
+        model: IModelCustomGetPage,
+        limit: int,
+        cursor: str | None = None,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> Dict[str, Any]:
         """
-        Retrieve all tasks from the model.
+        Retrieve a page of tasks matching the filters from the model, starting after the given cursor.
         """
-        return model.custom_get_all()
+        return model.custom_get_page(limit, cursor, filters, fields)
 
-    def get_by_params(self, model: IModelCustomGetByParams, param: str) -> List[Dict[str, Any]]:
+    def get_by_params(
+        self,
+        model: IModelCustomGetByParams,
+        param: str,
+        limit: int | None = None,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> List[Dict[str, Any]]:
         """
-        Retrieve tasks from the model filtered by parameters.
+        Retrieve the best matching tasks from the model filtered by parameters.
         """
-        return model.custom_get_by_params(param)
+        return model.custom_get_by_params(param, limit, filters, fields)
 
     def get_by_id(self, model: IModelCustomGetById, id: str) -> Dict[str, Any]:
         """
@@ -60,22 +190,240 @@ class TaskService(
         """
         return model.custom_get_by_id(id)
 
+    def get_item_version(self, model: IModelCustomGetItemVersion, id: str) -> int:
+        """
+        Retrieve the version of a single task by its ID from the model.
+        """
+        return model.custom_get_item_version(id)
+
     def create(self, model: IModelCustomCreate, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Create a new task in the model.
+        Create a new task in the model. With a write buffer, the task is created along
+        with those of concurrent requests, which requires the model to support custom_bulk_create.
         """
-        return model.custom_create(data)
+        if self.write_buffer is not None:
+            task = self.write_buffer.submit(model, data)
+        else:
+            task = model.custom_create(data)
+        self.version.bump()
+        return task
 
-    def update(self, model: IModelCustomUpdate, data: Dict[str, Any]) -> Dict[str, Any]:
+    def bulk_create(self, model: IModelCustomBulkCreate, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create many tasks in the model, TASKS_BULK_BATCH_SIZE rows per statement.
+        """
+        tasks = model.custom_bulk_create(items, settings.TASKS_BULK_BATCH_SIZE)
+        self.version.bump()
+        return tasks
+
+    def bulk_upsert(self, model: IModelCustomBulkUpsert, items: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Create or update many tasks in the model by external reference, TASKS_BULK_BATCH_SIZE rows per statement.
+        """
+        counts = model.custom_bulk_upsert(items, settings.TASKS_BULK_BATCH_SIZE)
+        self.version.bump()
+        return counts
+
+    def update(self, model: IModelCustomUpdate, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
         """
         Update a task in the model. If status is set to DONE, set end_time to the moment of update.
         """
         if data.get('status') == 'DONE':
             data['end_time'] = datetime.now(timezone.utc)
-        return model.custom_update(data)
+        task = model.custom_update(data, version)
+        self.version.bump()
+        return task
+
+    def partial_update(
+        self,
+        model: IModelCustomPartialUpdate,
+        id: str,
+        data: Dict[str, Any],
+        version: int | None = None
+    ) -> Dict[str, Any]:
+        """
+        Change some fields of a task in the model. If status is set to DONE, set end_time to the moment of update.
+        """
+        if isinstance(data, dict) and data.get('status') == 'DONE':
+            data['end_time'] = datetime.now(timezone.utc)
+        task = model.custom_partial_update(id, data, version)
+        self.version.bump()
+        return task
 
     def delete(self, model: IModelCustomDelete, id: str) -> bool:
         """
         Delete a task from the model by ID.
         """
-        return model.custom_delete(id)
+        deleted = model.custom_delete(id)
+        self.version.bump()
+        return deleted
+
+    def batch(self, model: IModelCustomBatch, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Apply update and delete operations in the model. Updates setting status to DONE
+        also set end_time to the moment of update, as single updates do.
+        """
+        now = datetime.now(timezone.utc)
+        for operation in operations:
+            data = operation.get('data') if isinstance(operation, dict) and operation.get('op') == 'update' else None
+            if isinstance(data, dict) and data.get('status') == 'DONE':
+                data['end_time'] = now
+        results = model.custom_batch(operations)
+        self.version.bump()
+        return results
+
+    def transition(self, model: IModelCustomTransition, filters: Dict[str, Any], status: str) -> int:
+        """
+        Move the tasks matching the filters to the status. If status is DONE, set their
+        end_time to the moment of update, as single updates do.
+        """
+        end_time = datetime.now(timezone.utc) if status == 'DONE' else None
+        count = model.custom_transition(filters, status, end_time)
+        self.version.bump()
+        return count
+
+    def get_meta(self, model: IModelCustomGetMeta) -> Dict[str, Any]:
+        """
+        Retrieve the metadata shared by all tasks, such as the priority and status choices.
+        """
+        return model.custom_get_meta()
+
+    def get_version(self) -> Tuple[str, datetime]:
+        """
+        Retrieve the current collection version and the time of the last write.
+        """
+        return self.version.get()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retrieve the runtime statistics of the service: those of its write buffer, if any.
+        """
+        if self.write_buffer is not None:
+            return {"write_buffer": self.write_buffer.get_stats()}
+        return {}
+
+    async def aget_all(
+        self,
+        model: IAsyncModelCustomGetAll,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> Sequence[Mapping[str, Any]]:
+        """
+        Retrieve all tasks matching the filters from the model asynchronously.
+        """
+        return await model.acustom_get_all(filters, fields)
+
+    def aiter_all(
+        self,
+        model: IAsyncModelCustomIterAll,
+        chunk_size: int,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate asynchronously over all tasks matching the filters from the model.
+        """
+        return model.acustom_iter_all(chunk_size, filters, fields)
+
+    async def aget_page(
+        self,
+        model: IAsyncModelCustomGetPage,
+        limit: int,
+        cursor: str | None = None,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve a page of tasks matching the filters from the model asynchronously.
+        """
+        return await model.acustom_get_page(limit, cursor, filters, fields)
+
+    async def aget_by_params(
+        self,
+        model: IModelCustomGetByParams,
+        param: str,
+        limit: int | None = None,
+        filters: Dict[str, Any] | None = None,
+        fields: List[str] | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the best matching tasks from the model. The search backends run raw
+        SQL, which the async ORM has no API for, so the search runs in a thread.
+        """
+        return await sync_to_async(self.get_by_params)(model, param, limit, filters, fields)
+
+    async def aget_by_id(self, model: IAsyncModelCustomGetById, id: str) -> Dict[str, Any]:
+        """
+        Retrieve a single task by its ID from the model asynchronously.
+        """
+        return await model.acustom_get_by_id(id)
+
+    async def aget_item_version(self, model: IAsyncModelCustomGetItemVersion, id: str) -> int:
+        """
+        Retrieve the version of a single task by its ID from the model asynchronously.
+        """
+        return await model.acustom_get_item_version(id)
+
+    def submit_in_thread(self, model: IModelCustomBulkCreate, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Submit a task to the write buffer from a thread of the executor, then close the
+        database connections a flush opened in that thread: no request cycle ends there
+        to close them, so each executor thread would otherwise hold one open for good.
+        """
+        try:
+            return self.write_buffer.submit(model, data)
+        finally:
+            connections.close_all()
+
+    async def acreate(self, model: IAsyncModelCustomCreate, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new task in the model asynchronously. With a write buffer, the task is
+        submitted from a thread of its own, which waits for the batch to be committed;
+        the single thread shared by thread-sensitive calls would serialize the creates.
+        """
+        if self.write_buffer is not None:
+            task = await sync_to_async(self.submit_in_thread, thread_sensitive=False)(model, data)
+        else:
+            task = await model.acustom_create(data)
+        await self.version.abump()
+        return task
+
+    async def aupdate(self, model: IAsyncModelCustomUpdate, data: Dict[str, Any], version: int | None = None) -> Dict[str, Any]:
+        """
+        Update a task in the model asynchronously. If status is set to DONE, set end_time to the moment of update.
+        """
+        if data.get('status') == 'DONE':
+            data['end_time'] = datetime.now(timezone.utc)
+        task = await model.acustom_update(data, version)
+        await self.version.abump()
+        return task
+
+    async def apartial_update(
+        self,
+        model: IAsyncModelCustomPartialUpdate,
+        id: str,
+        data: Dict[str, Any],
+        version: int | None = None
+    ) -> Dict[str, Any]:
+        """
+        Change some fields of a task in the model asynchronously. If status is set to DONE, set end_time to the moment of update.
+        """
+        if isinstance(data, dict) and data.get('status') == 'DONE':
+            data['end_time'] = datetime.now(timezone.utc)
+        task = await model.acustom_partial_update(id, data, version)
+        await self.version.abump()
+        return task
+
+    async def adelete(self, model: IAsyncModelCustomDelete, id: str) -> bool:
+        """
+        Delete a task from the model by ID asynchronously.
+        """
+        deleted = await model.acustom_delete(id)
+        await self.version.abump()
+        return deleted
+
+    async def aget_version(self) -> Tuple[str, datetime]:
+        """
+        Retrieve the current collection version and the time of the last write asynchronously.
+        """
+        return await self.version.aget()
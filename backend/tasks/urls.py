@@ -1,14 +1,28 @@
+from django.conf import settings
 from django.urls import path
-from .views import TaskView, GetTasksView
+from .views import TaskView, AsyncTaskView, BulkTaskView, UpsertTasksView, BatchTaskView, TransitionTasksView, GetTasksView, AsyncGetTasksView, TaskMetaView, TaskStatsView
 
 ###   Manual DI   #########################################
 from .services import TaskService
+from .cache import CachedTaskService
+from .coalescing import WriteBuffer
+TASK_SERVICE = TaskService(write_buffer=WriteBuffer() if settings.TASKS_WRITE_BUFFER else None)
+if settings.TASKS_CACHE_ENABLED:
+    TASK_SERVICE = CachedTaskService(TASK_SERVICE)
+TASK_VIEW = AsyncTaskView if settings.TASKS_ASYNC_VIEWS else TaskView
+TASK_LIST_VIEW = AsyncGetTasksView if settings.TASKS_ASYNC_VIEWS else GetTasksView
 ###########################################################
 
 
 app_name = "tasks"
 urlpatterns = [
-    path("", GetTasksView.as_view(), kwargs={"service": TaskService()}, name="index"),
-    path("create", TaskView.as_view(), kwargs={"service": TaskService()}, name="create"),
-    path("<uuid:id>", TaskView.as_view(), kwargs={"service": TaskService()}, name="task-detail")
+    path("", TASK_LIST_VIEW.as_view(), kwargs={"service": TASK_SERVICE}, name="index"),
+    path("create", TASK_VIEW.as_view(), kwargs={"service": TASK_SERVICE}, name="create"),
+    path("bulk", BulkTaskView.as_view(), kwargs={"service": TASK_SERVICE}, name="bulk"),
+    path("upsert", UpsertTasksView.as_view(), kwargs={"service": TASK_SERVICE}, name="upsert"),
+    path("batch", BatchTaskView.as_view(), kwargs={"service": TASK_SERVICE}, name="batch"),
+    path("transition", TransitionTasksView.as_view(), kwargs={"service": TASK_SERVICE}, name="transition"),
+    path("meta", TaskMetaView.as_view(), kwargs={"service": TASK_SERVICE}, name="meta"),
+    path("stats", TaskStatsView.as_view(), kwargs={"service": TASK_SERVICE}, name="stats"),
+    path("<uuid:id>", TASK_VIEW.as_view(), kwargs={"service": TASK_SERVICE}, name="task-detail")
 ]
\ No newline at end of file
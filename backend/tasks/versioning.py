@@ -0,0 +1,82 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Tuple
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+class CollectionVersion:
+    """
+    Version of the whole task collection, kept in the tasks cache and replaced by a
+    new random token on every write. Cached reads are keyed on the current token, so
+    a write invalidates all of them at once without enumerating keys.
+    """
+    key: str = "tasks:version"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the CollectionVersion instance.
+        """
+        return "<CollectionVersion>"
+
+    @property
+    def cache(self) -> Any:
+        """
+        The cache backend holding the version, configured by TASKS_CACHE_ALIAS.
+        """
+        return caches[settings.TASKS_CACHE_ALIAS]
+
+    def get(self) -> Tuple[str, datetime]:
+        """
+        Returns the current version token and the time of the last write.
+        """
+        version: Tuple[str, datetime] | None = self.cache.get(self.key)
+        if version is None:
+            version = (uuid.uuid4().hex, datetime.now(timezone.utc).replace(microsecond=0))
+            if not self.cache.add(self.key, version, timeout=None):
+                version = self.cache.get(self.key, version)
+        return version
+
+    async def aget(self) -> Tuple[str, datetime]:
+        """
+        Returns the current version token and the time of the last write, with the
+        asynchronous cache API.
+        """
+        version: Tuple[str, datetime] | None = await self.cache.aget(self.key)
+        if version is None:
+            version = (uuid.uuid4().hex, datetime.now(timezone.utc).replace(microsecond=0))
+            if not await self.cache.aadd(self.key, version, timeout=None):
+                version = await self.cache.aget(self.key, version)
+        return version
+
+    def bump(self) -> None:
+        """
+        Replaces the version token, invalidating every read cached under the previous one.
+        """
+        self.cache.set(self.key, (uuid.uuid4().hex, datetime.now(timezone.utc).replace(microsecond=0)), timeout=None)
+
+    async def abump(self) -> None:
+        """
+        Replaces the version token like bump, with the asynchronous cache API.
+        """
+        await self.cache.aset(self.key, (uuid.uuid4().hex, datetime.now(timezone.utc).replace(microsecond=0)), timeout=None)
+
+    def bump_on_commit(self) -> None:
+        """
+        Replaces the version token now and again once the current transaction commits,
+        so reads cached while the write was still uncommitted are discarded as well.
+        """
+        self.bump()
+        transaction.on_commit(self.bump)
+
+
+collection_version = CollectionVersion()
+
+
+def bump_collection_version(sender: Any, **kwargs: Any) -> None:
+    """
+    Signal receiver bumping the collection version when a Task is saved or deleted
+    outside the service layer (e.g. from the admin).
+    """
+    collection_version.bump_on_commit()
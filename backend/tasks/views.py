@@ -1,34 +1,209 @@
-import re, json
-from datetime import datetime
-from typing import Any, Dict
-from django.http import HttpRequest, HttpResponse, JsonResponse, HttpResponseBadRequest, HttpResponseRedirect, HttpResponseServerError
+import re, json, hashlib
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Iterator, Mapping, Sequence, Tuple
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse, HttpResponseBadRequest, HttpResponseRedirect, HttpResponseServerError
 from django.template import loader
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, parse_etags
 from django.urls import reverse
 from django.views import View
 from .models import Task
-from .exceptions import NotFound
+from .idempotency import IDEMPOTENCY_STORE
+from .records import TaskBatch
+from .renderers import select_renderer
+from .responses import dumps
+from .exceptions import NotFound, InvalidCursor, InvalidItems, InvalidQuery, Conflict
 from .interfaces import (
     IServiceGetAll,
+    IServiceIterAll,
+    IServiceGetPage,
     IServiceGetByParams,
     IServiceGetById,
+    IServiceGetItemVersion,
     IServiceCreate,
+    IServiceBulkCreate,
+    IServiceBulkUpsert,
     IServiceUpdate,
+    IServicePartialUpdate,
     IServiceDelete,
+    IServiceBatch,
+    IServiceTransition,
+    IServiceGetMeta,
+    IServiceGetStats,
+    IServiceGetVersion,
+    IAsyncServiceGetAll,
+    IAsyncServiceIterAll,
+    IAsyncServiceGetPage,
+    IAsyncServiceGetByParams,
+    IAsyncServiceGetById,
+    IAsyncServiceGetItemVersion,
+    IAsyncServiceCreate,
+    IAsyncServiceUpdate,
+    IAsyncServicePartialUpdate,
+    IAsyncServiceDelete,
+    IAsyncServiceGetVersion,
     IViewGetList,
     IViewGetById,
     IViewCreate,
+    IViewBulkCreate,
+    IViewBulkUpsert,
     IViewUpdate,
-    IViewDelete
+    IViewPartialUpdate,
+    IViewDelete,
+    IViewBatch,
+    IViewTransition,
+    IViewGetMeta,
+    IViewGetStats,
+    IAsyncViewGetList,
+    IAsyncViewGetById,
+    IAsyncViewCreate,
+    IAsyncViewUpdate,
+    IAsyncViewPartialUpdate,
+    IAsyncViewDelete
 )
 
 
 TASK_MODEL = Task()  # Provisory model instance for type hinting and dependency injection
 
+class ConditionalGetMixin:
+    """
+    Conditional GET support for views over the task collection. The validators are
+    derived from the collection version, so a client revalidating an unchanged
+    resource gets a 304 without the tasks being queried or serialized. Like the read
+    cache, they are only sent when TASKS_CACHE_ENABLED, as the version must be shared
+    by every process serving the collection.
+    """
+
+    def validators(self, request: HttpRequest, service: Any, media_type: str | None = None) -> Tuple[str, datetime] | None:
+        """
+        Returns the ETag and Last-Modified of the requested resource, in the given media
+        type or else the one negotiated for the request, or None when the service does
+        not report a collection version.
+        """
+        if not settings.TASKS_CACHE_ENABLED or not isinstance(service, IServiceGetVersion):
+            return None
+        return self.version_validators(request, service.get_version(), media_type)
+
+    async def avalidators(self, request: HttpRequest, service: Any, media_type: str | None = None) -> Tuple[str, datetime] | None:
+        """
+        Returns the validators like validators, reading the collection version with
+        the asynchronous service API.
+        """
+        if not settings.TASKS_CACHE_ENABLED or not isinstance(service, IAsyncServiceGetVersion):
+            return None
+        return self.version_validators(request, await service.aget_version(), media_type)
+
+    def version_validators(self, request: HttpRequest, version: Tuple[str, datetime], media_type: str | None = None) -> Tuple[str, datetime]:
+        """
+        Returns the ETag and Last-Modified of the requested resource at the given
+        collection version, in the given or negotiated media type.
+        """
+        token, last_modified = version
+        media_type = media_type or select_renderer(request).media_type
+        digest: str = hashlib.sha256(f"{token}:{media_type}:{request.get_full_path()}".encode()).hexdigest()
+        return f'"{digest[:32]}"', last_modified
+
+    def task_validators(self, request: HttpRequest, task_id: Any, version: int | None) -> Tuple[str, None] | None:
+        """
+        Returns the validators of a single task at the given version, in the media type
+        negotiated for the request, or None without a version. The ETag is unique to the
+        task, its version and the media type, and starts with the version the client
+        echoes in If-Match to update the task, e.g. "3-9f86d081884c7d65". Tasks carry no
+        modification time, so there is no Last-Modified.
+        """
+        if version is None:
+            return None
+        media_type: str = select_renderer(request).media_type
+        digest: str = hashlib.sha256(f"{task_id}:{version}:{media_type}".encode()).hexdigest()
+        return f'"{version}-{digest[:16]}"', None
+
+    def not_modified(self, request: HttpRequest, validators: Tuple[str, datetime | None] | None) -> HttpResponse | None:
+        """
+        Returns the 304 (or 412) response answering the request's preconditions,
+        or None when the resource must be sent.
+        """
+        if validators is None:
+            return None
+        etag, last_modified = validators
+        response = get_conditional_response(
+            request, etag=etag, last_modified=int(last_modified.timestamp()) if last_modified is not None else None
+        )
+        if response is not None:
+            self.set_validators(response, validators)
+        return response
+
+    def set_validators(self, response: HttpResponse, validators: Tuple[str, datetime | None] | None) -> HttpResponse:
+        """
+        Sets the ETag and Last-Modified headers on the response, which vary with the
+        negotiated media type.
+        """
+        if validators is not None:
+            etag, last_modified = validators
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified.timestamp())
+            patch_vary_headers(response, ["Accept"])
+        return response
+
+
+class RendererMixin:
+    """
+    Content negotiation for the task payloads: success payloads are encoded by the
+    renderer the request's Accept header prefers among TASKS_RENDERERS, JSON by
+    default. Errors are always JSON.
+    """
+
+    def render(self, request: HttpRequest, data: Dict[str, Any], status: int) -> HttpResponse:
+        """
+        Returns a response holding data encoded by the negotiated renderer.
+        """
+        renderer = select_renderer(request)
+        response = HttpResponse(renderer.render(data), content_type=renderer.media_type, status=status)
+        patch_vary_headers(response, ["Accept"])
+        return response
+
+
+class TaskFiltersMixin:
+    """
+    Parsing of the structured filter query parameters shared by the views selecting
+    tasks, so they all select the same tasks for the same query string.
+    """
+
+    def parse_filters(self, request: HttpRequest) -> Dict[str, Any]:
+        """
+        Convert the structured filter query parameters into validated filter values.
+        Dates are ISO 8601 strings, read as UTC when they carry no offset.
+        """
+        filters: Dict[str, Any] = {}
+        for name in Task.FILTER_LOOKUPS:
+            value = request.GET.get(name)
+            if value is None:
+                continue
+            if name == "status":
+                if value not in Task.STATUS_CHOICES:
+                    raise ValueError(f"Invalid status: {value}")
+            elif name == "priority":
+                if value not in Task.PRIORITY_CHOICES:
+                    raise ValueError(f"Invalid priority: {value}")
+            else:
+                value = datetime.fromisoformat(value)
+                if value.tzinfo is None:
+                    value = value.replace(tzinfo=timezone.utc)
+            filters[name] = value
+        return filters
+
+
 class TaskView(
     View,
+    ConditionalGetMixin,
+    RendererMixin,
     IViewGetById,
     IViewCreate,
     IViewUpdate,
+    IViewPartialUpdate,
     IViewDelete
 ):
     """
@@ -36,10 +211,13 @@ class TaskView(
 
     Inherits from:
         - View
+        - ConditionalGetMixin
+        - RendererMixin
     Implements:
         - IViewGetById
         - IViewCreate
         - IViewUpdate
+        - IViewPartialUpdate
         - IViewDelete
     """
     title: str = "Tasks"
@@ -69,15 +247,57 @@ class TaskView(
             task["end_time"] = self.isotodatetime(task["end_time"])
         return task
 
+    def if_match(self, request: HttpRequest) -> int | None:
+        """
+        Returns the task version required by the If-Match header, read from an ETag of
+        the task (e.g. "3-9f86d081884c7d65") or given alone (e.g. "3"), or None when the
+        header is absent or "*". Raises ValueError when it does not name exactly one version.
+        """
+        header: str | None = request.headers.get("If-Match")
+        if header is None:
+            return None
+        etags: List[str] = parse_etags(header)
+        if etags == ["*"]:
+            return None
+        if len(etags) != 1:
+            raise ValueError(f"Invalid If-Match header: {header}")
+        return int(etags[0].removeprefix("W/").strip('"').partition("-")[0])
+
     def post(self, request: HttpRequest, service: IServiceCreate) -> HttpResponse:
         """
-        Create a new task and return as JSON.
+        Create a new task and return as JSON. A request sent with an Idempotency-Key
+        header creates the task once: retries with the same key and body replay the
+        first response.
+        """
+        key: str | None = request.headers.get("Idempotency-Key")
+        if key is None:
+            return self.create(request, service)
+        if not 0 < len(key) <= 255:
+            print(f"Invalid Idempotency-Key header")
+            return JsonResponse({"success": False, "error": "Invalid Idempotency-Key header"}, status=400)
+        try:
+            replay = IDEMPOTENCY_STORE.claim(key, request)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+        if replay is not None:
+            return replay
+        response = self.create(request, service)
+        try:
+            IDEMPOTENCY_STORE.complete(key, response)
+        except Exception as err:
+            print(err)
+        return response
+
+    def create(self, request: HttpRequest, service: IServiceCreate) -> HttpResponse:
+        """
+        Create a new task from the request body and return as JSON.
         """
         try:
             data = self.json_decode(request.body)
             task = service.create(TASK_MODEL, data)
             if task:
-                return JsonResponse({"success": True, "data": task}, status=201)
+                return self.render(request, {"success": True, "data": task}, status=201)
             return JsonResponse({"success": False, "error": "Task not created"}, status=400)
         except Exception as err:
             print(err)
@@ -85,12 +305,23 @@ class TaskView(
 
     def get(self, request: HttpRequest, id: str, service: IServiceGetById) -> HttpResponse:
         """
-        Retrieve a specific task by its ID and return as JSON.
+        Retrieve a specific task by its ID and return as JSON, or 304 when the
+        client's copy is still current. The ETag is derived from the task version, as
+        expected back in If-Match by put and patch; a revalidation reads that version
+        alone, so the task is only queried and serialized when it changed.
         """
         try:
-            _ = request  # Unused parameter, but kept for interface compliance
+            if request.headers.get("If-None-Match") and isinstance(service, IServiceGetItemVersion):
+                validators = self.task_validators(request, id, service.get_item_version(TASK_MODEL, id))
+                not_modified = self.not_modified(request, validators)
+                if not_modified is not None:
+                    return not_modified
             task = service.get_by_id(TASK_MODEL, id)
-            return JsonResponse({"success": True, "data": task}, status=200)
+            validators = self.task_validators(request, task.get("task_id"), task.get("version"))
+            not_modified = self.not_modified(request, validators)
+            if not_modified is not None:
+                return not_modified
+            return self.set_validators(self.render(request, {"success": True, "data": task}, status=200), validators)
         except NotFound as err404:
             print(err404)
             return JsonResponse({"success": False, "error": "Task not found"}, status=404)
@@ -100,18 +331,55 @@ class TaskView(
 
     def put(self, request: HttpRequest, id: str, service: IServiceUpdate) -> HttpResponse:
         """
-        Update an existing task and return as JSON.
+        Update an existing task and return as JSON. With an If-Match header naming the
+        task version the client read, the update is refused with 409 if it changed since.
         """
         try:
             _ = id  # Unused parameter, but kept for interface compliance
+            try:
+                version = self.if_match(request)
+            except ValueError as err400:
+                print(err400)
+                return JsonResponse({"success": False, "error": "Invalid If-Match header"}, status=400)
             data = self.json_decode(request.body)
-            task = service.update(TASK_MODEL, data)
+            task = service.update(TASK_MODEL, data, version)
             if task:
-                return JsonResponse({"success": True, "data": task}, status=200)
+                return self.set_validators(self.render(request, {"success": True, "data": task}, status=200), self.task_validators(request, task.get("task_id"), task.get("version")))
             return JsonResponse({"success": False, "error": "Task not updated"}, status=400)
         except NotFound as err404:
             print(err404)
             return JsonResponse({"success": False, "error": "Task not found"}, status=404)
+        except Conflict as err409:
+            print(err409)
+            return JsonResponse({"success": False, "error": "Task was modified by another request"}, status=409)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+
+    def patch(self, request: HttpRequest, id: str, service: IServicePartialUpdate) -> HttpResponse:
+        """
+        Change only the fields of a task given in the request body and return them as JSON.
+        Honors If-Match like put.
+        """
+        try:
+            try:
+                version = self.if_match(request)
+            except ValueError as err400:
+                print(err400)
+                return JsonResponse({"success": False, "error": "Invalid If-Match header"}, status=400)
+            data = json.loads(request.body)
+            task = service.partial_update(TASK_MODEL, id, data, version)
+            return self.set_validators(self.render(request, {"success": True, "data": task}, status=200), self.task_validators(request, task.get("task_id"), task.get("version")))
+        except (ValueError, ValidationError) as err400:
+            print(err400)
+            errors = err400.message_dict if hasattr(err400, "error_dict") else {"__all__": getattr(err400, "messages", [str(err400)])}
+            return JsonResponse({"success": False, "error": "Invalid task fields", "errors": errors}, status=400)
+        except NotFound as err404:
+            print(err404)
+            return JsonResponse({"success": False, "error": "Task not found"}, status=404)
+        except Conflict as err409:
+            print(err409)
+            return JsonResponse({"success": False, "error": "Task was modified by another request"}, status=409)
         except Exception as err:
             print(err)
             return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
@@ -133,12 +401,352 @@ class TaskView(
             return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
 
 
-class GetTasksView(View, IViewGetList):
+class AsyncTaskView(
+    TaskView,
+    IAsyncViewGetById,
+    IAsyncViewCreate,
+    IAsyncViewUpdate,
+    IAsyncViewPartialUpdate,
+    IAsyncViewDelete
+):
+    """
+    Asynchronous counterpart of TaskView, mounted instead of it when TASKS_ASYNC_VIEWS
+    is on. Under ASGI, its handlers await the async ORM and cache APIs on the event
+    loop, so a request only borrows a thread while its queries run instead of holding
+    one while a slow client sends its body.
+
+    Inherits from:
+        - TaskView
+    Implements:
+        - IAsyncViewGetById
+        - IAsyncViewCreate
+        - IAsyncViewUpdate
+        - IAsyncViewPartialUpdate
+        - IAsyncViewDelete
+    """
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the AsyncTaskView instance.
+        """
+        return "<AsyncTaskView>"
+
+    async def post(self, request: HttpRequest, service: IAsyncServiceCreate) -> HttpResponse:
+        """
+        Create a new task and return as JSON, honouring Idempotency-Key like TaskView.post.
+        """
+        key: str | None = request.headers.get("Idempotency-Key")
+        if key is None:
+            return await self.acreate(request, service)
+        if not 0 < len(key) <= 255:
+            print(f"Invalid Idempotency-Key header")
+            return JsonResponse({"success": False, "error": "Invalid Idempotency-Key header"}, status=400)
+        try:
+            replay = await sync_to_async(IDEMPOTENCY_STORE.claim)(key, request)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+        if replay is not None:
+            return replay
+        response = await self.acreate(request, service)
+        try:
+            await sync_to_async(IDEMPOTENCY_STORE.complete)(key, response)
+        except Exception as err:
+            print(err)
+        return response
+
+    async def acreate(self, request: HttpRequest, service: IAsyncServiceCreate) -> HttpResponse:
+        """
+        Create a new task from the request body and return as JSON.
+        """
+        try:
+            data = self.json_decode(request.body)
+            task = await service.acreate(TASK_MODEL, data)
+            if task:
+                return self.render(request, {"success": True, "data": task}, status=201)
+            return JsonResponse({"success": False, "error": "Task not created"}, status=400)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+
+    async def get(self, request: HttpRequest, id: str, service: IAsyncServiceGetById) -> HttpResponse:
+        """
+        Retrieve a specific task by its ID and return as JSON, or 304 when the
+        client's copy is still current, revalidating against the task version alone
+        like TaskView.get.
+        """
+        try:
+            if request.headers.get("If-None-Match") and isinstance(service, IAsyncServiceGetItemVersion):
+                validators = self.task_validators(request, id, await service.aget_item_version(TASK_MODEL, id))
+                not_modified = self.not_modified(request, validators)
+                if not_modified is not None:
+                    return not_modified
+            task = await service.aget_by_id(TASK_MODEL, id)
+            validators = self.task_validators(request, task.get("task_id"), task.get("version"))
+            not_modified = self.not_modified(request, validators)
+            if not_modified is not None:
+                return not_modified
+            return self.set_validators(self.render(request, {"success": True, "data": task}, status=200), validators)
+        except NotFound as err404:
+            print(err404)
+            return JsonResponse({"success": False, "error": "Task not found"}, status=404)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+
+    async def put(self, request: HttpRequest, id: str, service: IAsyncServiceUpdate) -> HttpResponse:
+        """
+        Update an existing task and return as JSON, honouring If-Match like TaskView.put.
+        """
+        try:
+            _ = id  # Unused parameter, but kept for interface compliance
+            try:
+                version = self.if_match(request)
+            except ValueError as err400:
+                print(err400)
+                return JsonResponse({"success": False, "error": "Invalid If-Match header"}, status=400)
+            data = self.json_decode(request.body)
+            task = await service.aupdate(TASK_MODEL, data, version)
+            if task:
+                return self.set_validators(self.render(request, {"success": True, "data": task}, status=200), self.task_validators(request, task.get("task_id"), task.get("version")))
+            return JsonResponse({"success": False, "error": "Task not updated"}, status=400)
+        except NotFound as err404:
+            print(err404)
+            return JsonResponse({"success": False, "error": "Task not found"}, status=404)
+        except Conflict as err409:
+            print(err409)
+            return JsonResponse({"success": False, "error": "Task was modified by another request"}, status=409)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+
+    async def patch(self, request: HttpRequest, id: str, service: IAsyncServicePartialUpdate) -> HttpResponse:
+        """
+        Change only the fields of a task given in the request body and return them as JSON.
+        Honors If-Match like put.
+        """
+        try:
+            try:
+                version = self.if_match(request)
+            except ValueError as err400:
+                print(err400)
+                return JsonResponse({"success": False, "error": "Invalid If-Match header"}, status=400)
+            data = json.loads(request.body)
+            task = await service.apartial_update(TASK_MODEL, id, data, version)
+            return self.set_validators(self.render(request, {"success": True, "data": task}, status=200), self.task_validators(request, task.get("task_id"), task.get("version")))
+        except (ValueError, ValidationError) as err400:
+            print(err400)
+            errors = err400.message_dict if hasattr(err400, "error_dict") else {"__all__": getattr(err400, "messages", [str(err400)])}
+            return JsonResponse({"success": False, "error": "Invalid task fields", "errors": errors}, status=400)
+        except NotFound as err404:
+            print(err404)
+            return JsonResponse({"success": False, "error": "Task not found"}, status=404)
+        except Conflict as err409:
+            print(err409)
+            return JsonResponse({"success": False, "error": "Task was modified by another request"}, status=409)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+
+    async def delete(self, request: HttpRequest, id: str, service: IAsyncServiceDelete) -> HttpResponse:
+        """
+        Delete a task and return as JSON.
+        """
+        try:
+            _ = request  # Unused parameter, but kept for interface compliance
+            if await service.adelete(TASK_MODEL, id):
+                return JsonResponse({"success": True, "message": "Task deleted"}, status=204)
+            return JsonResponse({"success": False, "error": "Task not deleted"}, status=400)
+        except NotFound as err404:
+            print(err404)
+            return JsonResponse({"success": False, "error": "Task not found"}, status=404)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+
+
+class BulkTaskView(View, IViewBulkCreate):
+    """
+    View for creating many tasks in one request.
+
+    Inherits from:
+        - View
+    Implements:
+        - IViewBulkCreate
+    """
+    title: str = "Tasks"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the BulkTaskView instance.
+        """
+        return "<BulkTaskView>"
+
+    def post(self, request: HttpRequest, service: IServiceBulkCreate) -> HttpResponse:
+        """
+        Create the JSON array of tasks in the request body, all or none of them, and
+        return the per-item results in the order of the array.
+        """
+        try:
+            try:
+                items = json.loads(request.body)
+            except ValueError as err400:
+                print(err400)
+                return JsonResponse({"success": False, "error": "Invalid JSON body"}, status=400)
+            if not isinstance(items, list) or not 0 < len(items) <= settings.TASKS_BULK_MAX_ITEMS:
+                print(f"Invalid bulk payload")
+                return JsonResponse({"success": False, "error": f"Expected an array of 1 to {settings.TASKS_BULK_MAX_ITEMS} tasks"}, status=400)
+            tasks = service.bulk_create(TASK_MODEL, items)
+            results = [{"index": index, "status": 201, "data": task} for index, task in enumerate(tasks)]
+            return JsonResponse({"success": True, "data": results}, status=201)
+        except InvalidItems as err400:
+            print(err400)
+            results = [{"index": index, "status": 400, "errors": errors} for index, errors in err400.errors.items()]
+            return JsonResponse({"success": False, "error": "Invalid tasks", "data": results}, status=400)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+
+
+class UpsertTasksView(View, IViewBulkUpsert):
+    """
+    View for creating or updating many tasks by external reference in one request.
+
+    Inherits from:
+        - View
+    Implements:
+        - IViewBulkUpsert
+    """
+    title: str = "Tasks"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the UpsertTasksView instance.
+        """
+        return "<UpsertTasksView>"
+
+    def post(self, request: HttpRequest, service: IServiceBulkUpsert) -> HttpResponse:
+        """
+        Create or update the JSON array of tasks in the request body by their
+        "external_ref", all or none of them, and return how many were created and updated.
+        """
+        try:
+            try:
+                items = json.loads(request.body)
+            except ValueError as err400:
+                print(err400)
+                return JsonResponse({"success": False, "error": "Invalid JSON body"}, status=400)
+            if not isinstance(items, list) or not 0 < len(items) <= settings.TASKS_BULK_MAX_ITEMS:
+                print(f"Invalid upsert payload")
+                return JsonResponse({"success": False, "error": f"Expected an array of 1 to {settings.TASKS_BULK_MAX_ITEMS} tasks"}, status=400)
+            counts = service.bulk_upsert(TASK_MODEL, items)
+            return JsonResponse({"success": True, "data": counts}, status=200)
+        except InvalidItems as err400:
+            print(err400)
+            results = [{"index": index, "status": 400, "errors": errors} for index, errors in err400.errors.items()]
+            return JsonResponse({"success": False, "error": "Invalid tasks", "data": results}, status=400)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+
+
+class BatchTaskView(View, IViewBatch):
+    """
+    View for applying many update and delete operations in one request.
+
+    Inherits from:
+        - View
+    Implements:
+        - IViewBatch
+    """
+    title: str = "Tasks"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the BatchTaskView instance.
+        """
+        return "<BatchTaskView>"
+
+    def post(self, request: HttpRequest, service: IServiceBatch) -> HttpResponse:
+        """
+        Apply the JSON array of operations in the request body within one transaction
+        and return the status of each operation in the order of the array.
+        """
+        try:
+            try:
+                operations = json.loads(request.body)
+            except ValueError as err400:
+                print(err400)
+                return JsonResponse({"success": False, "error": "Invalid JSON body"}, status=400)
+            if not isinstance(operations, list) or not 0 < len(operations) <= settings.TASKS_BULK_MAX_ITEMS:
+                print(f"Invalid batch payload")
+                return JsonResponse({"success": False, "error": f"Expected an array of 1 to {settings.TASKS_BULK_MAX_ITEMS} operations"}, status=400)
+            results = service.batch(TASK_MODEL, operations)
+            return JsonResponse({"success": True, "data": results}, status=200)
+        except InvalidItems as err400:
+            print(err400)
+            results = [{"index": index, "status": 400, "errors": errors} for index, errors in err400.errors.items()]
+            return JsonResponse({"success": False, "error": "Invalid operations", "data": results}, status=400)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+
+
+class TransitionTasksView(View, TaskFiltersMixin, IViewTransition):
+    """
+    View for moving every task matching the list filters to a status at once.
+
+    Inherits from:
+        - View
+        - TaskFiltersMixin
+    Implements:
+        - IViewTransition
+    """
+    title: str = "Tasks"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the TransitionTasksView instance.
+        """
+        return "<TransitionTasksView>"
+
+    def post(self, request: HttpRequest, service: IServiceTransition) -> HttpResponse:
+        """
+        Move the tasks selected by the same filter query parameters as the list, e.g.
+        ?status=DOING, to the status in the JSON body, e.g. {"status": "DONE"}, and
+        return the number of tasks moved. At least one filter is required.
+        """
+        try:
+            try:
+                filters = self.parse_filters(request)
+                if not filters:
+                    raise ValueError("At least one filter is required")
+            except ValueError as err400:
+                print(err400)
+                return JsonResponse({"success": False, "error": "Invalid filter parameters"}, status=400)
+            try:
+                status = json.loads(request.body)["status"]
+                if status not in Task.STATUS_CHOICES:
+                    raise ValueError(f"Invalid status: {status}")
+            except (ValueError, KeyError, TypeError) as err400:
+                print(err400)
+                return JsonResponse({"success": False, "error": "Invalid status"}, status=400)
+            count = service.transition(TASK_MODEL, filters, status)
+            return JsonResponse({"success": True, "data": {"updated": count}}, status=200)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+
+
+class GetTasksView(View, ConditionalGetMixin, RendererMixin, TaskFiltersMixin, IViewGetList):
     """
     View for retrieving a list of tasks.
 
     Inherits from:
         - View
+        - ConditionalGetMixin
+        - RendererMixin
+        - TaskFiltersMixin
     Implements:
         - IViewGetList
     """
@@ -150,21 +758,307 @@ class GetTasksView(View, IViewGetList):
         """
         return "<GetTasksView>"
 
-    def get(self, request: HttpRequest, service: IServiceGetByParams | IServiceGetAll) -> HttpResponse:
+    def parse_limit(self, limit: str) -> int:
+        """
+        Convert the "limit" query parameter into a page size, capped at the maximum page size.
+        """
+        page_size: int = int(limit)
+        if page_size < 1:
+            raise ValueError(f"Invalid page size: {page_size}")
+        return min(page_size, settings.TASKS_MAX_PAGE_SIZE)
+
+    def parse_fields(self, fields: str) -> List[str]:
+        """
+        Convert the comma separated "fields" query parameter into the list of fields
+        to return, always starting with task_id.
+        """
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        allowed = {field.name for field in Task._meta.concrete_fields}
+        for name in names:
+            if name not in allowed:
+                raise ValueError(f"Invalid field: {name}")
+        return ["task_id", *dict.fromkeys(name for name in names if name != "task_id")]
+
+    def parse_format(self, name: str | None) -> bool:
+        """
+        Convert the "format" query parameter into whether the columnar format was requested.
+        """
+        if name not in (None, "objects", "columnar"):
+            raise ValueError(f"Invalid format: {name}")
+        return name == "columnar"
+
+    def columnar(self, tasks: Sequence[Mapping[str, Any]], fields: List[str] | None) -> Dict[str, Any]:
+        """
+        Convert tasks into the columnar format: the names of the columns once, followed
+        by one array of values per task. A TaskBatch already holds its rows as tuples
+        read with values_list, so they are sent as they are.
+        """
+        if isinstance(tasks, TaskBatch):
+            return {"columns": list(tasks.fields), "rows": tasks.rows}
+        columns: List[str] = fields or Task.SUMMARY_FIELDS
+        return {"columns": columns, "rows": [[task[name] for name in columns] for task in tasks]}
+
+    def stream_json(self, tasks: Iterator[Dict[str, Any]], chunk_size: int, columns: List[str] | None = None) -> Iterator[bytes]:
+        """
+        Encode tasks incrementally into the same envelope as the JSON list response,
+        yielding one chunk of bytes per chunk_size tasks; as arrays of the values of
+        the given columns when the columnar format was requested.
+        """
+        head, tail = self.stream_envelope(columns)
+        yield head
+        chunk: List[Any] = []
+        separator = b""
+        for task in tasks:
+            chunk.append(task if columns is None else [task[name] for name in columns])
+            if len(chunk) >= chunk_size:
+                yield separator + dumps(chunk)[1:-1]
+                separator = b", "
+                chunk = []
+        if chunk:
+            yield separator + dumps(chunk)[1:-1]
+        yield tail
+
+    def stream_envelope(self, columns: List[str] | None = None) -> Tuple[bytes, bytes]:
+        """
+        Returns the bytes opening and closing the envelope of a streamed list, around
+        the encoded tasks.
+        """
+        if columns is None:
+            return b'{"success": true, "data": [', b"]}"
+        return b'{"success": true, "data": {"columns": ' + dumps(columns) + b', "rows": [', b"]}}"
+
+    def parse_query(self, request: HttpRequest) -> Dict[str, Any]:
         """
-        Retrieve tasks either by search parameters or all tasks, return as JSON.
+        Convert the query parameters of the list into the arguments of the service call,
+        raising InvalidQuery with the error to return when one of them is invalid.
         """
+        params = request.GET.get("search")
+        limit = request.GET.get("limit")
         try:
-            params = request.GET.get("search")
-            if params:
-                pattern = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_\-.\s]{1,48}[a-zA-Z0-9]$")
-                if pattern.match(params) is None:
-                    print(f"Invalid search parameters")
-                    return JsonResponse({"success": False, "error": "Invalid search parameters"}, status=400)
-                tasks = service.get_by_params(TASK_MODEL, params)
+            page_size = self.parse_limit(limit) if limit is not None else None
+        except ValueError as err400:
+            raise InvalidQuery("Invalid limit parameter") from err400
+        try:
+            filters = self.parse_filters(request)
+        except ValueError as err400:
+            raise InvalidQuery("Invalid filter parameters") from err400
+        try:
+            fields = self.parse_fields(request.GET["fields"]) if "fields" in request.GET else None
+        except ValueError as err400:
+            raise InvalidQuery("Invalid fields parameter") from err400
+        try:
+            columnar = self.parse_format(request.GET.get("format"))
+        except ValueError as err400:
+            raise InvalidQuery("Invalid format parameter") from err400
+        if params and re.match(r"^[a-zA-Z0-9][a-zA-Z0-9_\-.\s]{1,48}[a-zA-Z0-9]$", params) is None:
+            raise InvalidQuery("Invalid search parameters")
+        if params and request.GET.get("cursor"):
+            raise InvalidQuery("Search results cannot be paged with a cursor")
+        return {
+            "params": params,
+            "page_size": page_size,
+            "cursor": request.GET.get("cursor"),
+            "stream": request.GET.get("stream") in ("1", "true"),
+            "all": request.GET.get("all") in ("1", "true"),
+            "filters": filters,
+            "fields": fields,
+            "columns": (fields or Task.SUMMARY_FIELDS) if columnar else None
+        }
+
+    def media_type(self, request: HttpRequest, query: Dict[str, Any]) -> str:
+        """
+        Returns the media type the tasks selected by the query are sent in: streamed
+        lists are always JSON, other responses use the negotiated renderer.
+        """
+        if query["stream"] and self.unpaged(query):
+            return "application/json"
+        return select_renderer(request).media_type
+
+    def unpaged(self, query: Dict[str, Any]) -> bool:
+        """
+        Returns whether the query asks for every task at once rather than one page:
+        only a stream or an explicit all=1 without a limit, cursor or search does.
+        """
+        return not query["params"] and query["page_size"] is None and not query["cursor"]
+
+    def list_data(self, tasks: Sequence[Mapping[str, Any]], query: Dict[str, Any]) -> Any:
+        """
+        Returns the tasks in the format the query requested.
+        """
+        return self.columnar(tasks, query["fields"]) if query["columns"] is not None else tasks
+
+    def get(self, request: HttpRequest, service: IServiceGetByParams | IServiceGetAll | IServiceGetPage | IServiceIterAll) -> HttpResponse:
+        """
+        Retrieve tasks either by search parameters, one page at a time, as a stream or all tasks, return as JSON.
+        Without a search, a page of TASKS_PAGE_SIZE tasks is returned unless stream=1 or all=1 asks
+        for every task; a search cannot be combined with a cursor. With format=columnar, the tasks are sent as {"columns": [...], "rows": [[...], ...]}.
+        Answers 304 when the client's copy of the requested list is still current.
+        """
+        try:
+            try:
+                query = self.parse_query(request)
+            except InvalidQuery as err400:
+                print(err400.__cause__ or err400)
+                return JsonResponse({"success": False, "error": err400.message}, status=400)
+            validators = self.validators(request, service, self.media_type(request, query))
+            not_modified = self.not_modified(request, validators)
+            if not_modified is not None:
+                return not_modified
+            filters, fields = query["filters"], query["fields"]
+            if query["params"]:
+                tasks = service.get_by_params(TASK_MODEL, query["params"], query["page_size"], filters, fields)
+            elif query["stream"] and self.unpaged(query):
+                chunk_size = settings.TASKS_STREAM_CHUNK_SIZE
+                tasks = service.iter_all(TASK_MODEL, chunk_size, filters, fields)
+                response = StreamingHttpResponse(self.stream_json(tasks, chunk_size, query["columns"]), content_type="application/json", status=200)
+                return self.set_validators(response, validators)
+            elif query["all"] and self.unpaged(query):
+                tasks = service.get_all(TASK_MODEL, filters, fields)
+            else:
+                page = service.get_page(TASK_MODEL, query["page_size"] or settings.TASKS_PAGE_SIZE, query["cursor"], filters, fields)
+                response = self.render(request, {"success": True, "data": self.list_data(page["items"], query), "next": page["next"]}, status=200)
+                return self.set_validators(response, validators)
+            return self.set_validators(self.render(request, {"success": True, "data": self.list_data(tasks, query)}, status=200), validators)
+        except InvalidCursor as err400:
+            print(err400)
+            return JsonResponse({"success": False, "error": "Invalid cursor"}, status=400)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+
+
+class AsyncGetTasksView(GetTasksView, IAsyncViewGetList):
+    """
+    Asynchronous counterpart of GetTasksView, mounted instead of it when
+    TASKS_ASYNC_VIEWS is on. Streamed lists are read with an asynchronous iterator,
+    so a slow client draining a large stream holds no thread between chunks.
+
+    Inherits from:
+        - GetTasksView
+    Implements:
+        - IAsyncViewGetList
+    """
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the AsyncGetTasksView instance.
+        """
+        return "<AsyncGetTasksView>"
+
+    async def astream_json(self, tasks: AsyncIterator[Dict[str, Any]], chunk_size: int, columns: List[str] | None = None) -> AsyncIterator[bytes]:
+        """
+        Encode tasks incrementally like stream_json, as they are read asynchronously.
+        """
+        head, tail = self.stream_envelope(columns)
+        yield head
+        chunk: List[Any] = []
+        separator = b""
+        async for task in tasks:
+            chunk.append(task if columns is None else [task[name] for name in columns])
+            if len(chunk) >= chunk_size:
+                yield separator + dumps(chunk)[1:-1]
+                separator = b", "
+                chunk = []
+        if chunk:
+            yield separator + dumps(chunk)[1:-1]
+        yield tail
+
+    async def get(self, request: HttpRequest, service: IAsyncServiceGetByParams | IAsyncServiceGetAll | IAsyncServiceGetPage | IAsyncServiceIterAll) -> HttpResponse:
+        """
+        Retrieve tasks like GetTasksView.get, without blocking the event loop.
+        """
+        try:
+            try:
+                query = self.parse_query(request)
+            except InvalidQuery as err400:
+                print(err400.__cause__ or err400)
+                return JsonResponse({"success": False, "error": err400.message}, status=400)
+            validators = await self.avalidators(request, service, self.media_type(request, query))
+            not_modified = self.not_modified(request, validators)
+            if not_modified is not None:
+                return not_modified
+            filters, fields = query["filters"], query["fields"]
+            if query["params"]:
+                tasks = await service.aget_by_params(TASK_MODEL, query["params"], query["page_size"], filters, fields)
+            elif query["stream"] and self.unpaged(query):
+                chunk_size = settings.TASKS_STREAM_CHUNK_SIZE
+                tasks = service.aiter_all(TASK_MODEL, chunk_size, filters, fields)
+                response = StreamingHttpResponse(self.astream_json(tasks, chunk_size, query["columns"]), content_type="application/json", status=200)
+                return self.set_validators(response, validators)
+            elif query["all"] and self.unpaged(query):
+                tasks = await service.aget_all(TASK_MODEL, filters, fields)
             else:
-                tasks = service.get_all(TASK_MODEL)
-            return JsonResponse({"success": True, "data": tasks}, status=200)
+                page = await service.aget_page(TASK_MODEL, query["page_size"] or settings.TASKS_PAGE_SIZE, query["cursor"], filters, fields)
+                response = self.render(request, {"success": True, "data": self.list_data(page["items"], query), "next": page["next"]}, status=200)
+                return self.set_validators(response, validators)
+            return self.set_validators(self.render(request, {"success": True, "data": self.list_data(tasks, query)}, status=200), validators)
+        except InvalidCursor as err400:
+            print(err400)
+            return JsonResponse({"success": False, "error": "Invalid cursor"}, status=400)
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+
+
+class TaskMetaView(View, IViewGetMeta):
+    """
+    View for retrieving the metadata shared by all tasks, cached by clients.
+
+    Inherits from:
+        - View
+    Implements:
+        - IViewGetMeta
+    """
+    title: str = "Tasks"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the TaskMetaView instance.
+        """
+        return "<TaskMetaView>"
+
+    def get(self, request: HttpRequest, service: IServiceGetMeta) -> HttpResponse:
+        """
+        Retrieve the task metadata as JSON, with an ETag and a long-lived Cache-Control.
+        """
+        try:
+            meta = service.get_meta(TASK_MODEL)
+            etag = f'"{meta["version"]}"'
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = JsonResponse({"success": True, "data": meta}, status=200)
+            response["ETag"] = etag
+            patch_cache_control(response, public=True, max_age=settings.TASKS_META_MAX_AGE)
+            return response
+        except Exception as err:
+            print(err)
+            return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
+
+
+class TaskStatsView(View, IViewGetStats):
+    """
+    View for retrieving the runtime statistics of the task service.
+
+    Inherits from:
+        - View
+    Implements:
+        - IViewGetStats
+    """
+    title: str = "Tasks"
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the TaskStatsView instance.
+        """
+        return "<TaskStatsView>"
+
+    def get(self, request: HttpRequest, service: IServiceGetStats) -> HttpResponse:
+        """
+        Retrieve the service statistics as JSON.
+        """
+        try:
+            _ = request  # Unused parameter, but kept for interface compliance
+            return JsonResponse({"success": True, "data": service.get_stats()}, status=200)
         except Exception as err:
             print(err)
             return JsonResponse({"success": False, "error": "Internal Server Error"}, status=500)
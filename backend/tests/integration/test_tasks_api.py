@@ -1,9 +1,16 @@
-import json
+import gzip, io, json, tempfile
 from uuid import uuid4
 from datetime import datetime, timedelta, timezone
-from django.test import TestCase, Client
+from django.core.management import call_command
+from unittest import skipUnless
+from django.test import AsyncRequestFactory, RequestFactory, TestCase, Client, override_settings
 from django.urls import reverse
 from tasks.models import Task
+from tasks.renderers import msgpack
+from tasks.cache import CachedTaskService
+from tasks.services import TaskService
+from tasks.urls import TASK_SERVICE
+from tasks.views import AsyncGetTasksView, AsyncTaskView, GetTasksView, TaskStatsView, TaskView
 
 
 class TaskAPITests(TestCase):
@@ -50,6 +57,202 @@ class TaskAPITests(TestCase):
         self.assertIn('API Task 1', response.content.decode())
         self.assertIn('API Task 2', response.content.decode())
 
+    def test_get_tasks_streamed(self):
+        """
+        Test streaming all tasks via the API.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:index')
+        response = self.client.get(url, {'stream': 1})
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(len(content['data']), 2)
+
+    def test_get_tasks_paginated(self):
+        """
+        Test paging through the tasks with the cursor returned by the API.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:index')
+        response = self.client.get(url, {'limit': 1})
+        self.assertEqual(response.status_code, 200)
+        first_page = response.json()
+        self.assertEqual(len(first_page['data']), 1)
+        self.assertIsNotNone(first_page['next'])
+        response = self.client.get(url, {'limit': 1, 'cursor': first_page['next']})
+        second_page = response.json()
+        self.assertEqual(len(second_page['data']), 1)
+        self.assertIsNone(second_page['next'])
+        self.assertNotEqual(first_page['data'][0]['task_id'], second_page['data'][0]['task_id'])
+
+    def test_get_tasks_invalid_cursor(self):
+        """
+        Test paging with a malformed cursor returns 400.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:index')
+        response = self.client.get(url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Invalid cursor', response.content.decode())
+
+    def test_get_tasks_filtered(self):
+        """
+        Test filtering tasks by status, combined with search and pagination.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:index')
+        response = self.client.get(url, {'status': 'DOING'})
+        self.assertEqual([task['title'] for task in response.json()['data']], ['API Task 2'])
+        response = self.client.get(url, {'status': 'DOING', 'search': 'API Task 1'})
+        self.assertEqual(response.json()['data'], [])
+        response = self.client.get(url, {'priority': 'LOW', 'limit': 10})
+        self.assertEqual([task['title'] for task in response.json()['data']], ['API Task 1'])
+
+    def test_get_tasks_projection(self):
+        """
+        Test that the list defaults to the summary shape and honours the fields parameter.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:index')
+        response = self.client.get(url)
+        self.assertNotIn('description', response.json()['data'][0])
+        response = self.client.get(url, {'fields': 'title,description'})
+        self.assertEqual(set(response.json()['data'][0]), {'task_id', 'title', 'description'})
+
+    def test_get_tasks_cache_follows_writes(self):
+        """
+        Test that a cached task list reflects tasks created through the API.
+
+        Returns
+        -------
+        None
+        """
+        factory = RequestFactory()
+        service = CachedTaskService(TaskService())
+        list_view = GetTasksView.as_view()
+        self.assertEqual(len(json.loads(list_view(factory.get('/tasks/'), service=service).content)['data']), 2)
+        data = json.dumps({'title': 'API Task 3', 'description': '', 'priority': 'LOW', 'status': 'TODO'})
+        TaskView.as_view()(factory.post('/tasks/create', data, content_type='application/json'), service=service)
+        self.assertEqual(len(json.loads(list_view(factory.get('/tasks/'), service=service).content)['data']), 3)
+        stats = json.loads(TaskStatsView.as_view()(factory.get('/tasks/stats'), service=service).content)['data']
+        self.assertIn('hits', stats['cache'])
+
+    @override_settings(TASKS_CACHE_ENABLED=True)
+    def test_get_tasks_conditional(self):
+        """
+        Test that the task list revalidates with its ETag until a task is written.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:index')
+        response = self.client.get(url)
+        self.assertIn('Last-Modified', response)
+        etag = response['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.client.delete(reverse('tasks:task-detail', args=[self.task2.task_id]))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['data']), 1)
+
+    @override_settings(TASKS_COMPRESSION_MIN_SIZE=0, TASKS_CACHE_ENABLED=True)
+    def test_get_tasks_gzip(self):
+        """
+        Test that the task list is gzipped for clients accepting it and still revalidates.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:index')
+        plain = self.client.get(url)
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertEqual(response['ETag'], 'W/' + plain['ETag'])
+        self.assertEqual(self.client.get(url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.assertFalse(plain.has_header('Content-Encoding'))
+
+    @skipUnless(msgpack, "msgpack is not installed")
+    @override_settings(TASKS_CACHE_ENABLED=True)
+    def test_get_tasks_msgpack(self):
+        """
+        Test that the task list and a task are sent as MessagePack when the client accepts it.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:index')
+        json_response = self.client.get(url)
+        response = self.client.get(url, HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertIn('Accept', response['Vary'])
+        self.assertNotEqual(response['ETag'], json_response['ETag'])
+        tasks = msgpack.unpackb(response.content)['data']
+        self.assertEqual(sorted(task['title'] for task in tasks), ['API Task 1', 'API Task 2'])
+        self.assertEqual(self.client.get(url, HTTP_ACCEPT='application/msgpack', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        response = self.client.get(reverse('tasks:task-detail', args=[self.task1.task_id]), HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(msgpack.unpackb(response.content)['data']['task_id'], str(self.task1.task_id))
+        self.assertNotEqual(response['ETag'], self.client.get(reverse('tasks:task-detail', args=[self.task1.task_id]))['ETag'])
+
+    @skipUnless(msgpack, "msgpack is not installed")
+    def test_create_task_replay_keeps_content_type(self):
+        """
+        Test that an idempotent retry replays a MessagePack response as MessagePack.
+
+        Returns
+        -------
+        None
+        """
+        data = json.dumps({'title': 'Packed', 'description': '', 'priority': 'LOW', 'status': 'TODO'})
+        headers = {'HTTP_ACCEPT': 'application/msgpack', 'HTTP_IDEMPOTENCY_KEY': 'packed-1'}
+        first = self.client.post(reverse('tasks:create'), data, content_type='application/json', **headers)
+        retry = self.client.post(reverse('tasks:create'), data, content_type='application/json', **headers)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(retry['Content-Type'], 'application/msgpack')
+        self.assertEqual(retry.content, first.content)
+
+    def test_get_tasks_columnar_paginated(self):
+        """
+        Test that the columnar format follows the field projection and the pagination cursors.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:index')
+        response = self.client.get(url, {'format': 'columnar', 'fields': 'title,status', 'limit': 1})
+        page = response.json()
+        self.assertEqual(page['data']['columns'], ['task_id', 'title', 'status'])
+        self.assertEqual(len(page['data']['rows']), 1)
+        next_page = self.client.get(url, {'format': 'columnar', 'fields': 'title,status', 'limit': 1, 'cursor': page['next']}).json()
+        titles = [row[1] for row in page['data']['rows'] + next_page['data']['rows']]
+        self.assertEqual(sorted(titles), ['API Task 1', 'API Task 2'])
+        self.assertIsNone(next_page['next'])
+        listed = self.client.get(url, {'format': 'columnar'}).json()['data']
+        self.assertEqual(listed['columns'], Task.SUMMARY_FIELDS)
+        self.assertEqual(len(listed['rows']), 2)
+
     def test_search_tasks_valid(self):
         """
         Test searching for tasks with valid parameters via the API.
@@ -89,6 +292,21 @@ class TaskAPITests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn('API Task 1', response.content.decode())
 
+    def test_get_task_meta(self):
+        """
+        Test retrieving the task metadata once and revalidating it via the API.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:meta')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['status_choices'], Task.STATUS_CHOICES)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
     def test_get_task_by_id_not_found(self):
         """
         Test retrieving a non-existent task by ID returns 404.
@@ -124,6 +342,100 @@ class TaskAPITests(TestCase):
         self.assertEqual(response.status_code, 201)
         self.assertTrue(Task.objects.filter(title='API Task 3').exists())
 
+    def test_bulk_create_tasks(self):
+        """
+        Test creating many tasks in one request via the API.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:bulk')
+        data = [{'title': f'Bulk API Task {i}', 'priority': 'MEDIUM', 'status': 'TODO'} for i in range(20)]
+        response = self.client.post(url, json.dumps(data), content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.json()['data']), 20)
+        self.assertEqual(Task.objects.filter(title__startswith='Bulk API Task').count(), 20)
+        self.assertEqual(len(self.client.get(reverse('tasks:index')).json()['data']), 22)
+
+    def test_upsert_tasks(self):
+        """
+        Test syncing tasks by external reference via the API and the management command.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:upsert')
+        data = [{'external_ref': f'JIRA-{i}', 'title': f'Synced {i}', 'priority': 'HIGH'} for i in range(3)]
+        response = self.client.post(url, json.dumps(data), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data'], {'created': 3, 'updated': 0})
+        data[0]['status'] = 'DONE'
+        with tempfile.NamedTemporaryFile('w', suffix='.json') as source:
+            json.dump(data, source)
+            source.flush()
+            call_command('upsert_tasks', source.name, stdout=io.StringIO())
+        self.assertEqual(Task.objects.get(external_ref='JIRA-0').status, 'DONE')
+        self.assertEqual(len(self.client.get(reverse('tasks:index')).json()['data']), 5)
+
+    def test_batch_update_and_delete_tasks(self):
+        """
+        Test updating and deleting several tasks in one request via the API.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:batch')
+        data = [
+            {'op': 'update', 'task_id': str(self.task1.task_id), 'data': {'status': 'DONE', 'priority': 'HIGH'}},
+            {'op': 'delete', 'task_id': str(self.task2.task_id)},
+        ]
+        response = self.client.post(url, json.dumps(data), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result['status'] for result in response.json()['data']], [200, 204])
+        self.task1.refresh_from_db()
+        self.assertEqual((self.task1.status, self.task1.priority), ('DONE', 'HIGH'))
+        self.assertIsNotNone(self.task1.end_time)
+        self.assertFalse(Task.objects.filter(pk=self.task2.task_id).exists())
+        self.assertEqual(len(self.client.get(reverse('tasks:index')).json()['data']), 1)
+
+    def test_transition_tasks(self):
+        """
+        Test moving every task matching the list filters to DONE via the API.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:transition') + '?status=DOING'
+        response = self.client.post(url, json.dumps({'status': 'DONE'}), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['updated'], 1)
+        self.task2.refresh_from_db()
+        self.assertEqual(self.task2.status, 'DONE')
+        self.assertLess(self.task2.end_time, self.task2.start_time + timedelta(hours=2))
+        self.assertEqual(len(self.client.get(reverse('tasks:index') + '?status=DONE').json()['data']), 1)
+
+    def test_create_task_idempotent(self):
+        """
+        Test that retries of a create with the same Idempotency-Key create one task.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:create')
+        data = json.dumps({'title': 'Idempotent Task', 'description': '', 'priority': 'LOW', 'status': 'TODO'})
+        responses = [
+            self.client.post(url, data, content_type='application/json', HTTP_IDEMPOTENCY_KEY='create-1')
+            for _ in range(3)
+        ]
+        self.assertEqual([response.status_code for response in responses], [201, 201, 201])
+        self.assertEqual(len({response.json()['data']['task_id'] for response in responses}), 1)
+        self.assertEqual(Task.objects.filter(title='Idempotent Task').count(), 1)
+
     def test_create_task_failure(self):
         """
         Test creating a new task with missing required fields returns 500.
@@ -165,6 +477,71 @@ class TaskAPITests(TestCase):
         self.assertEqual(self.task1.priority, 'HIGH')
         self.assertEqual(self.task1.status, 'DONE')
 
+    def test_partial_update_task(self):
+        """
+        Test changing some fields of a task via the API.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:task-detail', args=[self.task1.task_id])
+        response = self.client.patch(url, json.dumps({'status': 'DONE'}), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['status'], 'DONE')
+        self.task1.refresh_from_db()
+        self.assertEqual((self.task1.title, self.task1.status), ('API Task 1', 'DONE'))
+        self.assertLess(self.task1.end_time, self.task1.start_time + timedelta(hours=1))
+        missing = reverse('tasks:task-detail', args=[uuid4()])
+        response = self.client.patch(missing, json.dumps({'status': 'DONE'}), content_type='application/json')
+        self.assertEqual(response.status_code, 404)
+
+    def test_update_task_if_match(self):
+        """
+        Test that an update made against an outdated version is refused with 409.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:task-detail', args=[self.task1.task_id])
+        version = self.client.get(url).json()['data']['version']
+        data = {
+            'task_id': str(self.task1.task_id),
+            'title': 'API Task 1 Updated',
+            'description': self.task1.description,
+            'priority': 'HIGH',
+            'status': 'TODO',
+        }
+        response = self.client.put(url, json.dumps(data), content_type='application/json', HTTP_IF_MATCH=f'"{version}"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['version'], version + 1)
+        data['title'] = 'Lost Update'
+        response = self.client.put(url, json.dumps(data), content_type='application/json', HTTP_IF_MATCH=f'"{version}"')
+        self.assertEqual(response.status_code, 409)
+        self.task1.refresh_from_db()
+        self.assertEqual(self.task1.title, 'API Task 1 Updated')
+
+    @override_settings(TASKS_COMPRESSION_MIN_SIZE=0)
+    def test_update_task_echoes_etag(self):
+        """
+        Test that the ETag of a task, even weakened by compression, is accepted back in If-Match.
+
+        Returns
+        -------
+        None
+        """
+        url = reverse('tasks:task-detail', args=[self.task1.task_id])
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertTrue(response['ETag'].startswith('W/"1-'))
+        self.assertNotEqual(response['ETag'], self.client.get(reverse('tasks:task-detail', args=[self.task2.task_id]), HTTP_ACCEPT_ENCODING='gzip')['ETag'])
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        data = {'task_id': str(self.task1.task_id), 'title': 'API Task 1 Updated', 'description': '', 'priority': 'HIGH', 'status': 'TODO'}
+        response = self.client.put(url, json.dumps(data), content_type='application/json', HTTP_IF_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['ETag'].startswith('"2-'))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+
     def test_update_task_not_found(self):
         """
         Test updating a non-existent task returns 404.
@@ -250,3 +627,87 @@ class TaskAPITests(TestCase):
         response = self.client.delete(url, data, content_type='application/json')
         self.assertEqual(response.status_code, 404)
         self.assertIn('Task not found', response.content.decode())
+
+
+class AsyncTaskAPITests(TestCase):
+    """
+    Integration tests for the asynchronous Task views mounted under ASGI.
+    """
+    def setUp(self):
+        """
+        Set up test data and an async request factory.
+
+        Returns
+        -------
+        None
+        """
+        self.factory = AsyncRequestFactory()
+        self.list_view = AsyncGetTasksView.as_view()
+        self.task_view = AsyncTaskView.as_view()
+        for t in range(1, 4):
+            Task.objects.create(
+                title=f'Async Task {t}',
+                start_time=datetime.now(timezone.utc) - timedelta(hours=t),
+                priority='LOW',
+                status='TODO' if t < 3 else 'DONE',
+            )
+
+    @override_settings(TASKS_CACHE_ENABLED=True)
+    async def test_async_get_tasks(self):
+        """
+        Test listing, paginating, streaming and revalidating tasks through the async list view.
+
+        Returns
+        -------
+        None
+        """
+        response = await self.list_view(self.factory.get('/tasks/'), service=TASK_SERVICE)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(response.content)['data']), 3)
+        not_modified = await self.list_view(self.factory.get('/tasks/', headers={'If-None-Match': response['ETag']}), service=TASK_SERVICE)
+        self.assertEqual(not_modified.status_code, 304)
+        response = await self.list_view(self.factory.get('/tasks/', {'limit': 2, 'status': 'TODO'}), service=TASK_SERVICE)
+        page = json.loads(response.content)
+        self.assertEqual(len(page['data']), 2)
+        self.assertIsNone(page['next'])
+        response = await self.list_view(self.factory.get('/tasks/', {'stream': 1, 'format': 'columnar', 'fields': 'title'}), service=TASK_SERVICE)
+        self.assertTrue(response.is_async)
+        body = json.loads(b"".join([chunk async for chunk in response.streaming_content]))
+        self.assertEqual(body['data']['columns'], ['task_id', 'title'])
+        self.assertEqual(sorted(row[1] for row in body['data']['rows']), ['Async Task 1', 'Async Task 2', 'Async Task 3'])
+        response = await self.list_view(self.factory.get('/tasks/', {'search': 'Async Task 2'}), service=TASK_SERVICE)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Async Task 2', response.content.decode())
+        response = await self.list_view(self.factory.get('/tasks/', {'limit': 0}), service=TASK_SERVICE)
+        self.assertEqual(json.loads(response.content)['error'], 'Invalid limit parameter')
+
+    async def test_async_task_lifecycle(self):
+        """
+        Test creating, reading, updating, changing and deleting a task through the async task view.
+
+        Returns
+        -------
+        None
+        """
+        data = {'title': 'Async New', 'description': '', 'priority': 'HIGH', 'status': 'TODO'}
+        response = await self.task_view(self.factory.post('/tasks/create', json.dumps(data), content_type='application/json'), service=TASK_SERVICE)
+        self.assertEqual(response.status_code, 201)
+        task = json.loads(response.content)['data']
+        task_id = task['task_id']
+        response = await self.task_view(self.factory.get(f'/tasks/{task_id}'), id=task_id, service=TASK_SERVICE)
+        self.assertEqual(json.loads(response.content)['data']['title'], 'Async New')
+        update = {**data, 'task_id': task_id, 'title': 'Async Updated', 'status': 'DONE'}
+        response = await self.task_view(self.factory.put(f'/tasks/{task_id}', json.dumps(update), content_type='application/json'), id=task_id, service=TASK_SERVICE)
+        self.assertEqual(json.loads(response.content)['data']['version'], 2)
+        self.assertIsNotNone(json.loads(response.content)['data']['end_time'])
+        response = await self.task_view(
+            self.factory.patch(f'/tasks/{task_id}', json.dumps({'status': 'DOING'}), content_type='application/json', headers={'If-Match': '"1"'}),
+            id=task_id,
+            service=TASK_SERVICE
+        )
+        self.assertEqual(response.status_code, 409)
+        response = await self.task_view(self.factory.delete(f'/tasks/{task_id}'), id=task_id, service=TASK_SERVICE)
+        self.assertEqual(response.status_code, 204)
+        response = await self.task_view(self.factory.get(f'/tasks/{task_id}'), id=task_id, service=TASK_SERVICE)
+        self.assertEqual(response.status_code, 404)
+
@@ -1,15 +1,29 @@
-import json
+import gzip, json, pickle, threading, zlib
 from uuid import uuid4
+from asgiref.sync import sync_to_async
+from concurrent.futures import Future
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any
-from unittest.mock import Mock
-from django.test import TestCase
-from django.http import HttpRequest
-from tasks.interfaces import IServiceGetAll, IServiceGetByParams, IServiceGetById, IServiceCreate, IServiceUpdate, IServiceDelete
-from tasks.exceptions import NotFound
+from unittest import skipUnless
+from unittest.mock import AsyncMock, Mock, patch
+from django.core.cache import caches
+from django.db import connection
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from django.http import HttpRequest, HttpResponse, QueryDict, StreamingHttpResponse
+from tasks.interfaces import IServiceGetAll, IServiceIterAll, IServiceGetPage, IServiceGetByParams, IServiceGetById, IServiceCreate, IServiceBulkCreate, IServiceBulkUpsert, IServiceBatch, IServiceTransition, IServiceUpdate, IServicePartialUpdate, IServiceDelete, IServiceGetMeta
+from tasks.cache import CachedTaskService
+from tasks.coalescing import WriteBuffer
+from tasks.compression import CompressionMiddleware, GzipCompressor, get_compressors, select_compressor, brotli, zstandard
+from tasks.idempotency import IDEMPOTENCY_STORE
+from tasks.exceptions import NotFound, InvalidCursor, InvalidItems, Conflict
 from tasks.models import Task
+from tasks.records import TaskBatch, TaskRecord
+from tasks.renderers import JSONRenderer, MessagePackRenderer, get_renderers, select_renderer, msgpack
+from tasks.responses import dumps, use_orjson
+from tasks.search import LikeSearchBackend, SQLiteFTSSearchBackend
 from tasks.services import TaskService
-from tasks.views import GetTasksView, TaskView
+from tasks.views import TASK_MODEL, BatchTaskView, BulkTaskView, GetTasksView, TaskView, TaskMetaView, TransitionTasksView, UpsertTasksView
 
 
 class TaskModelTests(TestCase):
@@ -70,29 +84,85 @@ class TaskModelTests(TestCase):
         self.assertIn("STATUS_CHOICES", repr(task))
         self.assertIn("status", repr(task))
 
-    def test_datetimetoiso_returns_iso8601_string(self):
+    def test_custom_get_all_returns_all_tasks(self):
         """
-        Test that datetimetoiso returns a valid ISO 8601 string.
+        Test retrieving all tasks.
 
         Returns
         -------
         None
         """
-        dt = datetime(2025, 6, 17, 12, 34, 56, tzinfo=timezone.utc)
-        iso = self.task.datetimetoiso(dt)
-        self.assertTrue(iso.startswith("2025-06-17T12:34"))
-        self.assertIn("T", iso)
+        tasks = self.task.custom_get_all()
+        self.assertEqual(len(tasks), 3)
 
-    def test_custom_get_all_returns_all_tasks(self):
+    def test_custom_iter_all_yields_all_tasks(self):
         """
-        Test retrieving all tasks.
+        Test iterating over all tasks in chunks.
 
         Returns
         -------
         None
         """
-        tasks = self.task.custom_get_all()
+        tasks = list(self.task.custom_iter_all(chunk_size=2))
         self.assertEqual(len(tasks), 3)
+        self.assertIn('title', tasks[0])
+
+    def test_custom_get_page_walks_all_tasks_in_order(self):
+        """
+        Test that following the cursors returns every task once, in the default ordering.
+
+        Returns
+        -------
+        None
+        """
+        same_start = datetime.now(timezone.utc)
+        for t in range(4):
+            Task.objects.create(title=f'Page Task {t}', start_time=same_start if t % 2 else None, priority='LOW', status='TODO')
+        expected = list(Task.objects.order_by(*Task.KEYSET_ORDERING).values_list('task_id', flat=True))
+        retrieved = []
+        cursor = None
+        while True:
+            page = self.task.custom_get_page(2, cursor)
+            self.assertLessEqual(len(page['items']), 2)
+            retrieved.extend(task['task_id'] for task in page['items'])
+            cursor = page['next']
+            if cursor is None:
+                break
+        self.assertEqual(retrieved, expected)
+
+    def test_custom_get_page_seeks_index_to_cursor(self):
+        """
+        Test that the queries of a page after a cursor seek the list index instead of scanning it.
+
+        Returns
+        -------
+        None
+        """
+        if connection.vendor != 'sqlite':
+            self.skipTest("plan assertions are written for SQLite")
+        same_start = datetime.now(timezone.utc)
+        for t in range(4):
+            Task.objects.create(title=f'Page Task {t}', start_time=same_start if t % 2 else None, priority='LOW', status='TODO')
+        cursor = self.task.custom_get_page(2)['next']
+        null_cursor = self.task.encode_cursor({'start_time': None, 'priority': 'LOW', 'status': 'TODO', 'task_id': uuid4()})
+        for next_cursor in (cursor, null_cursor):
+            _, _, querysets = self.task.page_query(2, next_cursor, None, None)
+            for queryset in querysets:
+                plan = queryset[:3].explain()
+                self.assertIn('SEARCH', plan)
+                self.assertNotIn('SCAN', plan)
+                self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_custom_get_page_raises_invalidcursor(self):
+        """
+        Test that custom_get_page raises InvalidCursor when the cursor cannot be decoded.
+
+        Returns
+        -------
+        None
+        """
+        with self.assertRaises(InvalidCursor):
+            self.task.custom_get_page(2, 'not-a-cursor')
 
     def test_custom_get_by_params_filters_tasks(self):
         """
@@ -109,6 +179,68 @@ class TaskModelTests(TestCase):
         self.assertEqual(tasks[0]['priority'], self.task_data[1]['priority'])
         self.assertEqual(tasks[0]['status'], self.task_data[1]['status'])
 
+    def test_custom_get_all_applies_filters(self):
+        """
+        Test retrieving tasks with equality and range filters.
+
+        Returns
+        -------
+        None
+        """
+        self.assertEqual(len(self.task.custom_get_all({'status': 'DONE'})), 2)
+        self.assertEqual(len(self.task.custom_get_all({'status': 'DONE', 'priority': 'HIGH'})), 0)
+        later = datetime.now(timezone.utc) + timedelta(minutes=1)
+        self.assertEqual(len(self.task.custom_get_all({'start_before': later})), 3)
+        self.assertEqual(len(self.task.custom_get_all({'start_after': later})), 0)
+        self.assertEqual(len(self.task.custom_get_by_params('Test Task', filters={'priority': 'HIGH'})), 1)
+        self.assertEqual(len(self.task.custom_get_page(10, filters={'status': 'TODO'})['items']), 1)
+
+    def test_custom_get_all_projects_fields(self):
+        """
+        Test that lists default to the summary fields and honour an explicit projection.
+
+        Returns
+        -------
+        None
+        """
+        tasks = self.task.custom_get_all()
+        self.assertEqual(list(tasks[0]), Task.SUMMARY_FIELDS)
+        tasks = self.task.custom_get_all(fields=['task_id', 'description'])
+        self.assertEqual(list(tasks[0]), ['task_id', 'description'])
+        page = self.task.custom_get_page(2, fields=['task_id', 'title'])
+        self.assertEqual(list(page['items'][0]), ['task_id', 'title'])
+        next_page = self.task.custom_get_page(2, page['next'], fields=['task_id', 'title'])
+        self.assertEqual(len(next_page['items']), 1)
+
+    def test_custom_get_by_params_matches_status_and_limit(self):
+        """
+        Test that searching matches the status choices and honours the limit.
+
+        Returns
+        -------
+        None
+        """
+        tasks = self.task.custom_get_by_params('DONE')
+        self.assertEqual(len(tasks), 2)
+        self.assertTrue(all(task['status'] == 'DONE' for task in tasks))
+        self.assertEqual(len(self.task.custom_get_by_params('Test Task', limit=1)), 1)
+
+    def test_custom_get_by_params_follows_updates_and_deletes(self):
+        """
+        Test that search results follow title updates and deletions.
+
+        Returns
+        -------
+        None
+        """
+        task = Task.objects.get(pk=self.task_data[0]['task_id'])
+        task.title = 'Renamed Chore'
+        task.save()
+        self.assertEqual(len(self.task.custom_get_by_params('Renamed Chore')), 1)
+        self.assertEqual(len(self.task.custom_get_by_params('Test Task 1')), 0)
+        task.delete()
+        self.assertEqual(len(self.task.custom_get_by_params('Renamed Chore')), 0)
+
     def test_custom_get_by_id_returns_task(self):
         """
         Test retrieving a task by its ID.
@@ -122,6 +254,65 @@ class TaskModelTests(TestCase):
         self.assertEqual(task_dict['title'], self.task_data[1]['title'])
         self.assertEqual(task_dict['priority'], self.task_data[1]['priority'])
 
+    def test_custom_get_by_id_embeds_choices_only_when_enabled(self):
+        """
+        Test that the choices are left out of task payloads unless the compatibility flag is on.
+
+        Returns
+        -------
+        None
+        """
+        id = str(self.task_data[0]['task_id'])
+        self.assertNotIn('PRIORITY_CHOICES', self.task.custom_get_by_id(id))
+        with override_settings(TASKS_EMBED_CHOICES=True):
+            task_dict = self.task.custom_get_by_id(id)
+        self.assertEqual(task_dict['PRIORITY_CHOICES'], Task.PRIORITY_CHOICES)
+        self.assertEqual(task_dict['STATUS_CHOICES'], Task.STATUS_CHOICES)
+
+    def test_single_and_list_payloads_share_serialization(self):
+        """
+        Test that a Task serializes the same whether it was just written, read by id or listed.
+
+        Returns
+        -------
+        None
+        """
+        new_task = Task.objects.create(
+            title='Serialized Task',
+            start_time=datetime(2025, 3, 4, 7, 8, 9, 123456, tzinfo=timezone(timedelta(hours=2)))
+        )
+        written = new_task.as_dict()
+        read = self.task.custom_get_by_id(str(new_task.task_id))
+        listed = next(task for task in self.task.custom_get_all() if task['task_id'] == new_task.task_id)
+        self.assertEqual(written, read)
+        self.assertEqual(read['start_time'], datetime(2025, 3, 4, 5, 8, 9, 123456, tzinfo=timezone.utc))
+        self.assertEqual(listed, {name: read[name] for name in Task.SUMMARY_FIELDS})
+
+    def test_serializer_is_built_once_per_field_list(self):
+        """
+        Test that the serializer of a field list is shared by every call.
+
+        Returns
+        -------
+        None
+        """
+        self.assertIs(self.task.serializer(['task_id', 'title']), Task().serializer(['task_id', 'title']))
+        self.assertIs(self.task.serializer(), self.task.serializer(Task.SUMMARY_FIELDS))
+        self.assertIsNot(self.task.serializer(), self.task.serializer(Task.DETAIL_FIELDS))
+
+    def test_custom_get_meta_returns_versioned_choices(self):
+        """
+        Test retrieving the task metadata.
+
+        Returns
+        -------
+        None
+        """
+        meta = self.task.custom_get_meta()
+        self.assertEqual(meta['priority_choices'], Task.PRIORITY_CHOICES)
+        self.assertEqual(meta['status_choices'], Task.STATUS_CHOICES)
+        self.assertEqual(meta['version'], self.task.custom_get_meta()['version'])
+
     def test_custom_get_by_id_raises_notfound(self):
         """
         Test that custom_get_by_id raises NotFound when the task does not exist.
@@ -166,6 +357,171 @@ class TaskModelTests(TestCase):
         with self.assertRaises(Exception):
             self.task.custom_create(bad_data)
 
+    def test_custom_bulk_upsert_creates_and_updates_by_external_ref(self):
+        """
+        Test that upserts create unknown references and update known ones in place,
+        with three statements per batch.
+
+        Returns
+        -------
+        None
+        """
+        items = [{"external_ref": f"EXT-{i}", "title": f"Synced {i}"} for i in range(3)]
+        self.assertEqual(self.task.custom_bulk_upsert(items, batch_size=2), {"created": 3, "updated": 0})
+        task_id = Task.objects.get(external_ref="EXT-0").task_id
+        items = [{"external_ref": f"EXT-{i}", "title": f"Resynced {i}", "status": "DOING"} for i in range(4)]
+        with self.assertNumQueries(8):
+            counts = self.task.custom_bulk_upsert(items, batch_size=2)
+        self.assertEqual(counts, {"created": 1, "updated": 3})
+        task = Task.objects.get(external_ref="EXT-0")
+        self.assertEqual((task.task_id, task.title, task.status, task.version), (task_id, "Resynced 0", "DOING", 2))
+        self.assertEqual(Task.objects.filter(external_ref__startswith="EXT-").count(), 4)
+
+    def test_custom_bulk_upsert_increments_rows_inserted_after_the_lock(self):
+        """
+        Test that a reference inserted concurrently, after the locking SELECT missed it,
+        is counted as updated and gets its version incremented rather than reset.
+
+        Returns
+        -------
+        None
+        """
+        Task.objects.create(title="Concurrent", external_ref="EXT-1", version=3)
+        with patch.object(Task.objects, 'select_for_update', return_value=Task.objects.none()):
+            counts = self.task.custom_bulk_upsert([{"external_ref": "EXT-1", "title": "Synced"}], batch_size=10)
+        self.assertEqual(counts, {"created": 0, "updated": 1})
+        task = Task.objects.get(external_ref="EXT-1")
+        self.assertEqual((task.title, task.version), ("Synced", 4))
+
+    def test_custom_bulk_upsert_requires_distinct_external_refs(self):
+        """
+        Test that items without an external_ref, or repeating one, raise InvalidItems.
+
+        Returns
+        -------
+        None
+        """
+        items = [{"external_ref": "EXT-1", "title": "A"}, {"title": "B"}, {"external_ref": "EXT-1", "title": "C"}]
+        with self.assertRaises(InvalidItems) as raised:
+            self.task.custom_bulk_upsert(items, batch_size=100)
+        self.assertEqual(set(raised.exception.errors), {1, 2})
+        self.assertFalse(Task.objects.filter(external_ref="EXT-1").exists())
+
+    def test_custom_partial_update_writes_given_fields(self):
+        """
+        Test changing some fields of a task, leaving the others untouched.
+
+        Returns
+        -------
+        None
+        """
+        task_id = self.task_data[0]["task_id"]
+        changed = self.task.custom_partial_update(task_id, {"status": "DOING", "end_time": None})
+        self.assertEqual(changed, {"task_id": task_id, "status": "DOING", "end_time": None})
+        task = Task.objects.get(pk=task_id)
+        self.assertEqual((task.title, task.status, task.end_time), ("Test Task 1", "DOING", None))
+
+    def test_custom_partial_update_missing_or_invalid_raises(self):
+        """
+        Test that custom_partial_update raises NotFound for a missing task and ValidationError for bad fields.
+
+        Returns
+        -------
+        None
+        """
+        with self.assertRaises(NotFound):
+            self.task.custom_partial_update(uuid4(), {"status": "DOING"})
+        with self.assertRaises(ValidationError) as raised:
+            self.task.custom_partial_update(self.task_data[0]["task_id"], {"status": "LATER", "task_id": None})
+        self.assertEqual(set(raised.exception.message_dict), {"status", "task_id"})
+
+    def test_custom_bulk_create_success_returns_created_tasks(self):
+        """
+        Test creating many tasks in batches, returned in the order of the data.
+
+        Returns
+        -------
+        None
+        """
+        items = [{"title": f"Bulk Task {i}", "start_time": "2024-01-01T10:00:00Z", "priority": "HIGH"} for i in range(5)]
+        created = self.task.custom_bulk_create(items, batch_size=2)
+        self.assertEqual([task["title"] for task in created], [item["title"] for item in items])
+        self.assertEqual(Task.objects.filter(title__startswith="Bulk Task", priority="HIGH").count(), 5)
+
+    def test_custom_bulk_create_invalid_item_creates_nothing(self):
+        """
+        Test that one invalid item makes custom_bulk_create raise InvalidItems without creating any task.
+
+        Returns
+        -------
+        None
+        """
+        items = [{"title": "Bulk Task"}, {"title": "Bulk Task", "status": "LATER"}, "not a task"]
+        with self.assertRaises(InvalidItems) as raised:
+            self.task.custom_bulk_create(items, batch_size=100)
+        self.assertEqual(set(raised.exception.errors), {1, 2})
+        self.assertIn("status", raised.exception.errors[1])
+        self.assertFalse(Task.objects.filter(title="Bulk Task").exists())
+
+    def test_custom_batch_applies_updates_and_deletes(self):
+        """
+        Test applying grouped updates and deletes, with missing tasks reported as 404.
+
+        Returns
+        -------
+        None
+        """
+        others = [Task.objects.create(title=f"Batch Task {i}") for i in range(3)]
+        missing = str(uuid4())
+        operations = [
+            {"op": "update", "task_id": str(others[0].task_id), "data": {"status": "DOING"}},
+            {"op": "update", "task_id": str(others[1].task_id), "data": {"status": "DOING"}},
+            {"op": "delete", "task_id": str(others[2].task_id)},
+            {"op": "delete", "task_id": missing},
+        ]
+        results = self.task.custom_batch(operations)
+        self.assertEqual([result["status"] for result in results], [200, 200, 204, 404])
+        self.assertEqual(Task.objects.filter(title__startswith="Batch Task", status="DOING").count(), 2)
+        self.assertFalse(Task.objects.filter(pk=others[2].task_id).exists())
+
+    def test_custom_batch_invalid_operation_applies_nothing(self):
+        """
+        Test that one invalid operation makes custom_batch raise InvalidItems without applying any.
+
+        Returns
+        -------
+        None
+        """
+        task_id = str(self.task_data[0]["task_id"])
+        operations = [
+            {"op": "delete", "task_id": task_id},
+            {"op": "update", "task_id": task_id, "data": {"priority": "URGENT"}},
+            {"op": "archive", "task_id": task_id},
+            {"op": "delete", "task_id": "not-a-uuid"},
+        ]
+        with self.assertRaises(InvalidItems) as raised:
+            self.task.custom_batch(operations)
+        self.assertEqual(set(raised.exception.errors), {1, 2, 3})
+        self.assertIn("priority", raised.exception.errors[1])
+        self.assertTrue(Task.objects.filter(pk=task_id).exists())
+
+    def test_custom_transition_moves_matching_tasks(self):
+        """
+        Test moving the tasks matching filters to a status in one statement.
+
+        Returns
+        -------
+        None
+        """
+        end_time = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        with self.assertNumQueries(1):
+            moved = self.task.custom_transition({"priority": "LOW"}, "DOING", end_time)
+        self.assertEqual(moved, 2)
+        self.assertEqual(Task.objects.filter(status="DOING", end_time=end_time, version=2).count(), 2)
+        self.assertEqual(self.task.custom_transition({"priority": "LOW"}, "DOING"), 0)
+        with self.assertRaises(ValidationError):
+            self.task.custom_transition({"priority": "LOW"}, "LATER")
+
     def test_custom_update_success_returns_updated_task(self):
         """
         Test updating an existing task.
@@ -177,8 +533,10 @@ class TaskModelTests(TestCase):
         data = self.task_data[0].copy()
         data['title'] = 'Updated Task'
         data['priority'] = 'HIGH'
+        Task.objects.filter(pk=data['task_id']).update(external_ref='EXT-1')
         updated = self.task.custom_update(data)
         self.assertIsInstance(updated, Dict)
+        self.assertEqual(updated['external_ref'], 'EXT-1')
         self.assertEqual(updated['task_id'], data['task_id'])
         self.assertEqual(updated['title'], 'Updated Task')
         self.assertEqual(updated['priority'], 'HIGH')
@@ -196,6 +554,29 @@ class TaskModelTests(TestCase):
         with self.assertRaises(NotFound):
             self.task.custom_update(invalid_data)
 
+    def test_custom_update_with_version_detects_conflicts(self):
+        """
+        Test that updates against the current version succeed and increment it, while
+        updates against an outdated version raise Conflict.
+
+        Returns
+        -------
+        None
+        """
+        data = self.task_data[0].copy()
+        data['title'] = 'Updated Task'
+        with self.assertNumQueries(4):
+            updated = self.task.custom_update(data, version=1)
+        self.assertEqual(updated['version'], 2)
+        with self.assertRaises(Conflict):
+            self.task.custom_update(data, version=1)
+        with self.assertRaises(Conflict):
+            self.task.custom_partial_update(data['task_id'], {'status': 'DOING'}, version=1)
+        self.assertEqual(self.task.custom_partial_update(data['task_id'], {'status': 'DOING'}, version=2)['version'], 3)
+        task = Task.objects.get(pk=data['task_id'])
+        task.save()
+        self.assertEqual(Task.objects.get(pk=data['task_id']).version, 4)
+
     def test_custom_delete_deletes_task(self):
         """
         Test deleting a task by its ID.
@@ -205,7 +586,8 @@ class TaskModelTests(TestCase):
         None
         """
         task_id = str(self.task_data[1]['task_id'])
-        deleted = self.task.custom_delete(task_id)
+        with self.assertNumQueries(1):
+            deleted = self.task.custom_delete(task_id)
         self.assertTrue(deleted)
         self.assertEqual(Task.objects.count(), 2)
 
@@ -221,6 +603,115 @@ class TaskModelTests(TestCase):
         with self.assertRaises(NotFound):
             self.task.custom_delete(invalid_id)
 
+    async def test_async_reads_match_sync_reads(self):
+        """
+        Test that the async ORM reads return what their synchronous counterparts do.
+
+        Returns
+        -------
+        None
+        """
+        tasks = await self.task.acustom_get_all({'status': 'DONE'})
+        self.assertIsInstance(tasks, TaskBatch)
+        self.assertEqual(tasks, await sync_to_async(self.task.custom_get_all)({'status': 'DONE'}))
+        streamed = [task async for task in self.task.acustom_iter_all(1, fields=['title'])]
+        self.assertEqual(sorted(task['title'] for task in streamed), ['Test Task 1', 'Test Task 2', 'Test Task 3'])
+        page = await self.task.acustom_get_page(2)
+        self.assertEqual(len(page['items']), 2)
+        rest = await self.task.acustom_get_page(2, page['next'])
+        self.assertEqual((len(rest['items']), rest['next']), (1, None))
+        task_id = self.task_data[0]['task_id']
+        self.assertEqual((await self.task.acustom_get_by_id(task_id))['title'], 'Test Task 1')
+        with self.assertRaises(NotFound):
+            await self.task.acustom_get_by_id(uuid4())
+
+    async def test_async_writes(self):
+        """
+        Test creating, updating, changing and deleting a task with the async ORM.
+
+        Returns
+        -------
+        None
+        """
+        data = {**self.task_data[0], 'task_id': None, 'title': 'Async Task'}
+        created = await self.task.acustom_create(data)
+        self.assertEqual((created['title'], created['version']), ('Async Task', 1))
+        data['task_id'] = created['task_id']
+        await Task.objects.filter(pk=data['task_id']).aupdate(external_ref='EXT-1')
+        updated = await self.task.acustom_update({**data, 'title': 'Async Update'})
+        self.assertEqual((updated['title'], updated['version'], updated['external_ref']), ('Async Update', 2, 'EXT-1'))
+        with self.assertRaises(Conflict):
+            await self.task.acustom_update(data, version=1)
+        self.assertEqual((await self.task.acustom_partial_update(data['task_id'], {'status': 'DOING'}, version=2))['version'], 3)
+        with self.assertRaises(Conflict):
+            await self.task.acustom_partial_update(data['task_id'], {'status': 'DONE'}, version=2)
+        with self.assertRaises(NotFound):
+            await self.task.acustom_update({**data, 'task_id': uuid4()})
+        self.assertTrue(await self.task.acustom_delete(data['task_id']))
+        with self.assertRaises(NotFound):
+            await self.task.acustom_delete(data['task_id'])
+        self.assertEqual(await Task.objects.acount(), 3)
+
+
+class SearchBackendTests(TestCase):
+    """
+    Unit tests for the task search backends.
+    """
+    def setUp(self):
+        """
+        Set up tasks with overlapping titles for the search backend tests.
+
+        Returns
+        -------
+        None
+        """
+        for title in ['Write report', 'Review report draft', 'Plan sprint', 'Report bug']:
+            Task.objects.create(title=title, priority='MEDIUM', status='TODO')
+
+    def test_fts_backend_matches_like_backend(self):
+        """
+        Test that the SQLite FTS backend finds the same tasks as the LIKE backend.
+
+        Returns
+        -------
+        None
+        """
+        queryset = Task.objects.values()
+        fts = SQLiteFTSSearchBackend()
+        self.assertTrue(fts.is_installed(queryset))
+        for params in ['report', 'REPORT', 'print', 'dium']:
+            expected = {task['task_id'] for task in LikeSearchBackend().search(queryset, params, 10)}
+            found = {task['task_id'] for task in fts.search(queryset, params, 10)}
+            self.assertEqual(found, expected)
+
+    def test_fts_backend_honours_limit(self):
+        """
+        Test that the SQLite FTS backend returns at most limit tasks.
+
+        Returns
+        -------
+        None
+        """
+        tasks = SQLiteFTSSearchBackend().search(Task.objects.values(), 'report', 2)
+        self.assertEqual(len(tasks), 2)
+
+    def test_fts_backend_follows_writes(self):
+        """
+        Test that the SQLite FTS table follows updates, upserts and deletes made after the migrations rebuilt tasks_task.
+
+        Returns
+        -------
+        None
+        """
+        fts = SQLiteFTSSearchBackend()
+        titles = lambda params: sorted(task['title'] for task in fts.search(Task.objects.values(), params, 10))
+        Task.objects.filter(title='Plan sprint').update(title='Plan retro')
+        Task().custom_bulk_upsert([{'title': 'Retro notes', 'external_ref': 'ext-1'}], 10)
+        Task().custom_bulk_upsert([{'title': 'Retro summary', 'external_ref': 'ext-1'}], 10)
+        self.assertEqual(titles('retro'), ['Plan retro', 'Retro summary'])
+        Task.objects.filter(title='Write report').delete()
+        self.assertEqual(titles('report'), ['Report bug', 'Review report draft'])
+
 
 class TaskServiceTests(TestCase):
     """
@@ -270,6 +761,32 @@ class TaskServiceTests(TestCase):
         self.assertIsInstance(result, list)
         self.assertEqual(result[0]['title'], self.data[0]['title'])
 
+    def test_service_iter_all_returns_iterator(self):
+        """
+        Test iterating over all tasks via the service.
+
+        Returns
+        -------
+        None
+        """
+        self.model.custom_iter_all.return_value = iter(self.data)
+        result = list(self.service.iter_all(self.model, 100))
+        self.assertEqual(result[0]['title'], self.data[0]['title'])
+        self.model.custom_iter_all.assert_called_once_with(100, None, None)
+
+    def test_service_get_page_returns_page(self):
+        """
+        Test retrieving a page of tasks via the service.
+
+        Returns
+        -------
+        None
+        """
+        self.model.custom_get_page.return_value = {"items": self.data, "next": None}
+        result = self.service.get_page(self.model, 10, None)
+        self.assertEqual(result['items'][0]['title'], self.data[0]['title'])
+        self.model.custom_get_page.assert_called_once_with(10, None, None, None)
+
     def test_service_get_by_params_filters_tasks(self):
         """
         Test retrieving tasks by params via the service.
@@ -316,49 +833,771 @@ class TaskServiceTests(TestCase):
         self.assertIsInstance(created, Dict)
         self.assertEqual(created['title'], data['title'])
 
-    def test_service_update_updates_task(self):
+    def test_service_partial_update_done_sets_end_time(self):
         """
-        Test updating a task via the service.
+        Test that a partial update setting status to DONE also sets end_time.
 
         Returns
         -------
         None
         """
-        data: Dict[str, Any] = {
-            'task_id': str(uuid4()),
-            'title': 'Service Task Updated',
-            'start_time': datetime.now(timezone.utc),
-            'end_time': None,
-            'priority': 'LOW',
-            'status': 'DONE' # Set to DONE to trigger end_time update
-        }
-        self.model.custom_update.return_value = data
-        updated = self.service.update(self.model, data)
-        self.assertIsInstance(updated, Dict)
-        self.assertEqual(updated['title'], data['title'])
+        data: Dict[str, Any] = {'status': 'DONE'}
+        id: str = str(uuid4())
+        self.service.partial_update(self.model, id, data)
+        self.model.custom_partial_update.assert_called_once_with(id, data, None)
+        self.assertIsInstance(data['end_time'], datetime)
 
-    def test_service_delete_deletes_task(self):
+    def test_service_bulk_create_uses_batch_size(self):
         """
-        Test deleting a task via the service.
+        Test that the service creates tasks in batches of TASKS_BULK_BATCH_SIZE.
 
         Returns
         -------
         None
         """
-        self.model.custom_delete.return_value = True
-        id: str = str(uuid4())
-        deleted = self.service.delete(self.model, id)
-        self.assertTrue(deleted)
-        self.model.custom_delete.assert_called_once_with(id)
-
+        self.model.custom_bulk_create.return_value = self.data
+        with override_settings(TASKS_BULK_BATCH_SIZE=7):
+            created = self.service.bulk_create(self.model, self.data)
+        self.model.custom_bulk_create.assert_called_once_with(self.data, 7)
+        self.assertEqual(created, self.data)
 
-class TaskViewTests(TestCase):
-    """
-    Unit tests for the TaskView HTTP layer.
-    """
-    def setUp(self):
+    def test_service_batch_done_sets_end_time(self):
         """
-        Set up a TaskView instance and a mock request for view tests.
+        Test that batch updates setting status to DONE also set end_time.
+
+        Returns
+        -------
+        None
+        """
+        operations = [
+            {'op': 'update', 'task_id': str(uuid4()), 'data': {'status': 'DONE'}},
+            {'op': 'update', 'task_id': str(uuid4()), 'data': {'status': 'DOING'}},
+            {'op': 'delete', 'task_id': str(uuid4())},
+        ]
+        self.service.batch(self.model, operations)
+        self.assertIsInstance(operations[0]['data']['end_time'], datetime)
+        self.assertNotIn('end_time', operations[1]['data'])
+        self.model.custom_batch.assert_called_once_with(operations)
+
+    def test_service_transition_done_sets_end_time(self):
+        """
+        Test that moving tasks to DONE also sets their end_time, and other statuses do not.
+
+        Returns
+        -------
+        None
+        """
+        self.model.custom_transition.return_value = 3
+        self.assertEqual(self.service.transition(self.model, {'status': 'DOING'}, 'DONE'), 3)
+        self.assertIsInstance(self.model.custom_transition.call_args.args[2], datetime)
+        self.service.transition(self.model, {'status': 'DONE'}, 'TODO')
+        self.assertIsNone(self.model.custom_transition.call_args.args[2])
+
+    def test_service_update_updates_task(self):
+        """
+        Test updating a task via the service.
+
+        Returns
+        -------
+        None
+        """
+        data: Dict[str, Any] = {
+            'task_id': str(uuid4()),
+            'title': 'Service Task Updated',
+            'start_time': datetime.now(timezone.utc),
+            'end_time': None,
+            'priority': 'LOW',
+            'status': 'DONE' # Set to DONE to trigger end_time update
+        }
+        self.model.custom_update.return_value = data
+        updated = self.service.update(self.model, data)
+        self.assertIsInstance(updated, Dict)
+        self.assertEqual(updated['title'], data['title'])
+
+    def test_service_get_meta_returns_meta(self):
+        """
+        Test retrieving the task metadata via the service.
+
+        Returns
+        -------
+        None
+        """
+        self.model.custom_get_meta.return_value = {"version": "1", "status_choices": {}}
+        self.assertEqual(self.service.get_meta(self.model)["version"], "1")
+
+    def test_service_delete_deletes_task(self):
+        """
+        Test deleting a task via the service.
+
+        Returns
+        -------
+        None
+        """
+        self.model.custom_delete.return_value = True
+        id: str = str(uuid4())
+        deleted = self.service.delete(self.model, id)
+        self.assertTrue(deleted)
+        self.model.custom_delete.assert_called_once_with(id)
+
+
+    def test_service_writes_bump_version(self):
+        """
+        Test that every write through the service changes the collection version.
+
+        Returns
+        -------
+        None
+        """
+        versions = {self.service.get_version()[0]}
+        self.service.create(self.model, {'title': 'New'})
+        versions.add(self.service.get_version()[0])
+        self.service.update(self.model, {'title': 'Updated'})
+        versions.add(self.service.get_version()[0])
+        self.service.delete(self.model, str(uuid4()))
+        versions.add(self.service.get_version()[0])
+        self.assertEqual(len(versions), 4)
+
+    async def test_service_async_methods_delegate_to_model(self):
+        """
+        Test that the async service methods await the async model methods.
+
+        Returns
+        -------
+        None
+        """
+        model = AsyncMock()
+        model.acustom_get_all.return_value = self.data
+        self.assertEqual(await self.service.aget_all(model), self.data)
+        model.acustom_get_all.assert_awaited_once_with(None, None)
+        model.acustom_get_page.return_value = {"items": self.data, "next": None}
+        self.assertEqual((await self.service.aget_page(model, 10))['items'], self.data)
+        model.acustom_get_page.assert_awaited_once_with(10, None, None, None)
+        model.acustom_get_by_id.return_value = self.data[0]
+        self.assertEqual(await self.service.aget_by_id(model, self.data[0]['task_id']), self.data[0])
+        model.acustom_iter_all = Mock(return_value='iterator')
+        self.assertEqual(self.service.aiter_all(model, 100), 'iterator')
+        model.acustom_iter_all.assert_called_once_with(100, None, None)
+
+    async def test_service_async_writes_bump_version(self):
+        """
+        Test that async writes change the collection version and that DONE sets end_time.
+
+        Returns
+        -------
+        None
+        """
+        model = AsyncMock()
+        versions = {(await self.service.aget_version())[0]}
+        await self.service.acreate(model, {'title': 'New'})
+        versions.add((await self.service.aget_version())[0])
+        data = {'title': 'Updated', 'status': 'DONE'}
+        await self.service.aupdate(model, data, 1)
+        self.assertIsNotNone(data.get('end_time'))
+        model.acustom_update.assert_awaited_once_with(data, 1)
+        versions.add((await self.service.aget_version())[0])
+        await self.service.apartial_update(model, str(uuid4()), {'status': 'DOING'})
+        versions.add((await self.service.aget_version())[0])
+        await self.service.adelete(model, str(uuid4()))
+        versions.add((await self.service.aget_version())[0])
+        self.assertEqual(len(versions), 5)
+
+
+class WriteBufferTests(TestCase):
+    """
+    Unit tests for the write buffer coalescing concurrent task creation.
+    """
+    def setUp(self):
+        """
+        Set up a mock model whose bulk create echoes the items back.
+
+        Returns
+        -------
+        None
+        """
+        self.model = Mock()
+        self.model.custom_bulk_create.side_effect = lambda items, batch_size: [dict(item, created=True) for item in items]
+
+    def submit_concurrently(self, service: TaskService, items: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Create the items through the service from one thread each, returning their results or errors.
+
+        Returns
+        -------
+        List[Any]
+        """
+        results: List[Any] = [None] * len(items)
+
+        def create(index: int) -> None:
+            try:
+                results[index] = service.create(self.model, items[index])
+            except Exception as err:
+                results[index] = err
+
+        threads = [threading.Thread(target=create, args=(index,)) for index in range(len(items))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_write_buffer_commits_concurrent_creates_together(self):
+        """
+        Test that concurrent creates are committed as one batch and each gets its own task.
+
+        Returns
+        -------
+        None
+        """
+        service = TaskService(write_buffer=WriteBuffer(window_ms=5000, max_batch=4))
+        items = [{'title': f'Buffered {i}'} for i in range(4)]
+        results = self.submit_concurrently(service, items)
+        self.assertEqual(results, [dict(item, created=True) for item in items])
+        self.model.custom_bulk_create.assert_called_once()
+        stats = service.get_stats()['write_buffer']
+        self.assertEqual((stats['batches'], stats['items'], stats['mean_batch_size']), (1, 4, 4.0))
+
+    def test_write_buffer_invalid_item_fails_its_own_request(self):
+        """
+        Test that an invalid item fails only its own create and the rest of the batch is committed.
+
+        Returns
+        -------
+        None
+        """
+        def bulk_create(items, batch_size):
+            invalid = {index: {'title': ['Required.']} for index, item in enumerate(items) if not item.get('title')}
+            if invalid:
+                raise InvalidItems("invalid", invalid)
+            return [dict(item, created=True) for item in items]
+
+        self.model.custom_bulk_create.side_effect = bulk_create
+        service = TaskService(write_buffer=WriteBuffer(window_ms=5000, max_batch=3))
+        results = self.submit_concurrently(service, [{'title': 'A'}, {}, {'title': 'C'}])
+        self.assertEqual([isinstance(result, Exception) for result in results], [False, True, False])
+        self.assertEqual(self.model.custom_bulk_create.call_count, 2)
+
+    def test_write_buffer_follower_times_out_without_leader(self):
+        """
+        Test that a create joining a batch whose leader died fails after the timeout instead of hanging.
+
+        Returns
+        -------
+        None
+        """
+        buffer = WriteBuffer(window_ms=5000, max_batch=10, timeout=0.05)
+        buffer.pending.append(({'title': 'Lost'}, Future(), 0.0))
+        with self.assertRaises(Exception) as ctx:
+            buffer.submit(self.model, {'title': 'Follower'})
+        self.assertIn('not committed', str(ctx.exception))
+        self.model.custom_bulk_create.assert_not_called()
+
+    async def test_write_buffer_async_create_closes_thread_connections(self):
+        """
+        Test that an async create submitted from an executor thread closes the connections of that thread.
+
+        Returns
+        -------
+        None
+        """
+        service = TaskService(write_buffer=WriteBuffer(window_ms=0, max_batch=1))
+        closing_threads: List[int] = []
+        with patch('tasks.services.connections') as mock_connections:
+            mock_connections.close_all.side_effect = lambda: closing_threads.append(threading.get_ident())
+            task = await service.acreate(self.model, {'title': 'Async'})
+        self.assertEqual(task, {'title': 'Async', 'created': True})
+        self.assertEqual(len(closing_threads), 1)
+        self.assertNotEqual(closing_threads[0], threading.get_ident())
+
+
+class CachedTaskServiceTests(TestCase):
+    """
+    Unit tests for the caching decorator around TaskService.
+    """
+    def setUp(self):
+        """
+        Set up a cached service around a mock service, with an empty cache.
+
+        Returns
+        -------
+        None
+        """
+        caches['tasks'].clear()
+        self.model = Mock()
+        self.inner = Mock(spec=TaskService)
+        self.inner.get_all.return_value = [{'title': 'Cached Task'}]
+        self.inner.get_stats.return_value = {}
+        self.service = CachedTaskService(self.inner)
+
+    def test_cached_service_serves_repeated_reads_from_cache(self):
+        """
+        Test that identical reads hit the wrapped service once and are counted.
+
+        Returns
+        -------
+        None
+        """
+        self.assertEqual(self.service.get_all(self.model), [{'title': 'Cached Task'}])
+        self.assertEqual(self.service.get_all(self.model), [{'title': 'Cached Task'}])
+        self.service.get_all(self.model, {'status': 'DONE'})
+        self.assertEqual(self.inner.get_all.call_count, 2)
+        stats = self.service.get_stats()['cache']
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+
+    def test_cached_service_writes_invalidate_reads(self):
+        """
+        Test that create, update and delete through the wrapped TaskService invalidate the cached reads.
+
+        Returns
+        -------
+        None
+        """
+        service = CachedTaskService(TaskService())
+        self.model.custom_get_all.return_value = []
+        service.get_all(self.model)
+        service.create(self.model, {'title': 'New'})
+        service.get_all(self.model)
+        service.update(self.model, {'title': 'Updated'})
+        service.get_all(self.model)
+        service.delete(self.model, str(uuid4()))
+        service.get_all(self.model)
+        self.assertEqual(self.model.custom_get_all.call_count, 4)
+
+    def test_cached_service_model_writes_invalidate_reads(self):
+        """
+        Test that saving a Task outside the service invalidates the cached reads.
+
+        Returns
+        -------
+        None
+        """
+        self.service.get_all(self.model)
+        Task.objects.create(title='Admin Task', priority='LOW', status='TODO')
+        self.service.get_all(self.model)
+        self.assertEqual(self.inner.get_all.call_count, 2)
+
+    async def test_cached_service_async_reads_share_cache(self):
+        """
+        Test that async reads are cached under the same keys as synchronous ones, and invalidated by async writes.
+
+        Returns
+        -------
+        None
+        """
+        service = CachedTaskService(TaskService())
+        model = AsyncMock()
+        model.custom_get_all = Mock(return_value=[{'title': 'Cached Task'}])
+        model.acustom_get_all.return_value = [{'title': 'Cached Task'}]
+        await sync_to_async(service.get_all)(model)
+        self.assertEqual(await service.aget_all(model), [{'title': 'Cached Task'}])
+        model.acustom_get_all.assert_not_awaited()
+        await service.adelete(model, str(uuid4()))
+        await service.aget_all(model)
+        model.acustom_get_all.assert_awaited_once_with(None, None)
+        stats = service.get_stats()['cache']
+        self.assertEqual((stats['hits'], stats['misses']), (1, 2))
+
+
+class TaskBatchTests(TestCase):
+    """
+    Unit tests for the tuple-backed TaskBatch and its TaskRecord rows.
+    """
+    def setUp(self):
+        """
+        Set up a batch of three rows.
+
+        Returns
+        -------
+        None
+        """
+        self.fields = ('task_id', 'title', 'start_time')
+        self.rows = [(uuid4(), f'Batch Task {t}', datetime(2025, 1, t + 1, tzinfo=timezone.utc)) for t in range(3)]
+        self.batch = TaskBatch(self.fields, self.rows)
+        self.dicts = [dict(zip(self.fields, row)) for row in self.rows]
+
+    def test_batch_reads_like_a_list_of_dicts(self):
+        """
+        Test that indexing, iterating and comparing a batch behave as with the list of dictionaries.
+
+        Returns
+        -------
+        None
+        """
+        self.assertEqual(len(self.batch), 3)
+        self.assertEqual(self.batch[1]['title'], 'Batch Task 1')
+        self.assertEqual(list(self.batch[0]), list(self.fields))
+        self.assertEqual(self.batch, self.dicts)
+        self.assertEqual(self.batch[1:], self.dicts[1:])
+        self.assertIsInstance(self.batch[1:], TaskBatch)
+
+    def test_record_is_slotted_and_immutable(self):
+        """
+        Test that records hold no instance dictionary and cannot be changed.
+
+        Returns
+        -------
+        None
+        """
+        record: TaskRecord = self.batch[0]
+        self.assertFalse(hasattr(record, '__dict__'))
+        with self.assertRaises(AttributeError):
+            record.title = 'Changed'
+        with self.assertRaises(TypeError):
+            record['title'] = 'Changed'
+
+    def test_batch_survives_pickling(self):
+        """
+        Test that batches and records can be stored in the read cache.
+
+        Returns
+        -------
+        None
+        """
+        self.assertEqual(pickle.loads(pickle.dumps(self.batch)), self.batch)
+        self.assertEqual(pickle.loads(pickle.dumps(self.batch[2])), self.dicts[2])
+
+    def test_batch_encodes_as_list_of_objects(self):
+        """
+        Test that both encoders encode a batch, across chunk boundaries, as the list of dictionaries.
+
+        Returns
+        -------
+        None
+        """
+        for encoder in ("auto", "stdlib"):
+            with override_settings(TASKS_JSON_ENCODER=encoder, TASKS_STREAM_CHUNK_SIZE=2):
+                self.assertEqual(dumps({"data": self.batch}), dumps({"data": self.dicts}))
+                self.assertEqual(dumps({"data": TaskBatch(self.fields, [])}), dumps({"data": []}))
+                self.assertEqual(dumps(self.batch[0]), dumps(self.dicts[0]))
+
+    def test_custom_get_all_returns_batch(self):
+        """
+        Test that the list reads return their rows as a TaskBatch.
+
+        Returns
+        -------
+        None
+        """
+        Task.objects.create(title='Batched Task')
+        tasks = Task().custom_get_all()
+        self.assertIsInstance(tasks, TaskBatch)
+        self.assertEqual(tasks.fields, tuple(Task.SUMMARY_FIELDS))
+        self.assertIsInstance(Task().custom_get_page(10)['items'], TaskBatch)
+
+
+class RendererTests(TestCase):
+    """
+    Unit tests for the renderer registry and the Accept header negotiation.
+    """
+    def negotiate(self, accept: str | None) -> Any:
+        """
+        Return the renderer selected for a request sending the given Accept header.
+
+        Returns
+        -------
+        IRenderer
+        """
+        request: HttpRequest = HttpRequest()
+        if accept is not None:
+            request.META['HTTP_ACCEPT'] = accept
+        return select_renderer(request)
+
+    def test_json_is_the_default(self):
+        """
+        Test that JSON is selected without a preference or when no renderer is acceptable.
+
+        Returns
+        -------
+        None
+        """
+        for accept in (None, '*/*', 'application/json', 'text/html', 'application/msgpack;q=0'):
+            self.assertIsInstance(self.negotiate(accept), JSONRenderer)
+
+    @skipUnless(msgpack, "msgpack is not installed")
+    def test_msgpack_is_selected_by_quality_and_specificity(self):
+        """
+        Test that MessagePack is selected when it is the most preferred acceptable type.
+
+        Returns
+        -------
+        None
+        """
+        for accept in ('application/msgpack', 'application/json;q=0.5, application/msgpack', '*/*, application/json;q=0.1'):
+            self.assertIsInstance(self.negotiate(accept), MessagePackRenderer)
+
+    def test_json_is_selected_without_msgpack(self):
+        """
+        Test that MessagePack requests fall back to JSON when msgpack is not installed.
+
+        Returns
+        -------
+        None
+        """
+        self.addCleanup(get_renderers.cache_clear)
+        get_renderers.cache_clear()
+        with patch('tasks.renderers.msgpack', None):
+            self.assertIsInstance(self.negotiate('application/msgpack'), JSONRenderer)
+
+    @skipUnless(msgpack, "msgpack is not installed")
+    def test_msgpack_renders_batches_uuids_and_datetimes(self):
+        """
+        Test that MessagePack payloads decode to the values of the JSON payload.
+
+        Returns
+        -------
+        None
+        """
+        task_id = uuid4()
+        start_time = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        batch = TaskBatch(('task_id', 'start_time'), [(task_id, start_time)])
+        payload = msgpack.unpackb(MessagePackRenderer().render({"success": True, "data": batch}), timestamp=3)
+        self.assertEqual(payload, {"success": True, "data": [{"task_id": str(task_id), "start_time": start_time}]})
+
+
+class CompressionMiddlewareTests(TestCase):
+    """
+    Unit tests for the response compression middleware.
+    """
+    def setUp(self):
+        """
+        Set up the middleware and a compressible body.
+
+        Returns
+        -------
+        None
+        """
+        caches['tasks'].clear()
+        self.middleware = CompressionMiddleware(lambda request: HttpResponse())
+        self.body: bytes = json.dumps({"success": True, "data": [{"title": f"Task {t}"} for t in range(200)]}).encode()
+
+    def request(self, accept_encoding: str | None) -> HttpRequest:
+        """
+        Return a request sending the given Accept-Encoding header.
+
+        Returns
+        -------
+        HttpRequest
+        """
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        if accept_encoding is not None:
+            request.META['HTTP_ACCEPT_ENCODING'] = accept_encoding
+        return request
+
+    def test_select_compressor_honours_qualities(self):
+        """
+        Test that the coding is picked by quality, then by server preference.
+
+        Returns
+        -------
+        None
+        """
+        self.assertIsNone(select_compressor(self.request(None)))
+        self.assertIsNone(select_compressor(self.request('identity')))
+        self.assertIsNone(select_compressor(self.request('gzip;q=0')))
+        self.assertIsInstance(select_compressor(self.request('gzip')), GzipCompressor)
+        self.assertIsInstance(select_compressor(self.request('br;q=0.5, zstd;q=0.5, gzip')), GzipCompressor)
+
+    @skipUnless(brotli and zstandard, "brotli and zstandard are not installed")
+    def test_select_compressor_prefers_zstd_then_br(self):
+        """
+        Test that zstd, then br, are preferred among codings accepted equally.
+
+        Returns
+        -------
+        None
+        """
+        self.assertEqual(select_compressor(self.request('gzip, br, zstd')).encoding, 'zstd')
+        self.assertEqual(select_compressor(self.request('gzip, br')).encoding, 'br')
+        self.assertEqual(select_compressor(self.request('*')).encoding, 'zstd')
+
+    def test_select_compressor_falls_back_to_gzip_without_brotli_and_zstandard(self):
+        """
+        Test that br and zstd are never selected when their libraries are not installed.
+
+        Returns
+        -------
+        None
+        """
+        self.addCleanup(get_compressors.cache_clear)
+        get_compressors.cache_clear()
+        with patch('tasks.compression.brotli', None), patch('tasks.compression.zstandard', None):
+            self.assertIsNone(select_compressor(self.request('br, zstd')))
+            self.assertIsInstance(select_compressor(self.request('gzip, br, zstd')), GzipCompressor)
+
+    def test_compresses_large_bodies_only(self):
+        """
+        Test that bodies above the threshold are gzipped with weak ETags, and small ones left alone.
+
+        Returns
+        -------
+        None
+        """
+        response = HttpResponse(self.body, content_type='application/json')
+        response['ETag'] = '"abc"'
+        response = self.middleware.process_response(self.request('gzip'), response)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['ETag'], 'W/"abc"')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertEqual(gzip.decompress(response.content), self.body)
+        small = self.middleware.process_response(self.request('gzip'), HttpResponse(b'{"success": true}'))
+        self.assertFalse(small.has_header('Content-Encoding'))
+
+    def test_html_is_never_compressed(self):
+        """
+        Test that HTML pages, which may carry a CSRF token, are left uncompressed against BREACH.
+
+        Returns
+        -------
+        None
+        """
+        html = b'<input type="hidden" name="csrfmiddlewaretoken" value="secret">' * 100
+        response = self.middleware.process_response(self.request('gzip'), HttpResponse(html))
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, html)
+        response = self.middleware.process_response(self.request('gzip'), HttpResponse(self.body, content_type='application/json; charset=utf-8'))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_reuses_compressed_body_of_same_etag(self):
+        """
+        Test that a body sent again with the same ETag is served from the compressed cache.
+
+        Returns
+        -------
+        None
+        """
+        first = HttpResponse(self.body, content_type='application/json')
+        first['ETag'] = '"v1"'
+        compressed = self.middleware.process_response(self.request('gzip'), first).content
+        compressor = GzipCompressor()
+        compressor.compress = Mock(side_effect=AssertionError('recompressed'))
+        again = HttpResponse(self.body, content_type='application/json')
+        again['ETag'] = '"v1"'
+        self.assertEqual(self.middleware.compress(self.request('gzip'), again, compressor), compressed)
+        with override_settings(TASKS_COMPRESSION_CACHE=False):
+            with self.assertRaises(AssertionError):
+                self.middleware.compress(self.request('gzip'), again, compressor)
+
+    def test_compressed_cache_is_keyed_on_resource(self):
+        """
+        Test that bodies sharing an ETag but not the path or content type are not served each other's compressed copy.
+
+        Returns
+        -------
+        None
+        """
+        first = HttpResponse(self.body, content_type='application/json')
+        first['ETag'] = '"1-abc"'
+        self.middleware.process_response(self.request('gzip'), first)
+        other_path = self.request('gzip')
+        other_path.path = '/tasks/other'
+        other_body = json.dumps({"success": True, "data": [{"title": f"Other {t}"} for t in range(200)]}).encode()
+        for request, content_type in [(other_path, 'application/json'), (self.request('gzip'), 'application/msgpack')]:
+            response = HttpResponse(other_body, content_type=content_type)
+            response['ETag'] = '"1-abc"'
+            response = self.middleware.process_response(request, response)
+            self.assertEqual(gzip.decompress(response.content), other_body)
+
+    def test_streaming_bodies_are_compressed_per_chunk(self):
+        """
+        Test that every streamed chunk can be decompressed as soon as it arrives.
+
+        Returns
+        -------
+        None
+        """
+        chunks = [b'{"success": true, "data": [', b'{"title": "Task 1"}', b']}']
+        response = self.middleware.process_response(self.request('gzip'), StreamingHttpResponse(iter(chunks), content_type='application/json'))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        received = [decompressor.decompress(block) for block in response.streaming_content]
+        self.assertEqual(received[:3], chunks)
+        self.assertEqual(b"".join(received), b"".join(chunks))
+        with override_settings(TASKS_COMPRESSION_STREAMING=False):
+            response = self.middleware.process_response(self.request('gzip'), StreamingHttpResponse(iter(chunks), content_type='application/json'))
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    @skipUnless(brotli and zstandard, "brotli and zstandard are not installed")
+    def test_brotli_and_zstd_round_trip(self):
+        """
+        Test that br and zstd bodies and streams decompress to the original.
+
+        Returns
+        -------
+        None
+        """
+        response = self.middleware.process_response(self.request('br'), HttpResponse(self.body, content_type='application/json'))
+        self.assertEqual(brotli.decompress(response.content), self.body)
+        response = self.middleware.process_response(self.request('zstd'), HttpResponse(self.body, content_type='application/msgpack'))
+        self.assertEqual(zstandard.ZstdDecompressor().decompress(response.content), self.body)
+        response = self.middleware.process_response(self.request('zstd'), StreamingHttpResponse(iter([self.body, self.body]), content_type='application/json'))
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        self.assertEqual(b"".join(decompressor.decompress(block) for block in response.streaming_content), self.body * 2)
+
+
+class JSONEncoderTests(TestCase):
+    """
+    Unit tests for the pluggable JSON encoder of the task payloads.
+    """
+    def setUp(self):
+        """
+        Set up a payload holding the types found in task dictionaries.
+
+        Returns
+        -------
+        None
+        """
+        self.task_id = uuid4()
+        self.payload: Dict[str, Any] = {
+            "success": True,
+            "data": [{"task_id": self.task_id, "start_time": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "end_time": None}]
+        }
+
+    def test_renderer_encodes_uuids_and_datetimes(self):
+        """
+        Test that the JSON renderer encodes UUIDs and UTC datetimes with the configured encoder.
+
+        Returns
+        -------
+        None
+        """
+        self.assertEqual(json.loads(JSONRenderer().render(self.payload))["data"], [{"task_id": str(self.task_id), "start_time": "2025-01-02T03:04:05Z", "end_time": None}])
+
+    def test_stdlib_encoder_matches_json_response(self):
+        """
+        Test that the standard library fallback produces the bytes of JsonResponse.
+
+        Returns
+        -------
+        None
+        """
+        from django.http import JsonResponse
+        with override_settings(TASKS_JSON_ENCODER="stdlib"):
+            self.assertFalse(use_orjson())
+            self.assertEqual(dumps(self.payload), JsonResponse(self.payload).content)
+
+    def test_encoders_agree_on_decoded_payload(self):
+        """
+        Test that both encoders decode to the same payload, including the types orjson
+        does not encode natively.
+
+        Returns
+        -------
+        None
+        """
+        payload: Dict[str, Any] = {**self.payload, "elapsed": timedelta(minutes=5)}
+        with override_settings(TASKS_JSON_ENCODER="stdlib"):
+            expected = json.loads(dumps(payload))
+        self.assertEqual(json.loads(dumps(payload)), expected)
+
+
+class TaskViewTests(TestCase):
+    """
+    Unit tests for the TaskView HTTP layer.
+    """
+    def setUp(self):
+        """
+        Set up a TaskView instance and a mock request for view tests.
 
         Returns
         -------
@@ -368,83 +1607,764 @@ class TaskViewTests(TestCase):
     
     def test_view_representation_success(self):
         """
-        Test the string representation of the TaskView.
+        Test the string representation of the TaskView.
+
+        Returns
+        -------
+        None
+        """
+        self.assertEqual(repr(self.view), "<TaskView>")
+
+    def test_view_isotodatetime_success_parses_iso_string(self):
+        """
+        Test converting ISO 8601 string to datetime.
+
+        Returns
+        -------
+        None
+        """
+        iso = "2025-06-17T18:30:00.000Z"
+        dt = self.view.isotodatetime(iso)
+        self.assertIsInstance(dt, datetime)
+        self.assertEqual(dt.year, 2025)
+        self.assertEqual(dt.month, 6)
+        self.assertEqual(dt.day, 17)
+        self.assertEqual(dt.hour, 18)
+        self.assertEqual(dt.minute, 30)
+        self.assertEqual(dt.second, 0)
+
+    def test_view_json_decode_success_parses_json(self):
+        """
+        Test decoding a JSON string to a dictionary with datetime fields.
+
+        Returns
+        -------
+        None
+        """
+        body: Dict[str, Any] = {
+            "title": "Task Z",
+            "start_time": "2025-06-17T18:30:00.000Z",
+            "end_time": "2025-06-18T18:30:00.000Z",
+            "priority": "LOW",
+            "status": "TODO"
+        }
+        json_str = json.dumps(body)
+        result = self.view.json_decode(json_str)
+        self.assertEqual(result['title'], 'Task Z')
+        self.assertIsInstance(result['start_time'], datetime)
+        self.assertIsInstance(result['end_time'], datetime)
+        self.assertEqual(result['priority'], 'LOW')
+        self.assertEqual(result['status'], 'TODO')
+
+    def test_view_get_by_id_success_returns_task(self):
+        """
+        Test retrieving a task by ID via the view.
+
+        Returns
+        -------
+        None
+        """
+        id: str = str(uuid4())
+        task: Dict[str, Any] = {
+            'task_id': id,
+            'title': 'Task Y',
+            'start_time': None,
+            'end_time': None,
+            'priority': 'LOW',
+            'status': 'TODO'
+        }
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        mock_service = Mock(spec=IServiceGetById)
+        mock_service.get_by_id.return_value = task
+        response = self.view.get(request, id, mock_service)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Task Y', response.content.decode())
+
+    def test_view_get_by_id_failure_returns_error_404(self):
+        """
+        Test handling NotFound exception when retrieving by ID via the view.
+
+        Returns
+        -------
+        None
+        """
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        mock_service = Mock(spec=IServiceGetById)
+        mock_service.get_by_id.side_effect = NotFound("Task not found")
+        response = self.view.get(request, 'non-existent-id', mock_service)
+        self.assertEqual(response.status_code, 404)
+        self.assertIn("Task not found", response.content.decode())
+
+    def test_view_get_by_id_failure_returns_error_500(self):
+        """
+        Test handling any exceptions when retrieving by ID via the view.
+
+        Returns
+        -------
+        None
+        """
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        mock_service = Mock(spec=IServiceGetById)
+        mock_service.get_by_id.side_effect = Exception("Unexpected error")
+        response = self.view.get(request, 'non-existent-id', mock_service)
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("Internal Server Error", response.content.decode())
+
+    def test_view_create_success_returns_created_task(self):
+        """
+        Test successful creation of a task via the view.
+
+        Returns
+        -------
+        None
+        """
+        body: Dict[str, Any] = {
+            "title": "Task Z",
+            "start_time": None,
+            "end_time": None,
+            "priority": "LOW",
+            "status": "TODO"
+        }
+        json_str = json.dumps(body)
+        mock_service = Mock(spec=IServiceCreate)
+        mock_service.create.return_value = body
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.headers = {}
+        mock_request.body = json_str
+        response = self.view.post(mock_request, mock_service)
+        self.assertEqual(response.status_code, 201)
+        self.assertIn("Task Z", response.content.decode())
+
+    def test_view_create_failure_returns_error_500(self):
+        """
+        Test handling any exceptions when creating a task via the view.
+
+        Returns
+        -------
+        None
+        """
+        body: Dict[str, Any] = {
+            "title": "Task Z",
+            "start_time": None,
+            "end_time": None,
+            "priority": "LOW",
+            "status": "TODO"
+        }
+        json_str = json.dumps(body)
+        mock_service = Mock(spec=IServiceCreate)
+        mock_service.create.side_effect = Exception("Unexpected error")
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.headers = {}
+        mock_request.body = json_str
+        response = self.view.post(mock_request, mock_service)
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("Internal Server Error", response.content.decode())
+
+    def test_view_create_with_idempotency_key_replays_response(self):
+        """
+        Test that a retried create with the same Idempotency-Key replays the first
+        response without calling the service again, and that reusing the key for
+        another body is refused.
+
+        Returns
+        -------
+        None
+        """
+        request: HttpRequest = HttpRequest()
+        request.method = 'POST'
+        request.META['HTTP_IDEMPOTENCY_KEY'] = 'retry-1'
+        request._body = json.dumps({"title": "Once", "description": "", "priority": "LOW", "status": "TODO"}).encode()
+        mock_service = Mock(spec=IServiceCreate)
+        mock_service.create.return_value = {"task_id": str(uuid4()), "title": "Once"}
+        first = self.view.post(request, service=mock_service)
+        retry = self.view.post(request, service=mock_service)
+        self.assertEqual((first.status_code, retry.status_code), (201, 201))
+        self.assertEqual(retry.content, first.content)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        mock_service.create.assert_called_once()
+        request._body = json.dumps({"title": "Other"}).encode()
+        self.assertEqual(self.view.post(request, service=mock_service).status_code, 422)
+
+    def test_view_create_expired_idempotency_key_is_reused(self):
+        """
+        Test that an expired key no longer replays its response and is purged.
+
+        Returns
+        -------
+        None
+        """
+        request: HttpRequest = HttpRequest()
+        request.method = 'POST'
+        request.META['HTTP_IDEMPOTENCY_KEY'] = 'retry-3'
+        request._body = json.dumps({"title": "Once", "description": "", "priority": "LOW", "status": "TODO"}).encode()
+        mock_service = Mock(spec=IServiceCreate)
+        mock_service.create.return_value = {"title": "Once"}
+        with override_settings(TASKS_IDEMPOTENCY_TTL=-1):
+            self.view.post(request, service=mock_service)
+            self.view.post(request, service=mock_service)
+            self.assertEqual(mock_service.create.call_count, 2)
+            self.assertEqual(IDEMPOTENCY_STORE.purge(), 1)
+
+    def test_view_create_server_error_releases_idempotency_key(self):
+        """
+        Test that a create failing with a server error can be retried with the same key.
+
+        Returns
+        -------
+        None
+        """
+        request: HttpRequest = HttpRequest()
+        request.method = 'POST'
+        request.META['HTTP_IDEMPOTENCY_KEY'] = 'retry-2'
+        request._body = json.dumps({"title": "Once", "description": "", "priority": "LOW", "status": "TODO"}).encode()
+        mock_service = Mock(spec=IServiceCreate)
+        mock_service.create.side_effect = [Exception("Unexpected error"), {"title": "Once"}]
+        self.assertEqual(self.view.post(request, service=mock_service).status_code, 500)
+        self.assertEqual(self.view.post(request, service=mock_service).status_code, 201)
+        self.assertEqual(mock_service.create.call_count, 2)
+
+    def test_view_create_abandoned_idempotency_claim_is_taken_over(self):
+        """
+        Test that a claim left in progress answers 409 until the lock timeout, then is taken over.
+
+        Returns
+        -------
+        None
+        """
+        request: HttpRequest = HttpRequest()
+        request.method = 'POST'
+        request.META['HTTP_IDEMPOTENCY_KEY'] = 'retry-4'
+        request._body = json.dumps({"title": "Once", "description": "", "priority": "LOW", "status": "TODO"}).encode()
+        self.assertIsNone(IDEMPOTENCY_STORE.claim('retry-4', request))
+        mock_service = Mock(spec=IServiceCreate)
+        mock_service.create.return_value = {"title": "Once"}
+        self.assertEqual(self.view.post(request, service=mock_service).status_code, 409)
+        with override_settings(TASKS_IDEMPOTENCY_LOCK_TIMEOUT=-1):
+            self.assertEqual(self.view.post(request, service=mock_service).status_code, 201)
+        mock_service.create.assert_called_once()
+        retry = self.view.post(request, service=mock_service)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+
+    def test_view_update_success_returns_updated_task(self):
+        """
+        Test successful update of a task via the view.
+
+        Returns
+        -------
+        None
+        """
+        id: str = str(uuid4())
+        body: Dict[str, Any] = {
+            "task_id": id,
+            "title": "Task U",
+            "start_time": None,
+            "end_time": None,
+            "priority": "LOW",
+            "status": "TODO"
+        }
+        json_str = json.dumps(body)
+        mock_service = Mock(spec=IServiceUpdate)
+        mock_service.update.return_value = body
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.headers = {}
+        mock_request.body = json_str
+        response = self.view.put(mock_request, id, mock_service)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Task U', response.content.decode())
+
+    def test_view_partial_update_success_returns_changed_fields(self):
+        """
+        Test successful partial update of a task via the view.
+
+        Returns
+        -------
+        None
+        """
+        id: str = str(uuid4())
+        mock_service = Mock(spec=IServicePartialUpdate)
+        mock_service.partial_update.return_value = {"task_id": id, "status": "DOING"}
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.headers = {}
+        mock_request.body = json.dumps({"status": "DOING"})
+        response = self.view.patch(mock_request, id, mock_service)
+        self.assertEqual(response.status_code, 200)
+        mock_service.partial_update.assert_called_once_with(TASK_MODEL, id, {"status": "DOING"}, None)
+
+    def test_view_partial_update_failure_returns_error_400_and_404(self):
+        """
+        Test handling ValidationError and NotFound when partially updating via the view.
+
+        Returns
+        -------
+        None
+        """
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.headers = {}
+        mock_request.body = json.dumps({"status": "LATER"})
+        mock_service = Mock(spec=IServicePartialUpdate)
+        mock_service.partial_update.side_effect = ValidationError({"status": ["Invalid choice."]})
+        response = self.view.patch(mock_request, str(uuid4()), mock_service)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.content)["errors"], {"status": ["Invalid choice."]})
+        mock_service.partial_update.side_effect = NotFound("Task not found")
+        response = self.view.patch(mock_request, str(uuid4()), mock_service)
+        self.assertEqual(response.status_code, 404)
+
+    def test_view_update_if_match_conflict_returns_error_409(self):
+        """
+        Test that the If-Match version is passed to the service and a Conflict returns 409.
+
+        Returns
+        -------
+        None
+        """
+        id: str = str(uuid4())
+        mock_service = Mock(spec=IServiceUpdate)
+        mock_service.update.side_effect = Conflict("Task changed")
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.headers = {"If-Match": '"3"'}
+        mock_request.body = json.dumps({"task_id": id, "title": "Task U", "priority": "LOW", "status": "TODO"})
+        response = self.view.put(mock_request, id, mock_service)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(mock_service.update.call_args.args[2], 3)
+        mock_request.headers = {"If-Match": '"3", "4"'}
+        response = self.view.put(mock_request, id, mock_service)
+        self.assertEqual(response.status_code, 400)
+
+    def test_view_update_failure_returns_error_404(self):
+        """
+        Test handling NotFound exception when updating via the view.
+
+        Returns
+        -------
+        None
+        """
+        id: str = str(uuid4())
+        body: Dict[str, Any] = {
+            "task_id": id,
+            "title": "Task Z",
+            "start_time": None,
+            "end_time": None,
+            "priority": "LOW",
+            "status": "TODO"
+        }
+        json_str = json.dumps(body)
+        mock_service = Mock(spec=IServiceUpdate)
+        mock_service.update.side_effect = NotFound("Task not found")
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.headers = {}
+        mock_request.body = json_str
+        response = self.view.put(mock_request, id, mock_service)
+        self.assertEqual(response.status_code, 404)
+        self.assertIn("Task not found", response.content.decode())
+
+    def test_view_update_failure_returns_error_500(self):
+        """
+        Test handling any exceptions when updating a task via the view.
+
+        Returns
+        -------
+        None
+        """
+        id: str = str(uuid4())
+        body: Dict[str, Any] = {
+            "task_id": id,
+            "title": "Task U",
+            "start_time": None,
+            "end_time": None,
+            "priority": "LOW",
+            "status": "TODO"
+        }
+        json_str = json.dumps(body)
+        mock_service = Mock(spec=IServiceUpdate)
+        mock_service.update.side_effect = Exception("Unexpected error")
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.headers = {}
+        mock_request.body = json_str
+        response = self.view.put(mock_request, id, mock_service)
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("Internal Server Error", response.content.decode())
+
+    def test_view_delete_success_returns_success(self):
+        """
+        Test successful deletion of a task via the view.
+
+        Returns
+        -------
+        None
+        """
+        id: str = str(uuid4())
+        body: Dict[str, Any] = {
+            "task_id": id
+        }
+        json_str = json.dumps(body)
+        mock_service = Mock(spec=IServiceDelete)
+        mock_service.delete.return_value = True
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.body = json_str
+        response = self.view.delete(mock_request, id, mock_service)
+        self.assertEqual(response.status_code, 204)
+        self.assertIn("Task deleted", response.content.decode())
+
+    def test_view_delete_failure_returns_error_404(self):
+        """
+        Test handling NotFound exception when deleting via the view.
+
+        Returns
+        -------
+        None
+        """
+        id: str = str(uuid4())
+        body: Dict[str, Any] = {
+            "task_id": id
+        }
+        json_str = json.dumps(body)
+        mock_service = Mock(spec=IServiceDelete)
+        mock_service.delete.side_effect = NotFound("Task not found")
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.body = json_str
+        response = self.view.delete(mock_request, id, mock_service)
+        self.assertEqual(response.status_code, 404)
+        self.assertIn("Task not found", response.content.decode())
+
+    def test_view_delete_failure_returns_error_500(self):
+        """
+        Test handling any exceptions when deleting a task via the view.
+
+        Returns
+        -------
+        None
+        """
+        id: str = str(uuid4())
+        body: Dict[str, Any] = {
+            "task_id": id
+        }
+        json_str = json.dumps(body)
+        mock_service = Mock(spec=IServiceDelete)
+        mock_service.delete.side_effect = Exception("Unexpected error")
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.body = json_str
+        response = self.view.delete(mock_request, id, mock_service)
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("Internal Server Error", response.content.decode())
+
+
+    def test_view_get_revalidation_reads_version_only(self):
+        """
+        Test that a revalidated task is answered 304 from its version alone, without reading the task.
 
         Returns
         -------
         None
         """
-        self.assertEqual(repr(self.view), "<TaskView>")
+        id: str = str(uuid4())
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        mock_service = Mock(spec=TaskService)
+        mock_service.get_by_id.return_value = {'task_id': id, 'title': 'Task Y', 'version': 2}
+        mock_service.get_item_version.return_value = 2
+        etag: str = self.view.get(request, id=id, service=mock_service)['ETag']
+        request = HttpRequest()
+        request.method = 'GET'
+        request.META['HTTP_IF_NONE_MATCH'] = etag
+        response = self.view.get(request, id=id, service=mock_service)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(mock_service.get_by_id.call_count, 1)
+        mock_service.get_item_version.return_value = 3
+        mock_service.get_by_id.return_value = {'task_id': id, 'title': 'Task Y', 'version': 3}
+        self.assertEqual(self.view.get(request, id=id, service=mock_service).status_code, 200)
 
-    def test_view_isotodatetime_success_parses_iso_string(self):
+    def test_view_get_not_modified_returns_304(self):
         """
-        Test converting ISO 8601 string to datetime.
+        Test that a task is tagged with an ETag of its own, led by its version, and revalidates with it.
 
         Returns
         -------
         None
         """
-        iso = "2025-06-17T18:30:00.000Z"
-        dt = self.view.isotodatetime(iso)
-        self.assertIsInstance(dt, datetime)
-        self.assertEqual(dt.year, 2025)
-        self.assertEqual(dt.month, 6)
-        self.assertEqual(dt.day, 17)
-        self.assertEqual(dt.hour, 18)
-        self.assertEqual(dt.minute, 30)
-        self.assertEqual(dt.second, 0)
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        mock_service = Mock(spec=IServiceGetById)
+        mock_service.get_by_id.return_value = {'task_id': str(uuid4()), 'title': 'Task X', 'version': 3}
+        other = self.view.get(request, id=str(uuid4()), service=mock_service)
+        mock_service.get_by_id.return_value = {'task_id': str(uuid4()), 'title': 'Task Y', 'version': 3}
+        response = self.view.get(request, id=str(uuid4()), service=mock_service)
+        self.assertTrue(response['ETag'].startswith('"3-'))
+        self.assertNotEqual(response['ETag'], other['ETag'])
+        self.assertFalse(response.has_header('Last-Modified'))
+        request.META['HTTP_IF_NONE_MATCH'] = response['ETag']
+        response = self.view.get(request, id=str(uuid4()), service=mock_service)
+        self.assertEqual(response.status_code, 304)
+
+
+class BulkTaskViewTests(TestCase):
+    """
+    Unit tests for the BulkTaskView.
+    """
+    def setUp(self):
+        """
+        Set up a BulkTaskView instance for view tests.
 
-    def test_view_json_decode_success_parses_json(self):
+        Returns
+        -------
+        None
         """
-        Test decoding a JSON string to a dictionary with datetime fields.
+        self.view = BulkTaskView()
+
+    def test_view_bulk_create_success_returns_results(self):
+        """
+        Test that created tasks are returned as per-item results.
 
         Returns
         -------
         None
         """
-        body: Dict[str, Any] = {
-            "title": "Task Z",
-            "start_time": "2025-06-17T18:30:00.000Z",
-            "end_time": "2025-06-18T18:30:00.000Z",
-            "priority": "LOW",
-            "status": "TODO"
-        }
-        json_str = json.dumps(body)
-        result = self.view.json_decode(json_str)
-        self.assertEqual(result['title'], 'Task Z')
-        self.assertIsInstance(result['start_time'], datetime)
-        self.assertIsInstance(result['end_time'], datetime)
-        self.assertEqual(result['priority'], 'LOW')
-        self.assertEqual(result['status'], 'TODO')
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.body = json.dumps([{"title": "A"}, {"title": "B"}])
+        mock_service = Mock(spec=IServiceBulkCreate)
+        mock_service.bulk_create.return_value = [{"title": "A"}, {"title": "B"}]
+        response = self.view.post(mock_request, service=mock_service)
+        self.assertEqual(response.status_code, 201)
+        results = json.loads(response.content)["data"]
+        self.assertEqual([(result["index"], result["status"]) for result in results], [(0, 201), (1, 201)])
 
-    def test_view_get_by_id_success_returns_task(self):
+    def test_view_bulk_create_invalid_items_returns_error_400(self):
         """
-        Test retrieving a task by ID via the view.
+        Test that validation errors are returned per item with a 400.
+
+        Returns
+        -------
+        None
+        """
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.body = json.dumps([{"title": "A"}, {}])
+        mock_service = Mock(spec=IServiceBulkCreate)
+        mock_service.bulk_create.side_effect = InvalidItems("1 of 2 tasks are invalid", {1: {"title": ["Required."]}})
+        response = self.view.post(mock_request, service=mock_service)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.content)["data"], [{"index": 1, "status": 400, "errors": {"title": ["Required."]}}])
+
+    def test_view_bulk_create_not_an_array_returns_error_400(self):
+        """
+        Test that a body which is not a non-empty array is rejected before reaching the service.
+
+        Returns
+        -------
+        None
+        """
+        mock_service = Mock(spec=IServiceBulkCreate)
+        for body in ('{"title": "A"}', '[]', 'not json'):
+            mock_request = Mock(spec=HttpRequest)
+            mock_request.body = body
+            response = self.view.post(mock_request, service=mock_service)
+            self.assertEqual(response.status_code, 400)
+        mock_service.bulk_create.assert_not_called()
+
+
+class UpsertTasksViewTests(TestCase):
+    """
+    Unit tests for the UpsertTasksView.
+    """
+    def setUp(self):
+        """
+        Set up an UpsertTasksView instance for view tests.
+
+        Returns
+        -------
+        None
+        """
+        self.view = UpsertTasksView()
+
+    def test_view_bulk_upsert_success_returns_counts(self):
+        """
+        Test that the created and updated counts are returned.
+
+        Returns
+        -------
+        None
+        """
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.body = json.dumps([{"external_ref": "EXT-1", "title": "A"}])
+        mock_service = Mock(spec=IServiceBulkUpsert)
+        mock_service.bulk_upsert.return_value = {"created": 0, "updated": 1}
+        response = self.view.post(mock_request, service=mock_service)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)["data"], {"created": 0, "updated": 1})
+
+    def test_view_bulk_upsert_invalid_items_returns_error_400(self):
+        """
+        Test that validation errors are returned per item with a 400.
+
+        Returns
+        -------
+        None
+        """
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.body = json.dumps([{"title": "A"}])
+        mock_service = Mock(spec=IServiceBulkUpsert)
+        mock_service.bulk_upsert.side_effect = InvalidItems("1 of 1 tasks are invalid", {0: {"external_ref": ["Required."]}})
+        response = self.view.post(mock_request, service=mock_service)
+        self.assertEqual(response.status_code, 400)
+
+
+class BatchTaskViewTests(TestCase):
+    """
+    Unit tests for the BatchTaskView.
+    """
+    def setUp(self):
+        """
+        Set up a BatchTaskView instance for view tests.
+
+        Returns
+        -------
+        None
+        """
+        self.view = BatchTaskView()
+
+    def test_view_batch_success_returns_statuses(self):
+        """
+        Test that the per-operation statuses are returned with a 200.
+
+        Returns
+        -------
+        None
+        """
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.body = json.dumps([{"op": "delete", "task_id": str(uuid4())}])
+        mock_service = Mock(spec=IServiceBatch)
+        mock_service.batch.return_value = [{"index": 0, "task_id": "x", "status": 404}]
+        response = self.view.post(mock_request, service=mock_service)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)["data"][0]["status"], 404)
+
+    def test_view_batch_invalid_operations_returns_error_400(self):
+        """
+        Test that validation errors are returned per operation with a 400.
+
+        Returns
+        -------
+        None
+        """
+        mock_request = Mock(spec=HttpRequest)
+        mock_request.body = json.dumps([{"op": "archive"}])
+        mock_service = Mock(spec=IServiceBatch)
+        mock_service.batch.side_effect = InvalidItems("1 of 1 operations are invalid", {0: {"op": ["Invalid."]}})
+        response = self.view.post(mock_request, service=mock_service)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.content)["data"][0]["index"], 0)
+
+
+class TransitionTasksViewTests(TestCase):
+    """
+    Unit tests for the TransitionTasksView.
+    """
+    def setUp(self):
+        """
+        Set up a TransitionTasksView instance for view tests.
+
+        Returns
+        -------
+        None
+        """
+        self.view = TransitionTasksView()
+
+    def test_view_transition_success_returns_count(self):
+        """
+        Test that the filters and status are passed to the service and the count returned.
+
+        Returns
+        -------
+        None
+        """
+        request: HttpRequest = HttpRequest()
+        request.method = 'POST'
+        request.GET['status'] = 'DOING'
+        request._body = json.dumps({'status': 'DONE'}).encode()
+        mock_service = Mock(spec=IServiceTransition)
+        mock_service.transition.return_value = 12
+        response = self.view.post(request, service=mock_service)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['data'], {'updated': 12})
+        mock_service.transition.assert_called_once_with(TASK_MODEL, {'status': 'DOING'}, 'DONE')
+
+    def test_view_transition_without_filter_or_status_returns_error_400(self):
+        """
+        Test that a transition needs at least one filter and a valid status.
+
+        Returns
+        -------
+        None
+        """
+        mock_service = Mock(spec=IServiceTransition)
+        request: HttpRequest = HttpRequest()
+        request.method = 'POST'
+        request._body = json.dumps({'status': 'DONE'}).encode()
+        self.assertEqual(self.view.post(request, service=mock_service).status_code, 400)
+        request.GET['priority'] = 'LOW'
+        request._body = json.dumps({'status': 'LATER'}).encode()
+        self.assertEqual(self.view.post(request, service=mock_service).status_code, 400)
+        mock_service.transition.assert_not_called()
+
+
+class GetTasksViewTests(TestCase):
+    """
+    Unit tests for the GetTasksView.
+    """
+    def setUp(self):
+        """
+        Set up a GetTasksView instance and a mock request for view tests.
+
+        Returns
+        -------
+        None
+        """
+        self.view = GetTasksView()
+    
+    def test_view_representation_success(self):
+        """
+        Test the string representation of the GetTasksView.
+
+        Returns
+        -------
+        None
+        """
+        self.assertEqual(repr(self.view), "<GetTasksView>")
+
+    def test_view_get_all_success_returns_tasks(self):
+        """
+        Test retrieving all tasks.
 
         Returns
         -------
         None
         """
         id: str = str(uuid4())
-        task: Dict[str, Any] = {
-            'task_id': id,
-            'title': 'Task Y',
-            'start_time': None,
-            'end_time': None,
-            'priority': 'LOW',
-            'status': 'TODO'
-        }
+        tasks: List[Dict[str, Any]] = [
+            {
+                'task_id': id,
+                'title': 'Get All Tasks',
+                'start_time': None,
+                'end_time': None,
+                'priority': 'LOW',
+                'status': 'TODO'
+            }
+        ]
         request: HttpRequest = HttpRequest()
         request.method = 'GET'
-        mock_service = Mock(spec=IServiceGetById)
-        mock_service.get_by_id.return_value = task
-        response = self.view.get(request, id, mock_service)
+        request.GET['all'] = '1'
+        mock_service = Mock(spec=IServiceGetAll)
+        mock_service.get_all.return_value = tasks
+        response = self.view.get(request, service=mock_service)
         self.assertEqual(response.status_code, 200)
-        self.assertIn('Task Y', response.content.decode())
+        self.assertIn('Get All Tasks', response.content.decode())
 
-    def test_view_get_by_id_failure_returns_error_404(self):
+    @override_settings(TASKS_CACHE_ENABLED=True)
+    def test_view_get_all_not_modified_returns_304(self):
         """
-        Test handling NotFound exception when retrieving by ID via the view.
+        Test that a request carrying the current ETag gets a 304 without querying the tasks.
 
         Returns
         -------
@@ -452,15 +2372,47 @@ class TaskViewTests(TestCase):
         """
         request: HttpRequest = HttpRequest()
         request.method = 'GET'
-        mock_service = Mock(spec=IServiceGetById)
-        mock_service.get_by_id.side_effect = NotFound("Task not found")
-        response = self.view.get(request, 'non-existent-id', mock_service)
-        self.assertEqual(response.status_code, 404)
-        self.assertIn("Task not found", response.content.decode())
+        request.GET['all'] = '1'
+        mock_service = Mock(spec=TaskService)
+        mock_service.get_version.return_value = ('v1', datetime(2024, 1, 1, tzinfo=timezone.utc))
+        mock_service.get_all.return_value = []
+        response = self.view.get(request, service=mock_service)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Last-Modified'], 'Mon, 01 Jan 2024 00:00:00 GMT')
+        request.META['HTTP_IF_NONE_MATCH'] = response['ETag']
+        response = self.view.get(request, service=mock_service)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(mock_service.get_all.call_count, 1)
 
-    def test_view_get_by_id_failure_returns_error_500(self):
+    @skipUnless(msgpack, "msgpack is not installed")
+    @override_settings(TASKS_CACHE_ENABLED=True)
+    def test_view_get_all_streamed_etag_follows_sent_media_type(self):
         """
-        Test handling any exceptions when retrieving by ID via the view.
+        Test that a streamed list, always sent as JSON, gets the JSON ETag whatever the Accept header.
+
+        Returns
+        -------
+        None
+        """
+        mock_service = Mock(spec=TaskService)
+        mock_service.get_version.return_value = ('v1', datetime(2024, 1, 1, tzinfo=timezone.utc))
+        mock_service.iter_all.side_effect = lambda *args: iter([])
+        etags: Dict[str, str] = {}
+        for accept in ['application/json', 'application/msgpack']:
+            request: HttpRequest = HttpRequest()
+            request.method = 'GET'
+            request.GET = QueryDict('stream=1')
+            request.META['QUERY_STRING'] = 'stream=1'
+            request.META['HTTP_ACCEPT'] = accept
+            response = self.view.get(request, service=mock_service)
+            self.assertEqual(response['Content-Type'], 'application/json')
+            etags[accept] = response['ETag']
+        self.assertEqual(etags['application/msgpack'], etags['application/json'])
+
+    @override_settings(TASKS_CACHE_ENABLED=False)
+    def test_view_get_all_without_shared_cache_sends_no_etag(self):
+        """
+        Test that no validators are sent while the collection version is not shared.
 
         Returns
         -------
@@ -468,256 +2420,266 @@ class TaskViewTests(TestCase):
         """
         request: HttpRequest = HttpRequest()
         request.method = 'GET'
-        mock_service = Mock(spec=IServiceGetById)
-        mock_service.get_by_id.side_effect = Exception("Unexpected error")
-        response = self.view.get(request, 'non-existent-id', mock_service)
+        request.GET['all'] = '1'
+        mock_service = Mock(spec=TaskService)
+        mock_service.get_all.return_value = []
+        response = self.view.get(request, service=mock_service)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('ETag'))
+        mock_service.get_version.assert_not_called()
+
+    def test_view_get_all_failure_returns_error_500(self):
+        """
+        Test handling any exceptions when retrieving all tasks.
+
+        Returns
+        -------
+        None
+        """
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        request.GET['all'] = '1'
+        mock_service = Mock(spec=IServiceGetAll)
+        mock_service.get_all.side_effect = Exception("Unexpected error")
+        response = self.view.get(request, service=mock_service)
         self.assertEqual(response.status_code, 500)
         self.assertIn("Internal Server Error", response.content.decode())
 
-    def test_view_create_success_returns_created_task(self):
+    def test_view_get_stream_success_returns_streamed_tasks(self):
+        """
+        Test streaming all tasks in the JSON envelope.
+
+        Returns
+        -------
+        None
+        """
+        tasks: List[Dict[str, Any]] = [
+            {
+                'task_id': uuid4(),
+                'title': f'Streamed Task {t}',
+                'start_time': datetime.now(timezone.utc),
+                'end_time': None,
+                'priority': 'LOW',
+                'status': 'TODO'
+            }
+            for t in range(3)
+        ]
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        request.GET['stream'] = '1'
+        mock_service = Mock(spec=IServiceIterAll)
+        mock_service.iter_all.return_value = iter(tasks)
+        response = self.view.get(request, service=mock_service)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        content = json.loads(b"".join(response.streaming_content))
+        self.assertTrue(content['success'])
+        self.assertEqual([task['title'] for task in content['data']], [task['title'] for task in tasks])
+
+    def test_view_stream_json_chunks_form_one_document(self):
         """
-        Test successful creation of a task via the view.
+        Test that the streamed chunks join into a single JSON document whether the
+        number of tasks is a multiple of the chunk size or not.
 
         Returns
         -------
         None
         """
-        body: Dict[str, Any] = {
-            "title": "Task Z",
-            "start_time": None,
-            "end_time": None,
-            "priority": "LOW",
-            "status": "TODO"
-        }
-        json_str = json.dumps(body)
-        mock_service = Mock(spec=IServiceCreate)
-        mock_service.create.return_value = body
-        mock_request = Mock(spec=HttpRequest)
-        mock_request.body = json_str
-        response = self.view.post(mock_request, mock_service)
-        self.assertEqual(response.status_code, 201)
-        self.assertIn("Task Z", response.content.decode())
+        for count in (0, 1, 4, 5):
+            tasks = [{'task_id': uuid4(), 'title': f'Chunked Task {t}'} for t in range(count)]
+            chunks = list(self.view.stream_json(iter(tasks), 2))
+            content = json.loads(b"".join(chunks))
+            self.assertEqual([task['title'] for task in content['data']], [task['title'] for task in tasks])
 
-    def test_view_create_failure_returns_error_500(self):
+    def test_view_get_columnar_sends_rows_as_arrays(self):
         """
-        Test handling any exceptions when creating a task via the view.
+        Test that format=columnar sends a column header and one array per task, from a batch or dictionaries.
 
         Returns
         -------
         None
         """
-        body: Dict[str, Any] = {
-            "title": "Task Z",
-            "start_time": None,
-            "end_time": None,
-            "priority": "LOW",
-            "status": "TODO"
-        }
-        json_str = json.dumps(body)
-        mock_service = Mock(spec=IServiceCreate)
-        mock_service.create.side_effect = Exception("Unexpected error")
-        mock_request = Mock(spec=HttpRequest)
-        mock_request.body = json_str
-        response = self.view.post(mock_request, mock_service)
-        self.assertEqual(response.status_code, 500)
-        self.assertIn("Internal Server Error", response.content.decode())
+        task_id = uuid4()
+        for tasks in (TaskBatch(('task_id', 'title'), [(task_id, 'Columnar Task')]), [{'task_id': task_id, 'title': 'Columnar Task'}]):
+            request: HttpRequest = HttpRequest()
+            request.method = 'GET'
+            request.GET['all'] = '1'
+            request.GET['format'] = 'columnar'
+            request.GET['fields'] = 'title'
+            mock_service = Mock(spec=IServiceGetAll)
+            mock_service.get_all.return_value = tasks
+            response = self.view.get(request, service=mock_service)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(json.loads(response.content)['data'], {'columns': ['task_id', 'title'], 'rows': [[str(task_id), 'Columnar Task']]})
 
-    def test_view_update_success_returns_updated_task(self):
+    def test_view_get_columnar_stream(self):
         """
-        Test successful update of a task via the view.
+        Test that a columnar stream joins into the same document as the columnar list.
 
         Returns
         -------
         None
         """
-        id: str = str(uuid4())
-        body: Dict[str, Any] = {
-            "task_id": id,
-            "title": "Task U",
-            "start_time": None,
-            "end_time": None,
-            "priority": "LOW",
-            "status": "TODO"
-        }
-        json_str = json.dumps(body)
-        mock_service = Mock(spec=IServiceUpdate)
-        mock_service.update.return_value = body
-        mock_request = Mock(spec=HttpRequest)
-        mock_request.body = json_str
-        response = self.view.put(mock_request, id, mock_service)
-        self.assertEqual(response.status_code, 200)
-        self.assertIn('Task U', response.content.decode())
+        tasks = [{'task_id': uuid4(), 'title': f'Chunked Task {t}'} for t in range(5)]
+        content = json.loads(b"".join(self.view.stream_json(iter(tasks), 2, ['task_id', 'title'])))
+        self.assertEqual(content['data']['columns'], ['task_id', 'title'])
+        self.assertEqual([row[1] for row in content['data']['rows']], [task['title'] for task in tasks])
 
-    def test_view_update_failure_returns_error_404(self):
+    def test_view_get_invalid_format(self):
         """
-        Test handling NotFound exception when updating via the view.
+        Test that an unknown format is rejected.
 
         Returns
         -------
         None
         """
-        id: str = str(uuid4())
-        body: Dict[str, Any] = {
-            "task_id": id,
-            "title": "Task Z",
-            "start_time": None,
-            "end_time": None,
-            "priority": "LOW",
-            "status": "TODO"
-        }
-        json_str = json.dumps(body)
-        mock_service = Mock(spec=IServiceUpdate)
-        mock_service.update.side_effect = NotFound("Task not found")
-        mock_request = Mock(spec=HttpRequest)
-        mock_request.body = json_str
-        response = self.view.put(mock_request, id, mock_service)
-        self.assertEqual(response.status_code, 404)
-        self.assertIn("Task not found", response.content.decode())
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        request.GET['format'] = 'csv'
+        response = self.view.get(request, service=Mock(spec=IServiceGetAll))
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Invalid format parameter", response.content.decode())
 
-    def test_view_update_failure_returns_error_500(self):
+    def test_view_get_page_success_returns_tasks_and_cursor(self):
         """
-        Test handling any exceptions when updating a task via the view.
+        Test retrieving a page of tasks with a capped limit.
 
         Returns
         -------
         None
         """
-        id: str = str(uuid4())
-        body: Dict[str, Any] = {
-            "task_id": id,
-            "title": "Task U",
-            "start_time": None,
-            "end_time": None,
-            "priority": "LOW",
-            "status": "TODO"
-        }
-        json_str = json.dumps(body)
-        mock_service = Mock(spec=IServiceUpdate)
-        mock_service.update.side_effect = Exception("Unexpected error")
-        mock_request = Mock(spec=HttpRequest)
-        mock_request.body = json_str
-        response = self.view.put(mock_request, id, mock_service)
-        self.assertEqual(response.status_code, 500)
-        self.assertIn("Internal Server Error", response.content.decode())
+        tasks: List[Dict[str, Any]] = [
+            {
+                'task_id': str(uuid4()),
+                'title': 'Paged Task',
+                'start_time': None,
+                'end_time': None,
+                'priority': 'LOW',
+                'status': 'TODO'
+            }
+        ]
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        request.GET['limit'] = '100000'
+        mock_service = Mock(spec=IServiceGetPage)
+        mock_service.get_page.return_value = {"items": tasks, "next": "next-cursor"}
+        response = self.view.get(request, service=mock_service)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['next'], 'next-cursor')
+        mock_service.get_page.assert_called_once()
+        self.assertEqual(mock_service.get_page.call_args.args[1], 500)
 
-    def test_view_delete_success_returns_success(self):
+    @override_settings(TASKS_PAGE_SIZE=20)
+    def test_view_get_pages_by_default(self):
         """
-        Test successful deletion of a task via the view.
+        Test that a list without limit, cursor or all=1 is the first page of TASKS_PAGE_SIZE tasks.
 
         Returns
         -------
         None
         """
-        id: str = str(uuid4())
-        body: Dict[str, Any] = {
-            "task_id": id
-        }
-        json_str = json.dumps(body)
-        mock_service = Mock(spec=IServiceDelete)
-        mock_service.delete.return_value = True
-        mock_request = Mock(spec=HttpRequest)
-        mock_request.body = json_str
-        response = self.view.delete(mock_request, id, mock_service)
-        self.assertEqual(response.status_code, 204)
-        self.assertIn("Task deleted", response.content.decode())
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        mock_service = Mock(spec=TaskService)
+        mock_service.get_page.return_value = {"items": [], "next": None}
+        response = self.view.get(request, service=mock_service)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), {"success": True, "data": [], "next": None})
+        self.assertEqual(mock_service.get_page.call_args.args[1:3], (20, None))
+        mock_service.get_all.assert_not_called()
 
-    def test_view_delete_failure_returns_error_404(self):
+    def test_view_get_search_with_cursor_returns_error_400(self):
         """
-        Test handling NotFound exception when deleting via the view.
+        Test that a search combined with a cursor is rejected rather than the cursor ignored.
 
         Returns
         -------
         None
         """
-        id: str = str(uuid4())
-        body: Dict[str, Any] = {
-            "task_id": id
-        }
-        json_str = json.dumps(body)
-        mock_service = Mock(spec=IServiceDelete)
-        mock_service.delete.side_effect = NotFound("Task not found")
-        mock_request = Mock(spec=HttpRequest)
-        mock_request.body = json_str
-        response = self.view.delete(mock_request, id, mock_service)
-        self.assertEqual(response.status_code, 404)
-        self.assertIn("Task not found", response.content.decode())
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        request.GET['search'] = 'Paged'
+        request.GET['cursor'] = 'next-cursor'
+        mock_service = Mock(spec=TaskService)
+        response = self.view.get(request, service=mock_service)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("cannot be paged with a cursor", response.content.decode())
+        mock_service.get_by_params.assert_not_called()
 
-    def test_view_delete_failure_returns_error_500(self):
+    def test_view_get_page_failure_returns_error_400(self):
         """
-        Test handling any exceptions when deleting a task via the view.
+        Test retrieving a page of tasks with an invalid limit.
 
         Returns
         -------
         None
         """
-        id: str = str(uuid4())
-        body: Dict[str, Any] = {
-            "task_id": id
-        }
-        json_str = json.dumps(body)
-        mock_service = Mock(spec=IServiceDelete)
-        mock_service.delete.side_effect = Exception("Unexpected error")
-        mock_request = Mock(spec=HttpRequest)
-        mock_request.body = json_str
-        response = self.view.delete(mock_request, id, mock_service)
-        self.assertEqual(response.status_code, 500)
-        self.assertIn("Internal Server Error", response.content.decode())
-
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        request.GET['limit'] = '0'
+        mock_service = Mock(spec=IServiceGetPage)
+        response = self.view.get(request, service=mock_service)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Invalid limit parameter", response.content.decode())
 
-class GetTasksViewTests(TestCase):
-    """
-    Unit tests for the GetTasksView.
-    """
-    def setUp(self):
+    def test_view_get_filters_success_passes_filters(self):
         """
-        Set up a GetTasksView instance and a mock request for view tests.
+        Test that the structured filters are validated and passed to the service.
 
         Returns
         -------
         None
         """
-        self.view = GetTasksView()
-    
-    def test_view_representation_success(self):
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        request.GET['all'] = '1'
+        request.GET['status'] = 'DOING'
+        request.GET['start_after'] = '2025-06-17T18:30:00Z'
+        mock_service = Mock(spec=IServiceGetAll)
+        mock_service.get_all.return_value = []
+        response = self.view.get(request, service=mock_service)
+        self.assertEqual(response.status_code, 200)
+        filters = mock_service.get_all.call_args.args[1]
+        self.assertEqual(filters['status'], 'DOING')
+        self.assertEqual(filters['start_after'], datetime(2025, 6, 17, 18, 30, tzinfo=timezone.utc))
+
+    def test_view_get_filters_failure_returns_error_400(self):
         """
-        Test the string representation of the GetTasksView.
+        Test that invalid structured filters are rejected.
 
         Returns
         -------
         None
         """
-        self.assertEqual(repr(self.view), "<GetTasksView>")
+        for name, value in [('status', 'SLEEPING'), ('priority', 'urgent'), ('end_before', 'tomorrow')]:
+            request: HttpRequest = HttpRequest()
+            request.method = 'GET'
+            request.GET[name] = value
+            response = self.view.get(request, service=Mock(spec=IServiceGetAll))
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("Invalid filter parameters", response.content.decode())
 
-    def test_view_get_all_success_returns_tasks(self):
+    def test_view_get_fields_success_passes_projection(self):
         """
-        Test retrieving all tasks.
+        Test that the fields parameter is validated and passed to the service.
 
         Returns
         -------
         None
         """
-        id: str = str(uuid4())
-        tasks: List[Dict[str, Any]] = [
-            {
-                'task_id': id,
-                'title': 'Get All Tasks',
-                'start_time': None,
-                'end_time': None,
-                'priority': 'LOW',
-                'status': 'TODO'
-            }
-        ]
         request: HttpRequest = HttpRequest()
         request.method = 'GET'
+        request.GET['all'] = '1'
+        request.GET['fields'] = 'title,description'
         mock_service = Mock(spec=IServiceGetAll)
-        mock_service.get_all.return_value = tasks
+        mock_service.get_all.return_value = []
         response = self.view.get(request, service=mock_service)
         self.assertEqual(response.status_code, 200)
-        self.assertIn('Get All Tasks', response.content.decode())
+        self.assertEqual(mock_service.get_all.call_args.args[2], ['task_id', 'title', 'description'])
 
-    def test_view_get_all_failure_returns_error_500(self):
+    def test_view_get_fields_failure_returns_error_400(self):
         """
-        Test handling any exceptions when retrieving all tasks.
+        Test that unknown fields are rejected.
 
         Returns
         -------
@@ -725,11 +2687,10 @@ class GetTasksViewTests(TestCase):
         """
         request: HttpRequest = HttpRequest()
         request.method = 'GET'
-        mock_service = Mock(spec=IServiceGetAll)
-        mock_service.get_all.side_effect = Exception("Unexpected error")
-        response = self.view.get(request, service=mock_service)
-        self.assertEqual(response.status_code, 500)
-        self.assertIn("Internal Server Error", response.content.decode())
+        request.GET['fields'] = 'title,secret'
+        response = self.view.get(request, service=Mock(spec=IServiceGetAll))
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Invalid fields parameter", response.content.decode())
 
     def test_view_get_search_success_returns_tasks(self):
         """
@@ -791,3 +2752,80 @@ class GetTasksViewTests(TestCase):
         response = self.view.get(request, service=mock_service)
         self.assertEqual(response.status_code, 500)
         self.assertIn("Internal Server Error", response.content.decode())
+
+
+class TaskMetaViewTests(TestCase):
+    """
+    Unit tests for the TaskMetaView.
+    """
+    def setUp(self):
+        """
+        Set up a TaskMetaView instance and a mock service for view tests.
+
+        Returns
+        -------
+        None
+        """
+        self.view = TaskMetaView()
+        self.service = Mock(spec=IServiceGetMeta)
+        self.service.get_meta.return_value = {
+            "version": "abc123",
+            "priority_choices": Task.PRIORITY_CHOICES,
+            "status_choices": Task.STATUS_CHOICES
+        }
+
+    def test_view_representation_success(self):
+        """
+        Test the string representation of the TaskMetaView.
+
+        Returns
+        -------
+        None
+        """
+        self.assertEqual(repr(self.view), "<TaskMetaView>")
+
+    def test_view_get_meta_success_returns_cacheable_meta(self):
+        """
+        Test retrieving the metadata with its validators and caching headers.
+
+        Returns
+        -------
+        None
+        """
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        response = self.view.get(request, self.service)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['ETag'], '"abc123"')
+        self.assertIn('max-age=86400', response['Cache-Control'])
+        self.assertIn('DOING', response.content.decode())
+
+    def test_view_get_meta_not_modified_returns_304(self):
+        """
+        Test that a matching If-None-Match returns 304 without a body.
+
+        Returns
+        -------
+        None
+        """
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        request.META['HTTP_IF_NONE_MATCH'] = '"abc123"'
+        response = self.view.get(request, self.service)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_view_get_meta_failure_returns_error_500(self):
+        """
+        Test handling any exceptions when retrieving the metadata.
+
+        Returns
+        -------
+        None
+        """
+        request: HttpRequest = HttpRequest()
+        request.method = 'GET'
+        self.service.get_meta.side_effect = Exception("Unexpected error")
+        response = self.view.get(request, self.service)
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("Internal Server Error", response.content.decode())
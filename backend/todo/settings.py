@@ -11,7 +11,9 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
 from pathlib import Path
+from django.core.exceptions import ImproperlyConfigured
 import os
+import warnings
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -44,6 +46,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "tasks.compression.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -72,6 +75,8 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "todo.wsgi.application"
 
+ASGI_APPLICATION = "todo.asgi.application"
+
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
@@ -84,6 +89,23 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# The "tasks" cache holds the task read cache and the collection version; point it at a
+# shared backend (e.g. django.core.cache.backends.redis.RedisCache) when running several
+# processes, since a per-process LocMemCache never sees the writes made by the others.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "tasks": {
+        "BACKEND": os.getenv("BACKEND_TASKS_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("BACKEND_TASKS_CACHE_LOCATION", "tasks"),
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -124,3 +146,121 @@ STATIC_URL = "static/"
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+# Tasks API
+# Default and hard maximum number of tasks returned in one page of /tasks/
+
+TASKS_PAGE_SIZE = int(os.getenv("BACKEND_TASKS_PAGE_SIZE", "50"))
+
+TASKS_MAX_PAGE_SIZE = int(os.getenv("BACKEND_TASKS_MAX_PAGE_SIZE", "500"))
+
+# Number of rows fetched and encoded at a time when streaming /tasks/?stream=1, and
+# number of rows of a task list turned into objects at a time when it is encoded
+
+TASKS_STREAM_CHUNK_SIZE = int(os.getenv("BACKEND_TASKS_STREAM_CHUNK_SIZE", "2000"))
+
+# Maximum number of results returned by /tasks/?search= when no limit is given,
+# and an optional dotted path overriding the search backend picked for the database
+
+TASKS_SEARCH_LIMIT = int(os.getenv("BACKEND_TASKS_SEARCH_LIMIT", "100"))
+
+TASKS_SEARCH_BACKEND = os.getenv("BACKEND_TASKS_SEARCH_BACKEND") or None
+
+# Task metadata (priority and status choices) is served once by /tasks/meta and cached
+# by clients; set BACKEND_TASKS_EMBED_CHOICES=1 to also embed it in every task payload
+
+TASKS_META_MAX_AGE = int(os.getenv("BACKEND_TASKS_META_MAX_AGE", "86400"))
+
+TASKS_EMBED_CHOICES = os.getenv("BACKEND_TASKS_EMBED_CHOICES") == "1"
+
+# Read cache around TaskService and ETags of the task list, both keyed on the collection
+# version invalidated on every write; timeout in seconds. They are on by default only with
+# a shared tasks cache: BACKEND_TASKS_CACHE=1 forces them on over LocMemCache, which is
+# refused with several workers (replicas must use a shared cache to enable them at all)
+
+TASKS_CACHE_SHARED = CACHES["tasks"]["BACKEND"] != "django.core.cache.backends.locmem.LocMemCache"
+
+TASKS_CACHE_ENABLED = os.getenv("BACKEND_TASKS_CACHE", "1" if TASKS_CACHE_SHARED else "0") == "1"
+
+if TASKS_CACHE_ENABLED and not TASKS_CACHE_SHARED and int(os.getenv("BACKEND_WORKERS", "1")) > 1:
+    raise ImproperlyConfigured("BACKEND_TASKS_CACHE=1 needs a shared BACKEND_TASKS_CACHE_BACKEND with several workers")
+
+TASKS_CACHE_ALIAS = "tasks"
+
+TASKS_CACHE_TIMEOUT = int(os.getenv("BACKEND_TASKS_CACHE_TIMEOUT", "300"))
+
+# Largest array accepted by /tasks/bulk, /tasks/upsert and /tasks/batch, and number of rows inserted per statement
+
+TASKS_BULK_MAX_ITEMS = int(os.getenv("BACKEND_TASKS_BULK_MAX_ITEMS", "10000"))
+
+TASKS_BULK_BATCH_SIZE = int(os.getenv("BACKEND_TASKS_BULK_BATCH_SIZE", "500"))
+
+# Seconds during which a POST /tasks/create sent with an Idempotency-Key header is replayed
+# instead of repeated; expired keys are deleted by `manage.py purge_idempotency_keys`. A key
+# whose request is still in progress after the lock timeout (e.g. its worker was killed) is
+# released to the next retry instead of answering 409 until it expires
+
+TASKS_IDEMPOTENCY_TTL = int(os.getenv("BACKEND_TASKS_IDEMPOTENCY_TTL", "86400"))
+
+TASKS_IDEMPOTENCY_LOCK_TIMEOUT = int(os.getenv("BACKEND_TASKS_IDEMPOTENCY_LOCK_TIMEOUT", "60"))
+
+# Opt-in group commit of task creation: creates arriving within the window (in milliseconds)
+# are inserted together, up to the maximum batch size; tune with the /tasks/stats latencies.
+# Batches only form from requests served concurrently by one process, so it needs the uvicorn
+# (BACKEND_ASGI=1) or threaded (BACKEND_THREADS > 1) workers of gunicorn.conf.py; with sync
+# workers it would only delay every create by the window, and is disabled with a warning.
+# A create waiting on a batch fails after the timeout (in seconds) if the batch never commits
+
+TASKS_WRITE_BUFFER = os.getenv("BACKEND_TASKS_WRITE_BUFFER") == "1"
+
+if TASKS_WRITE_BUFFER and os.getenv("BACKEND_ASGI") != "1" and int(os.getenv("BACKEND_THREADS", "1")) < 2:
+    warnings.warn("BACKEND_TASKS_WRITE_BUFFER=1 needs BACKEND_ASGI=1 or BACKEND_THREADS > 1; the write buffer is disabled")
+    TASKS_WRITE_BUFFER = False
+
+TASKS_WRITE_BUFFER_WINDOW_MS = float(os.getenv("BACKEND_TASKS_WRITE_BUFFER_WINDOW_MS", "5"))
+
+TASKS_WRITE_BUFFER_MAX_BATCH = int(os.getenv("BACKEND_TASKS_WRITE_BUFFER_MAX_BATCH", "100"))
+
+TASKS_WRITE_BUFFER_TIMEOUT = float(os.getenv("BACKEND_TASKS_WRITE_BUFFER_TIMEOUT", "10"))
+
+# Encoder of the task payloads: orjson when it is installed ("auto"), or the standard
+# library with DjangoJSONEncoder ("stdlib")
+
+TASKS_JSON_ENCODER = os.getenv("BACKEND_TASKS_JSON_ENCODER", "auto")
+
+# Renderers of the task payloads, by order of preference: clients pick one with their
+# Accept header (e.g. Accept: application/msgpack) and get the first one otherwise
+
+TASKS_RENDERERS = [
+    "tasks.renderers.JSONRenderer",
+    "tasks.renderers.MessagePackRenderer",
+]
+
+# Compression of response bodies by tasks.compression.CompressionMiddleware: codings by order of
+# preference (br and zstd need the brotli and zstandard packages), their levels, the media types
+# compressed (API payloads only: HTML pages carrying a CSRF token must stay uncompressed against
+# BREACH), the smallest body worth compressing in bytes, whether streamed bodies are compressed
+# chunk by chunk, and whether compressed bodies sent with an ETag are kept in the tasks cache
+
+TASKS_COMPRESSORS = [
+    "tasks.compression.ZstdCompressor",
+    "tasks.compression.BrotliCompressor",
+    "tasks.compression.GzipCompressor",
+]
+
+TASKS_COMPRESSION_LEVELS = {"gzip": 6, "br": 5, "zstd": 3}
+
+TASKS_COMPRESSION_MEDIA_TYPES = ["application/json", "application/msgpack"]
+
+TASKS_COMPRESSION_MIN_SIZE = int(os.getenv("BACKEND_TASKS_COMPRESSION_MIN_SIZE", "1024"))
+
+TASKS_COMPRESSION_STREAMING = os.getenv("BACKEND_TASKS_COMPRESSION_STREAMING", "1") == "1"
+
+TASKS_COMPRESSION_CACHE = os.getenv("BACKEND_TASKS_COMPRESSION_CACHE", "1") == "1"
+
+# Serve /tasks/ and /tasks/<id> with the asynchronous views, which await the async ORM instead of
+# holding a thread for the whole request; on with BACKEND_ASGI=1, which also makes gunicorn.conf.py
+# run todo.asgi in uvicorn workers
+
+TASKS_ASYNC_VIEWS = os.getenv("BACKEND_ASGI") == "1"
@@ -31,7 +31,7 @@ export class TaskService implements ICreate<Task>, IGetAll<Task>, IGetById<Task>
 
   async getAll(): Promise<Task[]> {
     try {
-      const response = await fetch(this.baseUrl);
+      const response = await fetch(`${this.baseUrl}?all=1`);
       const data = await response.json();
       if (!response.ok) {
         if (process.env.NODE_ENV !== 'production') {